@@ -0,0 +1 @@
+"""Benchmarks for napalm-dellos6, run with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,122 @@
+"""
+Parse a synthetic 30k-entry ARP table of an L3 core: the ARP age conversion
+against the former split-based one, the TextFSM getter against the streaming
+dellos6_neighbors.ARPTableParser, then fetch the ARP tables of four VRFs one after
+the other and concurrently (``optional_args={"parallel_commands": True}``).
+
+Run with ``python -m benchmarks.bench_arp_table``.
+"""
+import re
+
+from benchmarks.common import BenchDevice, bench_driver, report, timed
+from napalm_dellos6.dellos6_neighbors import ARPTableParser
+from napalm_dellos6.dellos6_parser import HOUR_SECONDS, DellOS6Parser, parse_arp_age
+
+ENTRIES = 30000
+VRFS = ["", "blue", "green", "red"]
+LATENCY = 0.05
+LINE_LATENCY = 0.00002
+
+HEADER = """
+Age Time (seconds)............................. 1200
+Response Time (seconds)........................ 1
+Retries........................................ 4
+Cache Size..................................... 32768
+Dynamic Renew Mode ............................ Enable
+Total Entry Count Current / Peak .............. {0} / {0}
+Static Entry Count Configured / Active / Max .. 0 / 0 / 128
+
+IP Address       MAC Address        Interface       Type      Age
+---------------  -----------------  --------------  --------  -----------
+"""
+SHOW_IP_VRF = """
+Number of VRFs.................... 3
+
+Name                 Identifier
+-------------------- ---------------
+blue                 1
+green                2
+red                  3
+"""
+
+
+def legacy_parse_arp_age(arp_age_str):
+    """parse_arp_age() as it was, splitting the string and searching each unit."""
+    (hours, minutes, seconds) = (0, 0, 0)
+    for element in re.split(" ", arp_age_str.strip()):
+        if re.search("h", element):
+            hours = int(element.strip("h"))
+        elif re.search("m", element):
+            minutes = int(element.strip("m"))
+        elif re.search("s", element):
+            seconds = int(element.strip("s"))
+    return (hours * HOUR_SECONDS) + (minutes * 60) + seconds
+
+
+def show_arp(entries):
+    rows = [HEADER.format(entries)]
+    for n in range(entries):
+        rows.append(
+            "{:<17}{:<19}{:<16}{:<10}{:>11}\n".format(
+                "10.{}.{}.{}".format(n >> 16, (n >> 8) & 0xFF, n & 0xFF),
+                "0050.56{:02X}.{:02X}{:02X}".format(n >> 16, (n >> 8) & 0xFF, n & 0xFF),
+                "Vl{}".format(n % 200 + 1),
+                "Dynamic",
+                "0h {:>2}m {:>2}s".format(n % 20, n % 60),
+            )
+        )
+    return "".join(rows)
+
+
+def main():
+    output = show_arp(ENTRIES)
+    ages = ["0h {:>2}m {:>2}s".format(n % 20, n % 60) for n in range(ENTRIES)]
+    rows = []
+    for label, func in (
+        ("split per unit", legacy_parse_arp_age),
+        ("single regex", parse_arp_age),
+    ):
+        seconds, _ = timed(lambda: [func(age) for age in ages])
+        rows.append([label, "{:.1f}".format(seconds * 1000)])
+    report("Converting {} ARP ages".format(ENTRIES), ["age parsing", "ms"], rows)
+
+    rows = []
+    seconds, expected = timed(DellOS6Parser().get_arp_table, {"show arp": output})
+    rows.append(["TextFSM getter", "{:.2f}".format(seconds)])
+    seconds, result = timed(lambda: list(ARPTableParser().parse(output.splitlines())))
+    assert result == expected
+    rows.append(["ARPTableParser", "{:.2f}".format(seconds)])
+    report("Parsing a {} entry ARP table".format(ENTRIES), ["parser", "seconds"], rows)
+
+    outputs = {"show ip vrf": SHOW_IP_VRF}
+    for vrf in VRFS:
+        outputs[DellOS6Parser.arp_command(vrf)] = show_arp(ENTRIES // len(VRFS))
+    rows = []
+    for label, optional_args in (
+        ("one after the other", {}),
+        ("concurrently", {"parallel_commands": True}),
+    ):
+        driver = bench_driver(
+            outputs=outputs,
+            latency=LATENCY,
+            line_latency=LINE_LATENCY,
+            optional_args=optional_args,
+        )
+        driver._open_session = lambda: BenchDevice(
+            outputs=outputs, latency=LATENCY, line_latency=LINE_LATENCY
+        )
+        seconds, result = timed(driver.get_arp_table)
+        assert len(result) == ENTRIES
+        rows.append([label, "{:.2f}".format(seconds)])
+        driver._get_session_pool().close()
+    report(
+        "get_arp_table() of {} VRFs of {} entries, {:.0f}ms round trip".format(
+            len(VRFS), ENTRIES // len(VRFS), LATENCY * 1000
+        ),
+        ["VRFs fetched", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Compare config-derived getters served by per-getter commands against a single
+cached running-config (``optional_args={"config_cache": True}``).
+
+Run with ``python -m benchmarks.bench_config_tree``.
+"""
+from benchmarks.common import bench_driver, report, timed
+
+GETTERS = ["get_users", "get_ntp_servers", "get_snmp_information", "get_config"]
+TEST_DIRS = ["test_get_config", "test_get_users", "test_get_snmp_information"]
+LATENCY = 0.05
+
+
+def poll(driver):
+    for getter in GETTERS:
+        getattr(driver, getter)()
+
+
+def main():
+    rows = []
+    for label, optional_args in (
+        ("per-getter commands", {}),
+        ("cached running-config", {"config_cache": True}),
+    ):
+        driver = bench_driver(TEST_DIRS, LATENCY, optional_args=optional_args)
+        seconds, _ = timed(poll, driver)
+        rows.append([label, len(driver.device.commands), "{:.3f}".format(seconds)])
+    report(
+        "{} with {:.0f}ms simulated round trip".format(
+            ", ".join(GETTERS), LATENCY * 1000
+        ),
+        ["mode", "commands", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measure the import cost of the package and its modules with ``python -X importtime``,
+in fresh interpreters, keeping the best of several runs.
+
+Run with ``python -m benchmarks.bench_import_time [--history FILE]``. With
+``--history``, the results are appended to FILE as a JSON line tagged with the
+``git describe`` of the tree, so the cost can be tracked over releases.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from benchmarks.common import report
+
+RUNS = 5
+MODULES = [
+    "napalm_dellos6",
+    "napalm_dellos6.dellos6_bgp",
+    "napalm_dellos6.dellos6_stack",
+    "napalm_dellos6.dellos6_routes",
+    "napalm_dellos6.dellos6",
+]
+IMPORTTIME_REGEX = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def import_cost(module):
+    """
+    Return the cumulative import time of module in microseconds and the number of
+    modules imported in total, including those of the interpreter startup.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+    total = 0
+    loaded = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_REGEX.match(line)
+        if match is None:
+            continue
+        loaded += 1
+        if match.group(4) == module and len(match.group(3)) == 1:
+            total = int(match.group(2))
+    return total, loaded
+
+
+def describe():
+    try:
+        return subprocess.check_output(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=ROOT,
+            universal_newlines=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    history = None
+    if "--history" in sys.argv:
+        history = sys.argv[sys.argv.index("--history") + 1]
+
+    startup = import_cost("sys")[1]
+    results = {}
+    rows = []
+    for module in MODULES:
+        costs = [import_cost(module) for _ in range(RUNS)]
+        micros = min(cost[0] for cost in costs)
+        loaded = costs[0][1] - startup
+        results[module] = {"ms": round(micros / 1000.0, 1), "modules": loaded}
+        rows.append([module, "{:.1f}".format(micros / 1000.0), loaded])
+
+    report(
+        "Import cost, best of {} runs".format(RUNS),
+        ["module", "ms", "modules loaded"],
+        rows,
+    )
+    if history:
+        record = {"version": describe(), "time": int(time.time()), "imports": results}
+        with open(history, "a") as f:
+            f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+if __name__ == "__main__":
+    main()
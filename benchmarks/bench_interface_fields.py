@@ -0,0 +1,49 @@
+"""
+Compare _get_interfaces() for different ``fields`` selections: commands sent, output
+bytes read and time with a simulated round trip.
+
+Run with ``python -m benchmarks.bench_interface_fields``.
+"""
+from benchmarks.common import bench_driver, report, timed
+
+FIELD_SETS = [
+    None,
+    ["is_up"],
+    ["is_up", "is_enabled"],
+    ["description"],
+    ["speed", "mtu"],
+    ["mac_address"],
+]
+TEST_DIRS = ["test_get_interfaces"]
+LATENCY = 0.05
+
+
+def main():
+    rows = []
+    for fields in FIELD_SETS:
+        driver = bench_driver(TEST_DIRS, LATENCY)
+        seconds, _ = timed(driver._get_interfaces, fields=fields)
+        commands = list(driver.device.commands)
+        driver.device.latency = 0
+        output_bytes = sum(
+            len(driver.device.send_command(command)) for command in commands
+        )
+        rows.append(
+            [
+                "all" if fields is None else ",".join(fields),
+                len(commands),
+                output_bytes,
+                "{:.3f}".format(seconds),
+            ]
+        )
+    report(
+        "_get_interfaces(fields=...) with {:.0f}ms simulated round trip".format(
+            LATENCY * 1000
+        ),
+        ["fields", "commands", "bytes", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
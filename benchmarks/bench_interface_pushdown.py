@@ -0,0 +1,78 @@
+"""
+Find the crossover between per-interface and bulk commands for
+_get_interfaces_counters(interfaces=[...]) on a synthetic 12-unit stack.
+
+Each command costs a round trip plus a transfer time per output line, so per-port
+commands win for a few ports and the bulk commands win for many. The crossover is
+what D6C.DELLOS6_PUSHDOWN_THRESHOLD is set from.
+
+Run with ``python -m benchmarks.bench_interface_pushdown``.
+"""
+from benchmarks.common import (
+    bench_driver,
+    port_output,
+    read_mocked,
+    report,
+    stack_output,
+    timed,
+)
+
+UNITS = 12
+COMMANDS = ["show interfaces counters", "show interfaces counters errors"]
+LATENCY = 0.05
+LINE_LATENCY = 0.0005
+SIZES = [1, 2, 4, 8, 12, 16, 24, 32]
+
+
+def stack_outputs(ports):
+    outputs = {}
+    for command in COMMANDS:
+        output = stack_output(
+            read_mocked("test_get_interfaces_counters", command), UNITS
+        )
+        outputs[command] = output
+        for port in ports:
+            outputs["{} {}".format(command, port)] = port_output(output, port)
+    return outputs
+
+
+def main():
+    ports = [
+        "Te{}/0/{}".format(unit, port)
+        for port in (1, 2, 3)
+        for unit in range(1, UNITS + 1)
+    ]
+    outputs = stack_outputs(ports)
+    rows = []
+    crossover = None
+    for size in SIZES:
+        interfaces = ports[:size]
+        timings = []
+        results = []
+        for threshold in (len(SIZES) * 100, 0):
+            driver = bench_driver(
+                outputs=outputs,
+                latency=LATENCY,
+                line_latency=LINE_LATENCY,
+                optional_args={"pushdown_threshold": threshold},
+            )
+            seconds, result = timed(
+                driver._get_interfaces_counters, interfaces=interfaces
+            )
+            timings.append(seconds)
+            results.append(result)
+        assert results[0] == results[1]
+        if crossover is None and timings[0] > timings[1]:
+            crossover = size
+        rows.append([size, "{:.3f}".format(timings[0]), "{:.3f}".format(timings[1])])
+    report(
+        "_get_interfaces_counters(interfaces=...) on {} units, {:.0f}ms round trip, "
+        "{:.1f}ms per line".format(UNITS, LATENCY * 1000, LINE_LATENCY * 1000),
+        ["ports", "per-port s", "bulk s"],
+        rows,
+    )
+    print("per-port commands are slower from {} ports".format(crossover))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Poll get_lldp_neighbors_detail() of a synthetic access stack with a neighbor on
+every port, where a neighbor is learned again on some polls, with and without the
+LLDP statistics probe (``optional_args={"lldp_probe": True}``).
+
+Run with ``python -m benchmarks.bench_lldp_probe``.
+"""
+import random
+
+from benchmarks.common import bench_driver, report, timed
+
+PORTS = 96
+POLLS = 20
+CHANGE_RATE = 0.2
+LATENCY = 0.005
+
+STATISTICS = """
+LLDP Device Statistics
+
+Last Update.................................. 0 days {}
+Total Inserts................................ {}
+Total Deletes................................ {}
+Total Drops.................................. 0
+Total Ageouts................................ 0
+"""
+SUMMARY = """
+LLDP Remote Device Summary
+
+Local
+Interface RemID   Chassis ID          Port ID           System Name
+--------- ------- ------------------- ----------------- -----------------
+"""
+DETAIL = """
+LLDP Remote Device Detail
+
+Local Interface: {port}
+
+Remote Identifier: {rem_id}
+Chassis ID Subtype: MAC Address
+Chassis ID: {chassis_id}
+Port ID Subtype: MAC Address
+Port ID: {chassis_id}
+System Name:
+System Description: IP Phone
+Port Description:
+System Capabilities Supported: bridge, telephone
+System Capabilities Enabled: telephone
+Time to Live: 106 seconds
+"""
+
+
+class Stack(object):
+    """LLDP outputs of a stack whose neighbors can be learned again."""
+
+    def __init__(self):
+        self.ports = [
+            "Gi{}/0/{}".format(unit, port)
+            for unit in range(1, PORTS // 48 + 1)
+            for port in range(1, 49)
+        ]
+        self.rem_ids = {port: n + 1 for n, port in enumerate(self.ports)}
+        self.inserts = len(self.ports)
+
+    def relearn(self, port):
+        self.inserts += 1
+        self.rem_ids[port] = self.inserts
+
+    def outputs(self):
+        outputs = {
+            "show lldp statistics": STATISTICS.format(
+                "00:00:{:02d}".format(self.inserts % 60),
+                self.inserts,
+                self.inserts - len(self.ports),
+            )
+        }
+        rows = [SUMMARY]
+        for n, port in enumerate(self.ports):
+            chassis_id = "00:0E:1E:B0:{:02X}:{:02X}".format(n >> 8, n & 0xFF)
+            rows.append(
+                "{:<10}{:<8}{:<20}{:<18}\n".format(
+                    port, self.rem_ids[port], chassis_id, chassis_id
+                )
+            )
+            outputs["show lldp remote-device detail " + port] = DETAIL.format(
+                port=port, rem_id=self.rem_ids[port], chassis_id=chassis_id
+            )
+        outputs["show lldp remote-device all"] = "".join(rows)
+        return outputs
+
+
+def poll(optional_args):
+    random.seed(1)
+    stack = Stack()
+    driver = bench_driver(
+        outputs=stack.outputs(), latency=LATENCY, optional_args=optional_args
+    )
+    for _ in range(POLLS):
+        if random.random() < CHANGE_RATE:
+            stack.relearn(random.choice(stack.ports))
+            driver.device.outputs.update(stack.outputs())
+        driver.get_lldp_neighbors_detail()
+    return driver
+
+
+def main():
+    rows = []
+    for label, optional_args in (
+        ("full fetch", {}),
+        ("lldp_probe", {"lldp_probe": True}),
+    ):
+        seconds, driver = timed(poll, optional_args)
+        avoided = "-"
+        if driver.probe_cache is not None:
+            avoided = "{:.0%}".format(driver.probe_cache.stats()["avoided_rate"])
+        rows.append(
+            [label, len(driver.device.commands), "{:.2f}".format(seconds), avoided]
+        )
+    report(
+        "{} polls of {} LLDP neighbors, {:.0%} of polls with a change, {:.0f}ms "
+        "round trip".format(POLLS, PORTS, CHANGE_RATE, LATENCY * 1000),
+        ["mode", "commands", "seconds", "full fetch avoided"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
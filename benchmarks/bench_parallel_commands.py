@@ -0,0 +1,52 @@
+"""
+Compare a heavy poll (get_interfaces, get_mac_address_table and
+get_lldp_neighbors_detail) sent serially on one session against the parallel
+commands mode (``optional_args={"parallel_commands": True}``), which spreads the
+independent commands of each getter over the session pool, and against _get_multi(),
+which runs the getters concurrently on separate sessions.
+
+Run with ``python -m benchmarks.bench_parallel_commands``.
+"""
+from benchmarks.common import BenchDevice, bench_driver, report, timed
+
+LATENCY = 0.05
+TEST_DIRS = (
+    "test_get_interfaces",
+    "test_get_mac_address_table",
+    "test_get_lldp_neighbors_detail",
+)
+GETTERS = ["get_interfaces", "get_mac_address_table", "get_lldp_neighbors_detail"]
+
+
+def poll_serial(driver):
+    return {getter: getattr(driver, getter)() for getter in GETTERS}
+
+
+def main():
+    rows = []
+    expected = None
+    for label, optional_args, poll in (
+        ("serial, 1 session", {}, poll_serial),
+        ("parallel commands, 4 sessions", {"parallel_commands": True}, poll_serial),
+        ("_get_multi, 3 sessions", {"max_sessions": 3}, None),
+    ):
+        driver = bench_driver(TEST_DIRS, LATENCY, optional_args=optional_args)
+        driver._open_session = lambda: BenchDevice(TEST_DIRS, LATENCY)
+        if poll is None:
+            seconds, result = timed(driver._get_multi, GETTERS)
+        else:
+            seconds, result = timed(poll, driver)
+        if expected is None:
+            expected = result
+        assert result == expected
+        rows.append([label, "{:.3f}".format(seconds)])
+        driver._get_session_pool().close()
+    report(
+        "{} with a {:.0f}ms round trip".format(", ".join(GETTERS), LATENCY * 1000),
+        ["mode", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
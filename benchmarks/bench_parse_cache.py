@@ -0,0 +1,40 @@
+"""
+Poll rarely changing getters repeatedly with and without the parse cache
+(``optional_args={"parse_cache": True}``) and report the parse time and hit rate.
+
+Run with ``python -m benchmarks.bench_parse_cache``.
+"""
+from benchmarks.common import bench_driver, report, timed
+
+GETTERS = ["get_vlans", "get_users", "get_snmp_information", "get_ntp_servers"]
+TEST_DIRS = ["test_get_vlans", "test_get_users", "test_get_snmp_information"]
+POLLS = 50
+
+
+def poll(driver):
+    for _ in range(POLLS):
+        for getter in GETTERS:
+            getattr(driver, getter)()
+
+
+def main():
+    rows = []
+    for label, optional_args in (
+        ("no cache", {}),
+        ("parse cache", {"parse_cache": True}),
+    ):
+        driver = bench_driver(TEST_DIRS, optional_args=optional_args)
+        seconds, _ = timed(poll, driver)
+        hit_rate = "-"
+        if driver.parse_cache is not None:
+            hit_rate = "{:.1%}".format(driver.parse_cache.stats()["hit_rate"])
+        rows.append([label, "{:.3f}".format(seconds), hit_rate])
+    report(
+        "{} polls of {}".format(POLLS, ", ".join(GETTERS)),
+        ["mode", "seconds", "hit rate"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
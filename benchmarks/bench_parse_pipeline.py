@@ -0,0 +1,117 @@
+"""
+Parse the outputs of a simulated fleet in line and with dellos6_pipeline.ParsePipeline
+at several chunk sizes, then overlap collection threads with the pipeline.
+
+Run with ``python -m benchmarks.bench_parse_pipeline [devices]``. The process pool
+only pays off with more than one CPU; on a single CPU the table shows its overhead.
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import bench_driver, report, timed
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+from napalm_dellos6.dellos6_pipeline import ParsePipeline
+
+GETTERS = {
+    "get_interfaces": "test_get_interfaces",
+    "get_interfaces_counters": "test_get_interfaces_counters",
+    "get_lldp_neighbors_detail": "test_get_lldp_neighbors_detail",
+    "get_mac_address_table": "test_get_mac_address_table",
+    "get_vlans": "test_get_vlans",
+}
+CHUNK_SIZES = (1, 16, 64)
+COLLECT_THREADS = 16
+LATENCY = 0.005
+
+
+def collect(getter, latency=0.0):
+    driver = bench_driver([GETTERS[getter]], latency=latency)
+    return driver._collect_outputs(getter)
+
+
+def parse_inline(jobs):
+    parser = DellOS6Parser()
+    return [getattr(parser, getter)(outputs) for _, getter, outputs in jobs]
+
+
+def parse_pipeline(jobs, chunk_size):
+    with ParsePipeline(chunk_size=chunk_size) as pipeline:
+        for device, getter, outputs in jobs:
+            pipeline.submit(device, getter, outputs)
+        pipeline.close()
+        return list(pipeline.results())
+
+
+def collect_and_parse(devices, pipeline=None):
+    """Collect every getter of every device on I/O threads, parsing as they go."""
+    parser = DellOS6Parser()
+
+    def poll(device):
+        for getter in GETTERS:
+            outputs = collect(getter, LATENCY)
+            if pipeline is None:
+                getattr(parser, getter)(outputs)
+            else:
+                pipeline.submit(device, getter, outputs)
+
+    with ThreadPoolExecutor(COLLECT_THREADS) as executor:
+        list(executor.map(poll, range(devices)))
+    if pipeline is not None:
+        pipeline.close()
+        list(pipeline.results())
+
+
+def collect_with_pipeline(devices):
+    with ParsePipeline() as pipeline:
+        collect_and_parse(devices, pipeline)
+
+
+def main():
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    outputs = {getter: collect(getter) for getter in GETTERS}
+    jobs = [
+        (device, getter, outputs[getter])
+        for device in range(devices)
+        for getter in GETTERS
+    ]
+
+    rows = []
+    seconds, _ = timed(parse_inline, jobs)
+    rows.append(["in line", "-", "{:.2f}".format(seconds), int(len(jobs) / seconds)])
+    for chunk_size in CHUNK_SIZES:
+        seconds, _ = timed(parse_pipeline, jobs, chunk_size)
+        rows.append(
+            [
+                "pipeline",
+                chunk_size,
+                "{:.2f}".format(seconds),
+                int(len(jobs) / seconds),
+            ]
+        )
+    report(
+        "Parsing {} jobs ({} devices x {} getters) on {} CPUs".format(
+            len(jobs), devices, len(GETTERS), os.cpu_count()
+        ),
+        ["mode", "chunk size", "seconds", "jobs/s"],
+        rows,
+    )
+
+    rows = []
+    for label, func in (
+        ("parse on the I/O threads", collect_and_parse),
+        ("pipeline", collect_with_pipeline),
+    ):
+        seconds, _ = timed(func, devices)
+        rows.append([label, "{:.2f}".format(seconds)])
+    report(
+        "Collecting and parsing {} devices over {} threads, {:.0f}ms round trip".format(
+            devices, COLLECT_THREADS, LATENCY * 1000
+        ),
+        ["mode", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare reading multi-megabyte command outputs the way netmiko's send_command() does
+(decode every chunk, concatenate strings, search the whole output for the prompt on
+every read, then copy it again to strip the echo and the prompt and check for errors)
+against OutputBuffer (``optional_args={"buffered_read": True}``), which appends raw
+bytes to a bytearray, only scans the new data and decodes once.
+
+Run with ``python -m benchmarks.bench_read_buffer``.
+"""
+import re
+import time
+import tracemalloc
+
+from benchmarks.common import read_mocked, report
+from napalm_dellos6.dellos6_buffer import OutputBuffer
+
+CHUNK_SIZE = 32768
+SIZES_MB = (1, 4, 16)
+PROMPT = "console"
+
+
+def synthetic_chunks(size_mb):
+    """Echo, a MAC address table of about size_mb megabytes and the prompt, in chunks."""
+    table = read_mocked("test_get_mac_address_table", "show mac address-table")
+    lines = [line for line in table.splitlines() if line[:1].isdigit()]
+    body = []
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        for line in lines:
+            body.append(line)
+            size += len(line) + 2
+    data = "show mac address-table\r\n{}\r\n{}#".format(
+        "\r\n".join(body), PROMPT
+    ).encode()
+    return [data[i : i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE)]
+
+
+def read_concatenated(chunks):
+    prompt_regex = re.compile(re.escape(PROMPT) + r"[>#]\s*$", re.M)
+    output = ""
+    for chunk in chunks:
+        output += chunk.decode()
+        if prompt_regex.search(output):
+            break
+    output = output.replace("\r\n", "\n")
+    output = output.split("\n", 1)[1].rsplit("\n", 1)[0]
+    if "% Invalid" in output:
+        raise ValueError(output)
+    return output
+
+
+def read_buffered(chunks):
+    buffer = OutputBuffer(PROMPT)
+    for chunk in chunks:
+        if buffer.feed(chunk):
+            break
+    if buffer.error:
+        raise ValueError(buffer.text())
+    return buffer.text()
+
+
+def measure(func, chunks):
+    tracemalloc.start()
+    start = time.process_time()
+    result = func(chunks)
+    seconds = time.process_time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    rows = []
+    for size_mb in SIZES_MB:
+        chunks = synthetic_chunks(size_mb)
+        expected = None
+        for label, func in (
+            ("concatenated str", read_concatenated),
+            ("bytearray buffer", read_buffered),
+        ):
+            result, seconds, peak = measure(func, chunks)
+            if expected is None:
+                expected = result
+            assert result == expected
+            rows.append(
+                [
+                    "{} MB".format(size_mb),
+                    label,
+                    "{:.3f}".format(seconds),
+                    "{:.1f}".format(peak / 1024.0 / 1024.0),
+                ]
+            )
+    report(
+        "Reading a show mac address-table output in {} KB chunks".format(
+            CHUNK_SIZE // 1024
+        ),
+        ["output", "reader", "cpu seconds", "peak MB"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
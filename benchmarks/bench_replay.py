@@ -0,0 +1,56 @@
+"""
+Time getters against a session recording (``optional_args={"record_session": path}``)
+replayed with its original timing and scaled down.
+
+Run with ``python -m benchmarks.bench_replay [recording] [getter ...]``. Without a
+recording, one is first made from the mocked data with a 50ms round trip.
+"""
+import os
+import sys
+import tempfile
+
+from benchmarks.common import BenchDevice, bench_driver, report, timed
+from napalm_dellos6.dellos6_recording import ReplayDevice, load_recording
+
+LATENCY = 0.05
+TIME_SCALES = (1.0, 0.5, 0.0)
+GETTERS = ["get_facts", "get_interfaces", "get_vlans", "get_mac_address_table"]
+
+
+def make_recording(path, getters):
+    driver = bench_driver(optional_args={"record_session": path})
+    driver._open_session = lambda: BenchDevice(latency=LATENCY)
+    driver.open()
+    for getter in getters:
+        getattr(driver, getter)()
+    driver.close()
+
+
+def main():
+    args = sys.argv[1:]
+    getters = args[1:] or GETTERS
+    if args:
+        path = args[0]
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "session.jsonl.gz")
+        make_recording(path, getters)
+    recording = load_recording(path)
+
+    rows = []
+    for time_scale in TIME_SCALES:
+        driver = bench_driver()
+        driver.device = ReplayDevice(recording, time_scale=time_scale)
+        for getter in getters:
+            seconds, _ = timed(getattr(driver, getter))
+            rows.append([getter, time_scale, "{:.3f}".format(seconds)])
+    report(
+        "Replay of {} ({} exchanges, {} bytes)".format(
+            path, len(recording[1]), os.path.getsize(path)
+        ),
+        ["getter", "time scale", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
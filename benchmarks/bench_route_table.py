@@ -0,0 +1,77 @@
+"""
+Resolve many destinations against a large synthetic "show ip route": a linear scan
+over the parsed prefixes (what callers do with raw output today) against the
+longest-prefix-match index returned by _get_route_table().
+
+Run with ``python -m benchmarks.bench_route_table``.
+"""
+import random
+from ipaddress import ip_address, ip_network
+
+from benchmarks.common import bench_driver, report, timed
+
+ROUTES = 20000
+DESTINATIONS = 5000
+
+
+def synthetic_routes(count):
+    lines = ["", "Default Gateway is 192.0.2.130", ""]
+    lines.append("S      * 0.0.0.0/0 [1/0] via 192.0.2.130,   Vl666")
+    for i in range(count):
+        prefixlen = random.choice((16, 20, 22, 24, 24, 24, 28))
+        network = ip_network(
+            "{}/{}".format(ip_address(random.getrandbits(32)), prefixlen), strict=False
+        )
+        lines.append(
+            "B  E   * {} [20/0] via 192.0.2.130,   12d:04h:27m,  Vl666".format(network)
+        )
+    return "\n".join(lines)
+
+
+def linear_lookup(networks, address):
+    best = None
+    for network in networks:
+        if address in network and (best is None or network.prefixlen > best.prefixlen):
+            best = network
+    return best
+
+
+def main():
+    random.seed(42)
+    driver = bench_driver(outputs={"show ip route": synthetic_routes(ROUTES)})
+    destinations = [
+        str(ip_address(random.getrandbits(32))) for _ in range(DESTINATIONS)
+    ]
+
+    parse_seconds, table = timed(driver._get_route_table)
+    index_seconds, _ = timed(table.lookup_many, destinations)
+
+    networks = [ip_network(prefix) for prefix in table]
+    sample = destinations[:200]
+    linear_seconds, _ = timed(
+        lambda: [linear_lookup(networks, ip_address(d)) for d in sample]
+    )
+
+    report(
+        "{} routes, {} destinations".format(len(table), DESTINATIONS),
+        ["method", "per lookup (us)", "total (s)"],
+        [
+            ["snapshot parse", "-", "{:.3f}".format(parse_seconds)],
+            [
+                "indexed lookup",
+                "{:.2f}".format(index_seconds / DESTINATIONS * 1e6),
+                "{:.3f}".format(index_seconds),
+            ],
+            [
+                "linear scan",
+                "{:.2f}".format(linear_seconds / len(sample) * 1e6),
+                "{:.3f} (extrapolated)".format(
+                    linear_seconds / len(sample) * DESTINATIONS
+                ),
+            ],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Parse the multi-section "show system" and "show snmp" outputs the way
+get_environment(), get_snmp_information() and get_facts() need them, with one TextFSM
+template per section and with the single-pass dellos6_sections parsers.
+
+Run with ``python -m benchmarks.bench_sections``.
+"""
+from benchmarks.common import read_mocked, report, timed
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+from napalm_dellos6.dellos6_sections import COMMAND_SECTIONS
+
+# Sections parsed by each getter, by command
+GETTERS = {
+    "get_environment": {
+        "show system": [
+            "show_system-fans",
+            "show_system-temps",
+            "show_system-power_supplies",
+        ],
+    },
+    "get_snmp_information": {
+        "show system": ["show_system-basic"],
+        "show snmp": ["show_snmp-basic", "show_snmp-communities"],
+    },
+    "get_facts": {"show system": ["show_system-basic", "show_system-units"]},
+}
+RUNS = 200
+
+
+def parse_templates(parser, outputs, sections):
+    for _ in range(RUNS):
+        for command, templates in sections.items():
+            for template in templates:
+                parser.parse(template, outputs[command])
+
+
+def parse_single_pass(outputs, sections):
+    for _ in range(RUNS):
+        for command, templates in sections.items():
+            COMMAND_SECTIONS[command].parse(outputs[command], templates)
+
+
+def main():
+    parser = DellOS6Parser()
+    outputs = {
+        "show system": read_mocked("test_get_environment", "show system"),
+        "show snmp": read_mocked("test_get_snmp_information", "show snmp"),
+    }
+    rows = []
+    for getter, sections in GETTERS.items():
+        templates, _ = timed(parse_templates, parser, outputs, sections)
+        single, _ = timed(parse_single_pass, outputs, sections)
+        rows.append(
+            [
+                getter,
+                "{:.1f}".format(templates / RUNS * 1e6),
+                "{:.1f}".format(single / RUNS * 1e6),
+                "{:.1f}x".format(templates / single),
+            ]
+        )
+    report(
+        "Parse time per call of the multi-section outputs",
+        ["getter", "templates (us)", "single pass (us)", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
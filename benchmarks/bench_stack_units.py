@@ -0,0 +1,87 @@
+"""
+Compare a full get_interfaces_counters() poll of a synthetic 12-unit stack read with
+the whole-stack commands on one session against stack mode
+(``optional_args={"stack_mode": True}``), which sends per-unit commands over
+several sessions.
+
+Run with ``python -m benchmarks.bench_stack_units``.
+"""
+from benchmarks.common import (
+    BenchDevice,
+    bench_driver,
+    filter_rows,
+    read_mocked,
+    report,
+    stack_output,
+    timed,
+)
+from napalm_dellos6.dellos6_stack import in_range
+
+UNITS = 12
+LATENCY = 0.05
+LINE_LATENCY = 0.0005
+COMMANDS = [
+    "show interfaces status",
+    "show interfaces counters",
+    "show interfaces counters errors",
+]
+
+
+def stack_outputs():
+    outputs = {
+        command: stack_output(
+            read_mocked("test_get_interfaces_counters", command), UNITS
+        )
+        for command in COMMANDS
+    }
+    outputs["show ip interface"] = read_mocked(
+        "test_get_interfaces_counters", "show ip interface"
+    )
+    switch = read_mocked("test_get_facts", "show switch").splitlines()
+    members = [switch[-1].replace("2", str(unit), 1) for unit in range(3, UNITS + 1)]
+    outputs["show switch"] = "\n".join(switch + members) + "\n"
+    return outputs
+
+
+class StackBenchDevice(BenchDevice):
+    """BenchDevice answering "<command> <range>" from the whole-stack output."""
+
+    def send_command(self, command, **kwargs):
+        if command not in self.outputs:
+            base, interface_range = command.rsplit(" ", 1)
+            self.outputs[command] = filter_rows(
+                self.outputs[base], lambda name: in_range(name, interface_range)
+            )
+        return super(StackBenchDevice, self).send_command(command, **kwargs)
+
+
+def main():
+    outputs = stack_outputs()
+    rows = []
+    for label, optional_args in (
+        ("whole stack, 1 session", {}),
+        ("per unit, 4 sessions", {"stack_mode": True, "max_sessions": 4}),
+        ("per unit, 12 sessions", {"stack_mode": True, "max_sessions": 12}),
+    ):
+        driver = bench_driver(optional_args=optional_args)
+        driver.device = StackBenchDevice(
+            outputs=outputs, latency=LATENCY, line_latency=LINE_LATENCY
+        )
+        driver._open_session = lambda: StackBenchDevice(
+            outputs=outputs, latency=LATENCY, line_latency=LINE_LATENCY
+        )
+        # The first poll builds the unit ranges from the port inventory
+        driver.get_interfaces_counters()
+        seconds, result = timed(driver.get_interfaces_counters)
+        rows.append([label, len(result), "{:.3f}".format(seconds)])
+        driver.close()
+    report(
+        "get_interfaces_counters() on {} units, {:.0f}ms round trip, "
+        "{:.1f}ms per line".format(UNITS, LATENCY * 1000, LINE_LATENCY * 1000),
+        ["mode", "interfaces", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Poll get_mac_address_table() of a synthetic 60k-entry MAC table, where addresses
+are learned on some polls, with and without the table summary probe
+(``optional_args={"table_probes": True}``). The output transfer is modeled per line.
+
+Run with ``python -m benchmarks.bench_table_probes``.
+"""
+import random
+
+from benchmarks.common import bench_driver, report, timed
+
+ENTRIES = 60000
+POLLS = 10
+CHANGE_RATE = 0.2
+LATENCY = 0.005
+LINE_LATENCY = 0.00001
+
+HEADER = """
+Aging time is 300 Sec
+
+Vlan     Mac Address           Type        Port
+-------- --------------------- ----------- ---------------------
+"""
+COUNT = """
+Dynamic Address count.......................... {}
+Static Address (User-defined) count............ 0
+Total MAC Addresses in use..................... {}
+Total MAC Addresses available.................. 131072
+"""
+
+
+def outputs(entries):
+    rows = [HEADER]
+    for n in range(entries):
+        rows.append(
+            "{:<9}{:<22}{:<12}Te{}/0/{}\n".format(
+                n % 100 + 1,
+                "0050.56{:02X}.{:02X}{:02X}".format(n >> 16, (n >> 8) & 0xFF, n & 0xFF),
+                "Dynamic",
+                n % 8 + 1,
+                n % 48 + 1,
+            )
+        )
+    rows.append("\nTotal MAC Addresses in use: {}\n".format(entries))
+    return {
+        "show mac address-table": "".join(rows),
+        "show mac address-table count": COUNT.format(entries, entries),
+    }
+
+
+def poll(optional_args):
+    random.seed(1)
+    entries = ENTRIES
+    driver = bench_driver(
+        outputs=outputs(entries),
+        latency=LATENCY,
+        line_latency=LINE_LATENCY,
+        optional_args=optional_args,
+    )
+    for _ in range(POLLS):
+        if random.random() < CHANGE_RATE:
+            entries += 1
+            driver.device.outputs.update(outputs(entries))
+        driver.get_mac_address_table()
+    return driver
+
+
+def main():
+    rows = []
+    for label, optional_args in (
+        ("full fetch", {}),
+        ("table_probes", {"table_probes": True}),
+    ):
+        seconds, driver = timed(poll, optional_args)
+        avoided = "-"
+        if driver.probe_cache is not None:
+            avoided = "{:.0%}".format(driver.probe_cache.stats()["hit_rate"])
+        rows.append(
+            [label, len(driver.device.commands), "{:.2f}".format(seconds), avoided]
+        )
+    report(
+        "{} polls of a {} entry MAC table, {:.0%} of polls with a change, {:.0f}ms "
+        "round trip".format(POLLS, ENTRIES, CHANGE_RATE, LATENCY * 1000),
+        ["mode", "commands", "seconds", "full fetch avoided"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Crawl the LLDP topology of a synthetic campus (two cores, each cabled to every
+access switch, with servers on the access switches) one switch at a time and with
+TopologyCrawler polling several switches at once, then recrawl it unchanged and
+after one cable change.
+
+Run with ``python -m benchmarks.bench_topology [access switches]``.
+"""
+import sys
+
+from benchmarks.common import BenchDevice, report, timed
+from napalm_dellos6.dellos6 import DellOS6Driver
+from napalm_dellos6.dellos6_topology import TopologyCrawler
+
+LATENCY = 0.02
+SERVERS = 8
+WORKERS = (1, 16)
+
+SYSTEM = """
+System Name: {name}
+Burned In MAC Address: {mac}
+
+System Thermal Conditions:
+"""
+SUMMARY = """
+LLDP Remote Device Summary
+
+Local
+Interface RemID   Chassis ID          Port ID           System Name
+--------- ------- ------------------- ----------------- -----------------
+"""
+ROW = "{:<10}{:<8}{:<20}{:<18}{}\n"
+DETAIL = """
+LLDP Remote Device Detail
+
+Local Interface: {port}
+
+Remote Identifier: 1
+Chassis ID Subtype: MAC Address
+Chassis ID: {chassis_id}
+Port ID Subtype: Interface Name
+Port ID: {remote_port}
+System Name: {name}
+System Capabilities Supported: {capab}
+System Capabilities Enabled: {capab}
+Time to Live: 106 seconds
+"""
+
+
+def mac(number):
+    return "F8:B1:56:{:02X}:{:02X}:{:02X}".format(
+        number >> 16, (number >> 8) & 0xFF, number & 0xFF
+    )
+
+
+def campus(access):
+    """Return the links of each switch: local port to (remote, remote port)."""
+    links = {"core1": {}, "core2": {}}
+    for n in range(access):
+        name = "acc{}".format(n)
+        links[name] = {}
+        for core, uplink in (("core1", "Gi1/0/49"), ("core2", "Gi1/0/50")):
+            port = "Te1/0/{}".format(n + 1)
+            links[core][port] = (name, uplink)
+            links[name][uplink] = (core, port)
+        for server in range(SERVERS):
+            links[name]["Gi1/0/{}".format(server + 1)] = (
+                "server{}-{}".format(n, server),
+                "eth0",
+            )
+    return links
+
+
+def outputs(links):
+    """Return the Dell OS6 outputs of each switch of a campus."""
+    names = {name: n for n, name in enumerate(sorted(links))}
+    servers = {}
+
+    def chassis(name):
+        if name in names:
+            return mac(names[name])
+        return mac(0x800000 + servers.setdefault(name, len(servers)))
+
+    result = {}
+    for name, ports in links.items():
+        switch = {
+            "show system": SYSTEM.format(name=name, mac=mac(names[name])),
+            "show lldp remote-device all": SUMMARY
+            + "".join(
+                ROW.format(
+                    port,
+                    1,
+                    chassis(remote),
+                    remote_port,
+                    remote if remote in links else "",
+                )
+                for port, (remote, remote_port) in sorted(ports.items())
+            ),
+        }
+        for port, (remote, remote_port) in ports.items():
+            switch["show lldp remote-device detail " + port] = DETAIL.format(
+                port=port,
+                chassis_id=chassis(remote),
+                remote_port=remote_port,
+                name=remote if remote in links else "",
+                capab="bridge, router" if remote in links else "",
+            )
+        result[name] = switch
+    return result
+
+
+class Campus(object):
+    def __init__(self, access):
+        self.links = campus(access)
+        self.outputs = outputs(self.links)
+        self.commands = []
+
+    def connect(self, host):
+        driver = DellOS6Driver(host, "bench", "bench")
+        driver.device = BenchDevice(latency=LATENCY, outputs=self.outputs[host])
+        # One command log for the whole campus
+        driver.device.commands = self.commands
+        return driver
+
+
+def main():
+    access = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rows = []
+    for workers in WORKERS:
+        network = Campus(access)
+        crawler = TopologyCrawler(network.connect, max_workers=workers)
+        seconds, graph = timed(crawler.crawl, ["core1"])
+        rows.append(
+            [
+                "crawl",
+                workers,
+                len(graph.nodes),
+                len(network.commands),
+                "{:.2f}".format(seconds),
+            ]
+        )
+        del network.commands[:]
+        seconds, graph = timed(crawler.recrawl)
+        rows.append(
+            [
+                "recrawl, unchanged",
+                workers,
+                len(graph.nodes),
+                len(network.commands),
+                "{:.2f}".format(seconds),
+            ]
+        )
+        # Move a server to another port of its access switch
+        network.links["acc0"]["Gi1/0/48"] = network.links["acc0"].pop("Gi1/0/1")
+        network.outputs.update(outputs(network.links))
+        del network.commands[:]
+        seconds, graph = timed(crawler.recrawl)
+        rows.append(
+            [
+                "recrawl, one change",
+                workers,
+                len(graph.nodes),
+                len(network.commands),
+                "{:.2f}".format(seconds),
+            ]
+        )
+    report(
+        "LLDP crawl of {} access switches, {:.0f}ms round trip".format(
+            access, LATENCY * 1000
+        ),
+        ["mode", "workers", "switches", "commands", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
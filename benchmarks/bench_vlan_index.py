@@ -0,0 +1,119 @@
+"""
+Build get_vlans() for a synthetic 12-unit stack with 1,000 VLANs trunked on every
+port: per-port range expansion and canonical_interface_name() checked against the
+interface list (the previous implementation, kept here as a reference) against the
+VlanIndex bitmaps, from already parsed outputs.
+
+Run with ``python -m benchmarks.bench_vlan_index``.
+"""
+import re
+
+from napalm.base.helpers import canonical_interface_name
+
+from benchmarks.common import read_mocked, report, stack_output, timed
+from napalm_dellos6.dellos6_canonical_map import dellos6_interfaces
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+
+UNITS = 12
+VLANS = 1000
+
+
+def synthetic_vlans(count, units):
+    lines = [
+        "",
+        "VLAN   Name                             Ports          Type",
+        "-----  ---------------                  -------------  --------------",
+    ]
+    members = ["Po1-128,"] + ["Te{}/0/1-48,".format(unit) for unit in range(1, units)]
+    members.append("Te{}/0/1-48".format(units))
+    for vlan_id in range(2, count + 2):
+        lines.append(
+            "{:<6} {:<32} {:<14} Static".format(
+                vlan_id, "VLAN{}".format(vlan_id), members[0]
+            )
+        )
+        lines.extend(" " * 40 + member for member in members[1:])
+    return "\n".join(lines) + "\n"
+
+
+def reference_get_vlans(show_vlan, interface_list):
+    def expand_ranges(iflist):
+        expanded_interfaces = []
+        for interface in iflist:
+            m = re.match(r"(\S\S|.+/)((\d+)-(\d+))", interface)
+            if m is None:
+                expanded_interfaces.append(interface)
+            else:
+                interfaces = []
+                for i in range(int(m.group(3)), int(m.group(4)) + 1):
+                    interfaces.append("%s%d" % (m.group(1), i))
+                expanded_interfaces = expanded_interfaces + interfaces
+        return expanded_interfaces
+
+    def ensure_ports_split(ports):
+        result = []
+        for port in ports:
+            result = result + port.split(",")
+        return result
+
+    vlans = {}
+    for vlan_entry in show_vlan:
+        canonical_interfaces = []
+        for interface in expand_ranges(ensure_ports_split(vlan_entry["ports"])):
+            interface_name = canonical_interface_name(
+                interface, addl_name_map=dellos6_interfaces
+            )
+            if interface_name in interface_list:
+                canonical_interfaces.append(interface_name)
+        vlans[int(vlan_entry["vlan_id"])] = {
+            "name": vlan_entry["vlan_name"],
+            "interfaces": canonical_interfaces,
+        }
+    return vlans
+
+
+def main():
+    parser = DellOS6Parser()
+    raw = {
+        "show vlan": synthetic_vlans(VLANS, UNITS),
+        "show interfaces status": stack_output(
+            read_mocked("test_get_vlans", "show interfaces status"), UNITS
+        ),
+        "show ip interface": read_mocked("test_get_vlans", "show ip interface"),
+    }
+    parse_seconds, show_vlan = timed(parser.parse, "show_vlan", raw["show vlan"])
+    outputs = {
+        "show vlan": show_vlan,
+        # stack_output() groups the ports by number, list them by unit like a switch
+        "show interfaces status": sorted(
+            parser.parse("show_interfaces_status", raw["show interfaces status"]),
+            key=lambda entry: [int(n) for n in re.findall(r"\d+", entry["interface"])],
+        ),
+        "show ip interface": parser.parse(
+            "show_ip_interface", raw["show ip interface"]
+        ),
+    }
+
+    reference, expected = timed(
+        lambda: reference_get_vlans(show_vlan, set(parser.interface_list(outputs)))
+    )
+    indexed, index = timed(parser.vlan_index, outputs)
+    to_dict, result = timed(index.to_dict)
+    assert result == expected
+    lookups, _ = timed(lambda: [index.vlans(port) for port in index.ports(2)])
+
+    ports = len(index.ports(2))
+    rows = [
+        ["show vlan TextFSM parse", "{:.1f}".format(parse_seconds * 1000)],
+        ["per-port expansion (3 commands)", "{:.1f}".format(reference * 1000)],
+        ["VlanIndex build (2 commands)", "{:.1f}".format(indexed * 1000)],
+        ["VlanIndex.to_dict()", "{:.1f}".format(to_dict * 1000)],
+        ["VLANs of all {} ports".format(ports), "{:.1f}".format(lookups * 1000)],
+    ]
+    report(
+        "get_vlans() of {} VLANs on {} ports".format(VLANS, ports), ["step", "ms"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
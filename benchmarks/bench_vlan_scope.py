@@ -0,0 +1,74 @@
+"""
+Fetch a few VLANs of a synthetic 2-unit switch with 4,000 VLANs: the whole table
+with get_vlans() against ``_get_vlans(vlan_ids=...)``, which sends "show vlan id
+<list>", with and without checking the ports against "show interfaces status".
+
+Run with ``python -m benchmarks.bench_vlan_scope``.
+"""
+from benchmarks.bench_vlan_index import synthetic_vlans
+from benchmarks.common import bench_driver, read_mocked, report, stack_output, timed
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+
+UNITS = 2
+VLANS = 4000
+VLAN_IDS = [10, 20, 100, 101, 102]
+LATENCY = 0.05
+LINE_LATENCY = 0.0001
+
+
+def vlan_rows(output, vlan_ids):
+    """Keep the rows of the given VLANs in a "show vlan" output."""
+    lines = []
+    keep = True
+    for line in output.splitlines():
+        if line[:1].isdigit():
+            keep = int(line.split()[0]) in vlan_ids
+        if keep:
+            lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    show_vlan = synthetic_vlans(VLANS, UNITS)
+    outputs = {
+        "show vlan": show_vlan,
+        DellOS6Parser.vlan_command(VLAN_IDS): vlan_rows(show_vlan, set(VLAN_IDS)),
+        "show interfaces status": stack_output(
+            read_mocked("test_get_vlans", "show interfaces status"), UNITS
+        ),
+    }
+
+    rows = []
+    for label, kwargs in (
+        ("all VLANs", {}),
+        ("vlan_ids", {"vlan_ids": VLAN_IDS}),
+        (
+            "vlan_ids, validate_interfaces=False",
+            {"vlan_ids": VLAN_IDS, "validate_interfaces": False},
+        ),
+    ):
+        driver = bench_driver(
+            outputs=outputs, latency=LATENCY, line_latency=LINE_LATENCY
+        )
+        seconds, vlans = timed(driver._get_vlans, **kwargs)
+        lines = sum(outputs[command].count("\n") for command in driver.device.commands)
+        rows.append(
+            [
+                label,
+                len(driver.device.commands),
+                lines,
+                len(vlans),
+                "{:.3f}".format(seconds),
+            ]
+        )
+    report(
+        "get_vlans() of {} VLANs among {}, {:.0f}ms round trip, {:.1f}ms per line".format(
+            len(VLAN_IDS), VLANS, LATENCY * 1000, LINE_LATENCY * 1000
+        ),
+        ["mode", "commands", "lines", "VLANs", "seconds"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
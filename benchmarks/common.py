@@ -0,0 +1,142 @@
+"""Shared helpers for the napalm-dellos6 benchmarks."""
+import os
+import re
+import time
+
+from napalm_dellos6.dellos6 import DellOS6Driver
+
+MOCKED_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "test", "unit", "mocked_data"
+)
+
+
+def sanitize(command):
+    """Build the mocked_data filename of a command, like napalm's test double."""
+    return re.sub("[^a-zA-Z0-9]", "_", command)[0:150]
+
+
+class BenchDevice(object):
+    """
+    Netmiko stand-in serving outputs from test/unit/mocked_data.
+
+    Every command is recorded in ``commands`` and delayed by ``latency`` seconds to
+    model the device round trip, plus ``line_latency`` seconds per output line to
+    model the transfer of large outputs. Outputs are looked up in the given test directories
+    first, then in any other directory that has a file for the command. Extra
+    outputs (e.g. synthetic large tables) can be passed in ``outputs``.
+    """
+
+    def __init__(self, test_dirs=(), latency=0.0, outputs=None, line_latency=0.0):
+        self.latency = latency
+        self.line_latency = line_latency
+        self.outputs = dict(outputs or {})
+        self.commands = []
+        self._files = {}
+        search = [os.path.join(MOCKED_DATA, d, "normal") for d in test_dirs]
+        search += sorted(
+            os.path.join(MOCKED_DATA, d, "normal") for d in os.listdir(MOCKED_DATA)
+        )
+        for directory in search:
+            if not os.path.isdir(directory):
+                continue
+            for filename in os.listdir(directory):
+                self._files.setdefault(filename, os.path.join(directory, filename))
+
+    def set_base_prompt(self):
+        return "#"
+
+    def send_command(self, command, **kwargs):
+        self.commands.append(command)
+        if command in self.outputs:
+            output = self.outputs[command]
+        else:
+            with open(self._files["{}.txt".format(sanitize(command))]) as f:
+                output = f.read()
+        delay = self.latency + self.line_latency * output.count("\n")
+        if delay:
+            time.sleep(delay)
+        return output
+
+    def disconnect(self):
+        pass
+
+
+def bench_driver(
+    test_dirs=(), latency=0.0, outputs=None, optional_args=None, line_latency=0.0
+):
+    """Return a DellOS6Driver wired to a BenchDevice."""
+    driver = DellOS6Driver("bench", "bench", "bench", optional_args=optional_args)
+    driver.device = BenchDevice(test_dirs, latency, outputs, line_latency)
+    return driver
+
+
+def read_mocked(test_dir, command):
+    """Return the mocked output of a command from test/unit/mocked_data."""
+    filename = "{}.txt".format(sanitize(command))
+    with open(os.path.join(MOCKED_DATA, test_dir, "normal", filename)) as f:
+        return f.read()
+
+
+PORT_ROW_REGEX = re.compile(r"^(Te|Gi|Fo)(\d+)/0/(\d+)\b")
+INTERFACE_ROW_REGEX = re.compile(r"^(Te|Gi|Fo|Po|oob)[\d/]*\s")
+
+
+def stack_output(output, units, ports=48):
+    """
+    Grow a port table to a stack of ``units`` members with ``ports`` ports each by
+    repeating the rows of unit 1. Other lines are kept as they are.
+    """
+    lines = []
+    for line in output.splitlines():
+        match = PORT_ROW_REGEX.match(line)
+        if match is None:
+            lines.append(line)
+            continue
+        if match.group(2) != "1":
+            continue
+        port = int(match.group(3))
+        for unit in range(1, units + 1):
+            for number in range(port, ports + 1, 24):
+                name = "{}{}/0/{}".format(match.group(1), unit, number)
+                lines.append(name.ljust(match.end()) + line[match.end() :])
+    return "\n".join(lines) + "\n"
+
+
+def filter_rows(output, keep):
+    """
+    Keep the rows of a port table whose interface satisfies ``keep(name)``, along
+    with their continuation lines and all header lines.
+    """
+    lines = []
+    keep_line = True
+    for line in output.splitlines(True):
+        if INTERFACE_ROW_REGEX.match(line):
+            keep_line = keep(line.split()[0])
+        elif not line[:1].isspace() or not line.strip():
+            keep_line = True
+        if keep_line:
+            lines.append(line)
+    return "".join(lines)
+
+
+def port_output(output, port):
+    """Keep the rows of a single port in a port table, like "<command> <port>"."""
+    return filter_rows(output, lambda name: name == port)
+
+
+def timed(func, *args, **kwargs):
+    """Call func and return (seconds, result)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def report(title, header, rows):
+    """Print a simple fixed-width results table."""
+    print(title)
+    widths = [
+        max(len(str(row[i])) for row in [header] + rows) for i in range(len(header))
+    ]
+    for row in [header] + rows:
+        print("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)))
+    print()
@@ -18,31 +18,57 @@ Napalm driver for DellOS6.
 
 Read https://napalm.readthedocs.io for more information.
 """
+import json
 import re
 import socket
-from ipaddress import IPv4Interface, IPv6Interface
-from statistics import stdev
+import threading
+import time
+from contextlib import contextmanager
 
 import napalm.base.constants as C
 from napalm.base import NetworkDriver
-from napalm.base.exceptions import CommandErrorException, ConnectionClosedException
-from napalm.base.helpers import (
-    canonical_interface_name,
-    mac,
-    sanitize_configs,
-    textfsm_extractor,
+from napalm.base.exceptions import (
+    CommandErrorException,
+    CommandTimeoutException,
+    ConnectionClosedException,
 )
+from napalm.base.helpers import canonical_interface_name
 
 import napalm_dellos6.dellos6_constants as D6C
+from napalm_dellos6.dellos6_bgp import BGPRouteParser
+from napalm_dellos6.dellos6_buffer import OutputBuffer
 from napalm_dellos6.dellos6_canonical_map import dellos6_interfaces
+from napalm_dellos6.dellos6_changes import ChangeTracker
+from napalm_dellos6.dellos6_config import DellOS6Config
+from napalm_dellos6.dellos6_facts_cache import FactsCache, default_cache_dir
+from napalm_dellos6.dellos6_neighbors import ARPTableParser, IPv6NeighborsParser
+from napalm_dellos6.dellos6_parse_cache import ParseCache
+from napalm_dellos6.dellos6_probes import ProbeCache
+from napalm_dellos6.dellos6_parser import (
+    DellOS6Parser,
+    is_port,
+    match_routes,
+    parse_arp_age,
+    parse_route_age,
+    parse_uptime,
+    short_interface_name,
+)
+from napalm_dellos6.dellos6_recording import RecordingConnection, SessionRecorder
+from napalm_dellos6.dellos6_sessions import DellOS6SessionPool
+from napalm_dellos6.dellos6_snmp import SNMPWalker, interface_counters
+from napalm_dellos6.dellos6_stack import StackInventory
 
-from netmiko import ConnectHandler
-
-# Easier to store these as constants
-HOUR_SECONDS = 3600
-DAY_SECONDS = 24 * HOUR_SECONDS
-WEEK_SECONDS = 7 * DAY_SECONDS
-YEAR_SECONDS = 365 * DAY_SECONDS
+PING_SENT_RECEIVED_REGEX = re.compile(
+    r"(\d+)\s+packets transmitted\S+\s+(\d+)\s+packets received\S+\s+\S+\s+packet loss"
+)
+PING_ICMP_RESULT_REGEX = re.compile(
+    r"Reply From\s+(\S+)\:\s+icmp_seq\s+=\s+(\d+)\.\s+time=\s+(\d+)\s+usec\."
+)
+PING_MIN_AVG_MAX_REGEX = re.compile(
+    r"round-trip \(msec\)\s+min\/avg\/max\s+=\s+(\S+)\/(\S+)\/(\S+)"
+)
+TRACEROUTE_HOP_REGEX = re.compile(r"^\s*(\d+)\s+(\S+)\s*(.*)$")
+TRACEROUTE_PROBE_REGEX = re.compile(r"(<?\d+(?:\.\d+)?)\s*(?:msec|ms)|\*")
 
 
 class DellOS6Driver(NetworkDriver):
@@ -97,12 +123,92 @@ class DellOS6Driver(NetworkDriver):
         self.device = None
         self.config_replace = False
 
+        # Serve config-derived getters from one cached "show running-config"
+        self.config_cache = optional_args.get("config_cache", False)
+        self._config_tree = None
+
+        # Upper limit of extra sessions used to run commands concurrently
+        self.max_sessions = optional_args.get("max_sessions", 4)
+        self._session_pool = None
+
+        # Send the independent commands of a getter concurrently over the session
+        # pool, see _parallel_commands()
+        self.parallel_commands = optional_args.get("parallel_commands", False)
+        # Per-thread session of _get_multi() workers and prefetched command outputs
+        self._local = threading.local()
+
+        # Read command outputs into a bytearray instead of netmiko's send_command(),
+        # see _read_command()
+        self.buffered_read = optional_args.get("buffered_read", False)
+
+        # Record every exchange of every session to a compressed file, see
+        # dellos6_recording.SessionRecorder
+        self.record_session = optional_args.get("record_session", None)
+        self._recorder = None
+
+        # Ports queried with per-interface commands before falling back to bulk ones
+        self.pushdown_threshold = optional_args.get(
+            "pushdown_threshold", D6C.DELLOS6_PUSHDOWN_THRESHOLD
+        )
+
+        # Keep the static get_facts attributes on disk, see get_facts()
+        facts_cache = optional_args.get("facts_cache", False)
+        self._facts_cache = None
+        if facts_cache:
+            if facts_cache is True:
+                facts_cache = default_cache_dir()
+            ttls = dict(D6C.DELLOS6_FACTS_CACHE_TTLS)
+            ttls.update(optional_args.get("facts_cache_ttls", {}))
+            self._facts_cache = FactsCache(facts_cache, hostname, ttls)
+
+        # Reuse the parsed entries of unchanged outputs, see _textfsm()
+        parse_cache = optional_args.get("parse_cache", False)
+        self.parse_cache = None
+        if parse_cache:
+            if parse_cache is True:
+                parse_cache = D6C.DELLOS6_PARSE_CACHE_SIZE
+            self.parse_cache = ParseCache(parse_cache)
+        # Turns command outputs into the getter results, see dellos6_parser
+        self.parser = DellOS6Parser(self.parse_cache)
+
+        # Probe the LLDP table statistics before fetching the neighbors again, see
+        # _get_lldp_probed()
+        self.lldp_probe = optional_args.get("lldp_probe", False)
+        # Probe the MAC, ARP and IPv6 neighbor table summaries before fetching the
+        # tables again: True for all of them or a list of getter names, see
+        # _get_table_probed()
+        table_probes = optional_args.get("table_probes", False)
+        if table_probes is True:
+            table_probes = list(D6C.DELLOS6_TABLE_PROBES)
+        self.table_probes = set(table_probes or ())
+        self.probe_cache = None
+        if self.lldp_probe or self.table_probes:
+            self.probe_cache = ProbeCache(optional_args.get("probe_max_age", None))
+
+        # Split heavy whole-stack commands per stack unit, see _get_stack_entries()
+        self.stack_mode = optional_args.get("stack_mode", False)
+        self._stack = StackInventory()
+
+        # Routing table snapshots by VRF name, see _get_route_table()
+        self._route_tables = {}
+
+        # Last result of each getter followed by _get_changes()
+        self._change_trackers = {}
+
+        # Read interface counters over SNMP instead of the CLI: a dict of SNMPWalker
+        # arguments (community, port, ...) or an object with a walk(oid) method
+        self.snmp_counters = optional_args.get("snmp_counters", None)
+        self._snmp_walker = None
+
         self.profile = ["dellos6"]
 
-    def open(self):
-        """Open a connection to the device."""
+    def _open_session(self):
+        """Open a new CLI session to the device in enable mode."""
+        # netmiko is only needed once a connection is opened
+        from netmiko import ConnectHandler
+
         device_type = "dell_os6"
-        self.device = ConnectHandler(
+        session = ConnectHandler(
             device_type=device_type,
             host=self.hostname,
             username=self.username,
@@ -110,18 +216,157 @@ class DellOS6Driver(NetworkDriver):
             **self.netmiko_optional_args
         )
         # ensure in enable mode
-        self.device.enable()
+        session.enable()
+        return session
+
+    def _connect_session(self):
+        """Open a new session, recorded if the record_session optional argument is set."""
+        session = self._open_session()
+        if self.record_session:
+            if self._recorder is None:
+                self._recorder = SessionRecorder(self.record_session, self.hostname)
+            session = RecordingConnection(session, self._recorder)
+        return session
+
+    def open(self):
+        """Open a connection to the device."""
+        self.device = self._connect_session()
+        self._config_tree = None
 
     def close(self):
         """To close the connection."""
+        if self._session_pool is not None:
+            self._session_pool.close()
+            self._session_pool = None
         self.device.disconnect()
+        self._config_tree = None
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def _get_session_pool(self):
+        """Returns the pool of extra sessions, creating it on first use."""
+        if self._session_pool is None:
+            self._session_pool = DellOS6SessionPool(
+                self._connect_session, self.max_sessions
+            )
+        return self._session_pool
+
+    def _get_snmp_walker(self):
+        """Returns the SNMP walker of the snmp_counters backend, creating it on first use."""
+        if self._snmp_walker is None:
+            if isinstance(self.snmp_counters, dict):
+                self._snmp_walker = SNMPWalker(self.hostname, **self.snmp_counters)
+            else:
+                self._snmp_walker = self.snmp_counters
+        return self._snmp_walker
+
+    @contextmanager
+    def _parallel_commands(self, commands, always=False):
+        """
+        With the parallel_commands optional argument (or ``always``), sends the given
+        independent commands concurrently over the session pool on entering the block,
+        and _send_command() returns their outputs (or raises their errors) within the
+        block instead of sending them again. Otherwise, or within a _get_multi() worker,
+        the commands are sent one at a time by the getter as usual.
+        """
+        commands = list(dict.fromkeys(commands))
+        if (
+            not (self.parallel_commands or always)
+            or len(commands) < 2
+            or getattr(self._local, "device", None) is not None
+        ):
+            yield
+            return
+
+        def run_command(session, command):
+            try:
+                return self._send_command(command, device=session)
+            except CommandErrorException as exp:
+                return exp
+
+        self._local.prefetched = dict(
+            self._get_session_pool().map(run_command, commands)
+        )
+        try:
+            yield
+        finally:
+            self._local.prefetched = {}
+
+    def _bulk_commands(self, commands):
+        """Return the commands which are sent as is, i.e. not split per stack unit."""
+        return [
+            command
+            for command in commands
+            if not (self.stack_mode and command in D6C.DELLOS6_UNIT_COMMANDS)
+        ]
+
+    def _collect_outputs(self, getter, outputs=None, **kwargs):
+        """
+        Sends the commands the parser needs for getter (e.g. "get_vlans") with kwargs,
+        in rounds for as long as some depend on the outputs of earlier ones, and
+        returns the raw outputs by command, to be parsed offline with DellOS6Parser
+        or dellos6_pipeline.ParsePipeline. The commands of a round are independent,
+        see _parallel_commands().
+        """
+        if outputs is None:
+            outputs = {}
+        commands = self.parser.commands(getter, outputs, **kwargs)
+        while commands:
+            with self._parallel_commands(commands):
+                for command in commands:
+                    outputs[command] = self._send_command(command)
+            commands = self.parser.commands(getter, outputs, **kwargs)
+        return outputs
+
+    def _collect(self, getter, outputs=None, **kwargs):
+        """Returns the result of the parser getter over _collect_outputs()."""
+        outputs = self._collect_outputs(getter, outputs, **kwargs)
+        return getattr(self.parser, getter)(outputs, **kwargs)
+
+    def _get_multi(self, getters, max_sessions=None):
+        """
+        Runs several getters concurrently, each on its own session from the session
+        pool (see the max_sessions optional argument), and returns a dict of getter name
+        to result. getters is a list of getter names, or a dict of getter name to a dict
+        of keyword arguments, e.g.::
 
-    def _send_command(self, command):
+            device._get_multi(["get_interfaces", "get_mac_address_table"])
+            device._get_multi({"_get_interfaces": {"fields": ["is_up"]}, "get_vlans": {}})
+        """
+        if not isinstance(getters, dict):
+            getters = {getter: {} for getter in getters}
+
+        def run_getter(session, getter):
+            self._local.device = session
+            try:
+                return getattr(self, getter)(**getters[getter])
+            finally:
+                self._local.device = None
+
+        pool = self._get_session_pool()
+        return dict(pool.map(run_getter, list(getters), max_sessions))
+
+    def _send_command(self, command, device=None):
         """Error handling for self.device.send.command()."""
+        if device is None:
+            prefetched = getattr(self._local, "prefetched", None)
+            if prefetched and command in prefetched:
+                output = prefetched.pop(command)
+                if isinstance(output, CommandErrorException):
+                    raise output
+                return output
+            device = getattr(self._local, "device", None) or self.device
         try:
             error_msg = "Error while executing the command : {} output :: {}"
-            self.device.set_base_prompt()
-            output = self.device.send_command(command)
+            if self.buffered_read:
+                buffer = self._read_command(command, device)
+                output = buffer.text()
+                if buffer.error:
+                    raise CommandErrorException(error_msg.format(command, output))
+                return output
+            device.set_base_prompt()
+            output = device.send_command(command)
             if "% Invalid" in output:
                 raise CommandErrorException(error_msg.format(command, output))
 
@@ -129,109 +374,254 @@ class DellOS6Driver(NetworkDriver):
         except (socket.error, EOFError) as exp:
             raise ConnectionClosedException(str(exp))
 
-    @staticmethod
-    def parse_uptime(uptime_str):
-        """
-        Extract the uptime string from the given Dell OS6 Device.
-        Return the uptime in seconds as an integer
-        """
-        # Initialize to zero
-        (days, hours, minutes, seconds) = (0, 0, 0, 0)
-
-        uptime_str = uptime_str.strip()
-        time_list = re.split(", |:", uptime_str)
-        for element in time_list:
-            if re.search("days", element):
-                days = int(element.strip(" days"))
-            elif re.search("h", element):
-                hours = int(element.strip("h"))
-            elif re.search("m", element):
-                minutes = int(element.strip("m"))
-            elif re.search("s", element):
-                seconds = int(element.strip("s"))
-
-        uptime_sec = (
-            (days * DAY_SECONDS) + (hours * HOUR_SECONDS) + (minutes * 60) + seconds
-        )
-        return uptime_sec
+    def _read_command(self, command, device, timeout=None):
+        """
+        Sends a command and collects its output in an OutputBuffer, which appends the
+        raw bytes read from the SSH channel to a bytearray and looks for the prompt and
+        the error marker in the new data only. Multi-megabyte outputs are then not
+        rebuilt by string concatenation and rescanned on every read.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        buffer = OutputBuffer(device.set_base_prompt())
+        device.write_channel(command + "\n")
+        channel = getattr(device, "remote_conn", None)
+        if not hasattr(channel, "recv_ready"):
+            channel = None
+        deadline = time.time() + timeout
+        while True:
+            if channel is None:
+                chunk = device.read_channel().encode(buffer.encoding)
+            elif channel.recv_ready():
+                chunk = channel.recv(D6C.DELLOS6_READ_CHUNK_SIZE)
+            else:
+                chunk = b""
+            if not chunk:
+                if time.time() > deadline:
+                    raise CommandTimeoutException(
+                        "Timed out waiting for the output of " + command
+                    )
+                time.sleep(0.01)
+                continue
+            deadline = time.time() + timeout
+            if buffer.feed(chunk):
+                return buffer
 
-    @staticmethod
-    def parse_arp_age(arp_age_str):
+    def _stream_command(self, command, device=None, timeout=None):
         """
-        Extract the ARP time string from the given Dell OS6 Device.
-        Return the ARP time in seconds as an integer
+        Sends a command and yields its output line by line as it arrives, rather than
+        waiting for the prompt like _send_command(). Closing the generator before the
+        command has finished aborts it with Ctrl-C.
         """
-        # Initialize to zero
-        (hours, minutes, seconds) = (0, 0, 0)
+        if device is None:
+            device = getattr(self._local, "device", None) or self.device
+        if timeout is None:
+            timeout = self.timeout
+        error_msg = "Error while executing the command : {} output :: {}"
+        try:
+            prompt = device.set_base_prompt()
+            device.write_channel(command + "\n")
+            prompt_regex = re.compile(re.escape(prompt) + r"[>#]\s*$")
+            buffer = ""
+            echoed = False
+            deadline = time.time() + timeout
+            finished = False
+            try:
+                while True:
+                    data = device.read_channel()
+                    if not data:
+                        if time.time() > deadline:
+                            raise CommandTimeoutException(
+                                "Timed out waiting for the output of " + command
+                            )
+                        time.sleep(0.1)
+                        continue
+                    deadline = time.time() + timeout
+                    lines = (buffer + data).split("\n")
+                    buffer = lines.pop()
+                    for line in lines:
+                        if "% Invalid" in line:
+                            raise CommandErrorException(error_msg.format(command, line))
+                        # The first line is the echoed command
+                        if echoed:
+                            yield line.rstrip("\r")
+                        echoed = True
+                    if echoed and prompt_regex.match(buffer.strip()):
+                        finished = True
+                        return
+            finally:
+                if not finished:
+                    device.write_channel("\x03")
+                    device.set_base_prompt()
+        except (socket.error, EOFError) as exp:
+            raise ConnectionClosedException(str(exp))
 
-        arp_age_str = arp_age_str.strip()
-        age_list = re.split(" ", arp_age_str)
-        for element in age_list:
-            if re.search("h", element):
-                hours = int(element.strip("h"))
-            elif re.search("m", element):
-                minutes = int(element.strip("m"))
-            elif re.search("s", element):
-                seconds = int(element.strip("s"))
+    def _textfsm(self, template, raw_output):
+        """Parse ``raw_output`` with a TextFSM template, see DellOS6Parser.parse()."""
+        return self.parser.parse(template, raw_output)
 
-        arp_age_sec = (hours * HOUR_SECONDS) + (minutes * 60) + seconds
-        return arp_age_sec
+    def _get_config_tree(self):
+        """
+        Returns the running-config parsed into a DellOS6Config. The config is only
+        fetched once and reused until _invalidate_config_cache() is called.
+        """
+        if self._config_tree is None:
+            self._config_tree = DellOS6Config(self._send_command("show running-config"))
+        return self._config_tree
+
+    def _invalidate_config_cache(self):
+        """Discard the cached running-config so the next getter fetches it again."""
+        self._config_tree = None
+
+    parse_uptime = staticmethod(parse_uptime)
+    parse_arp_age = staticmethod(parse_arp_age)
+    parse_route_age = staticmethod(parse_route_age)
+
+    def _get_interface_list_outputs(self):
+        """Returns the outputs DellOS6Parser.interface_list() needs."""
+        return {
+            "show interfaces status": self._get_interface_entries(
+                "show interfaces status", "show_interfaces_status"
+            ),
+            "show ip interface": self._send_command("show ip interface"),
+        }
 
     def _get_interface_list(self):
         """
         Returns a list of all interfaces on the device
         """
+        return self.parser.interface_list(self._get_interface_list_outputs())
 
-        raw_show_int_status = self._send_command("show interfaces status")
-        raw_show_ip_int = self._send_command("show ip interface")
-
-        show_int_status = textfsm_extractor(
-            self, "show_interfaces_status", raw_show_int_status
-        )
-        show_ip_int = textfsm_extractor(self, "show_ip_interface", raw_show_ip_int)
+    _short_interface_name = staticmethod(short_interface_name)
+    _is_port = staticmethod(is_port)
 
-        interface_list = []
-        for interface in show_int_status:
-            interface_list.append(
-                canonical_interface_name(
-                    interface["interface"], addl_name_map=dellos6_interfaces
-                )
-            )
-        for interface in show_ip_int:
-            interface_list.append(
-                canonical_interface_name(
-                    interface["interface"], addl_name_map=dellos6_interfaces
-                )
-            )
+    @staticmethod
+    def _call_key(getter, kwargs):
+        """
+        Returns a hashable key for a getter call, also for unhashable arguments such
+        as ``fields=["is_up"]``.
+        """
+        return getter, json.dumps(kwargs, sort_keys=True, default=repr)
 
-        return interface_list
+    def _get_interface_entries(
+        self, command, template, interfaces=None, key="interface"
+    ):
+        """
+        Send ``command`` and return the entries parsed with ``template``, limited to
+        ``interfaces`` if given.
 
-    def _get_interface_dict(self):
+        Up to self.pushdown_threshold ports are queried with the per-interface form of
+        the command ("<command> <interface>"); larger sets, or sets including
+        interfaces which are not ports (e.g. VLANs), use the bulk command and filter
+        its output. Either way, interfaces the device doesn't know are left out.
         """
-        Returns a dict of all interfaces on the device
+        if interfaces is None:
+            if self.stack_mode and command in D6C.DELLOS6_UNIT_COMMANDS:
+                return self._get_stack_entries(command, template)
+            return self._textfsm(template, self._send_command(command))
+
+        wanted = set(self._short_interface_name(name) for name in interfaces)
+        if not wanted:
+            return []
+        if len(wanted) <= self.pushdown_threshold and all(
+            self._is_port(name) for name in wanted
+        ):
+            entries = []
+            for name in sorted(wanted):
+                try:
+                    raw_output = self._send_command("{} {}".format(command, name))
+                except CommandErrorException:
+                    # Unknown ports are left out, as by the bulk command below
+                    continue
+                entries.extend(self._textfsm(template, raw_output))
+        else:
+            entries = self._textfsm(template, self._send_command(command))
+        return [
+            entry
+            for entry in entries
+            if self._short_interface_name(entry[key]) in wanted
+        ]
+
+    @contextmanager
+    def _stack_check(self):
         """
+        Checks the stack membership only once for all the per-unit commands sent in
+        the block, see _get_stack_entries().
+        """
+        if getattr(self._local, "stack_checked", None) is not None:
+            yield
+            return
+        self._local.stack_checked = False
+        try:
+            yield
+        finally:
+            self._local.stack_checked = None
 
-        raw_show_int_status = self._send_command("show interfaces status")
-        raw_show_ip_int = self._send_command("show ip interface")
-
-        show_int_status = textfsm_extractor(
-            self, "show_interfaces_status", raw_show_int_status
+    def _update_stack(self):
+        """
+        Checks the stack membership with "show switch" (once per _stack_check()
+        block) and builds the interface ranges of each unit from the port inventory in
+        "show interfaces status" if the members changed. Returns the raw inventory
+        output if it was sent, else None.
+        """
+        if getattr(self._local, "stack_checked", None):
+            return None
+        show_sw = self._textfsm("show_switch", self._send_command("show switch"))
+        self._stack.update_units(int(switch["switch"]) for switch in show_sw)
+        if getattr(self._local, "stack_checked", None) is False:
+            self._local.stack_checked = True
+        if self._stack.ranges or len(self._stack.units) < 2:
+            return None
+        raw_output = self._send_command("show interfaces status")
+        entries = self._textfsm("show_interfaces_status", raw_output)
+        self._stack.learn(
+            self._short_interface_name(entry["interface"]) for entry in entries
         )
-        show_ip_int = textfsm_extractor(self, "show_ip_interface", raw_show_ip_int)
+        return raw_output
 
-        interface_dict = {}
-        for interface in show_int_status:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            interface_dict[interface_name] = {}
-        for interface in show_ip_int:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            interface_dict[interface_name] = {}
+    def _get_stack_entries(self, command, template):
+        """
+        Stack mode counterpart of sending ``command`` and parsing it with ``template``.
+
+        The per-unit form of the command (D6C.DELLOS6_UNIT_COMMANDS) is sent for the
+        interface ranges of each stack unit, one unit per session from the session
+        pool, and the entries are merged in unit order. The ranges are built from the
+        port inventory of the stack, so they cover the ports which have no entries
+        yet (e.g. in the MAC address table), and again whenever the stack membership
+        in "show switch" changes. Single units and commands whose per-unit form is
+        refused use the bulk command.
+        """
+        # _get_multi() workers already hold sessions of the pool
+        if getattr(self._local, "device", None) is not None:
+            return self._textfsm(template, self._send_command(command))
+        inventory = self._update_stack()
+        if inventory is not None and command == "show interfaces status":
+            return self._textfsm(template, inventory)
+        ranges = self._stack.ranges
+        if not ranges or len(self._stack.units) < 2 or self._stack.is_bulk(command):
+            return self._textfsm(template, self._send_command(command))
+
+        def run_unit(session, unit):
+            entries = []
+            for interface_range in ranges[unit]:
+                raw_output = self._send_command(
+                    D6C.DELLOS6_UNIT_COMMANDS[command].format(interface_range),
+                    device=session,
+                )
+                entries.extend(self._textfsm(template, raw_output))
+            return entries
+
+        try:
+            results = dict(self._get_session_pool().map(run_unit, list(ranges)))
+        except CommandErrorException:
+            # The per-unit form is not supported, keep using the bulk command
+            self._stack.set_bulk(command)
+            return self._textfsm(template, self._send_command(command))
 
-        return interface_dict
+        entries = []
+        for unit in sorted(results, key=lambda unit: (unit is None, unit or 0)):
+            entries.extend(results[unit])
+        return entries
 
     def get_facts(self):
         """
@@ -255,48 +645,45 @@ class DellOS6Driver(NetworkDriver):
             'fqdn': u'dellos6-switch',
             'interface_list': [u'Tengigabitethernet1/0/1', u'out-of-band']
             }
-        """
-        # default values.
-        vendor = u"Dell"
-        uptime = -1
-        model, serial_number, fqdn, os_version, hostname = (self.UNKNOWN,) * 5
 
+        With the facts_cache optional argument, serial number, model, OS version and
+        domain name ("show version", "show switch", "show hosts") and the interface
+        list are kept on disk with the TTLs of D6C.DELLOS6_FACTS_CACHE_TTLS, so a
+        routine call only sends "show system". The cache is dropped when the uptime
+        goes backwards (a reload) or the stack units listed by "show system" change.
+        """
         # obtain output from device
-        raw_show_ver = self._send_command("show version")
-        raw_show_sw = self._send_command("show switch")
-        raw_show_sys = self._send_command("show system")
-        raw_show_hosts = self._send_command("show hosts")
-
-        show_ver = textfsm_extractor(self, "show_version", raw_show_ver)
-        show_sw = textfsm_extractor(self, "show_switch", raw_show_sw)
-        show_sys = textfsm_extractor(self, "show_system-basic", raw_show_sys)
-        show_hosts = textfsm_extractor(self, "show_hosts", raw_show_hosts)
-
-        interface_list = self._get_interface_list()
-
-        uptime = self.parse_uptime(show_sys[0]["uptime"])
-        os_version = ""
-        for switch in show_sw:
-            if switch["status_mgmt"] == "Mgmt Sw":
-                os_version = switch["version"]
-        serial_number = show_ver[0]["serial_num"]
-        model = show_ver[0]["model"]
-        hostname = show_sys[0]["sys_name"]
-        domain_name = show_hosts[0]["domain"]
-
-        if domain_name != "Unknown" and hostname != "Unknown":
-            fqdn = "{}.{}".format(hostname, domain_name)
-
-        return {
-            "uptime": uptime,
-            "vendor": vendor,
-            "os_version": str(os_version),
-            "serial_number": str(serial_number),
-            "model": str(model),
-            "hostname": str(hostname),
-            "fqdn": fqdn,
-            "interface_list": interface_list,
-        }
+        outputs = {"show system": self._send_command("show system")}
+        system = self.parser.system_facts(outputs)
+
+        cache = self._facts_cache
+        static = interface_list = None
+        if cache is not None:
+            cache.validate(system["uptime"], system["units"])
+            static = cache.get("static")
+            interface_list = cache.get("interfaces")
+
+        if static is None:
+            commands = ["show version", "show switch", "show hosts"]
+            with self._parallel_commands(commands):
+                for command in commands:
+                    outputs[command] = self._send_command(command)
+            static = self.parser.static_facts(outputs)
+            if cache is not None:
+                cache.put("static", static)
+        if interface_list is None:
+            interface_list = self._get_interface_list()
+            if cache is not None:
+                cache.put("interfaces", interface_list)
+        if cache is not None:
+            cache.save()
+
+        return self.parser.get_facts(outputs, system, static, interface_list)
+
+    def _invalidate_facts_cache(self):
+        """Discard the cached facts so the next get_facts() fetches everything again."""
+        if self._facts_cache is not None:
+            self._facts_cache.clear()
 
     def get_interfaces(self):
         """
@@ -354,106 +741,64 @@ class DellOS6Driver(NetworkDriver):
                 }
             }
         """
+        return self._get_interfaces()
 
-        # default values.
-        last_flapped = -1.0
-
-        raw_show_int_status = self._send_command("show interfaces status")
-        raw_show_ip_int = self._send_command("show ip interface")
-        raw_show_switch_stack_ports = self._send_command("show switch stack-ports")
-        raw_show_int_config = self._send_command("show interfaces configuration")
-        raw_show_int = self._send_command("show interfaces")
-        raw_show_int_desc = self._send_command("show interfaces description")
-
-        show_int_status = textfsm_extractor(
-            self, "show_interfaces_status", raw_show_int_status
-        )
-        show_ip_int = textfsm_extractor(self, "show_ip_interface", raw_show_ip_int)
-        show_switch_stack_ports = textfsm_extractor(
-            self, "show_switch_stack-ports", raw_show_switch_stack_ports
-        )
-        show_int_config = textfsm_extractor(
-            self, "show_interfaces_configuration", raw_show_int_config
-        )
-        show_int = textfsm_extractor(self, "show_interfaces", raw_show_int)
-        show_int_desc = textfsm_extractor(
-            self, "show_interfaces_description", raw_show_int_desc
-        )
+    def _get_interfaces(self, fields=None, interfaces=None):
+        """
+        get_interfaces() limited to some keys and interfaces.
+
+        If fields is given (e.g. ["is_up", "description"]), only those keys are returned
+        and only the commands they need are sent, see
+        D6C.DELLOS6_INTERFACE_FIELD_COMMANDS. "show interfaces" is the largest output and
+        is only needed for mac_address.
+        If interfaces is given, only those interfaces are returned. Small sets of ports
+        are queried with the per-interface commands, see _get_interface_entries().
+        """
 
-        interface_dict = {}
-        for interface in show_int_status:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            if re.search("down", interface["link_state"], re.IGNORECASE):
-                is_up = False
-            if re.search("up", interface["link_state"], re.IGNORECASE):
-                is_up = True
-            interface_dict[interface_name] = {"is_up": is_up}
-        for interface in show_ip_int:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            if re.search("down", interface["link_state"], re.IGNORECASE):
-                is_up = False
-            if re.search("up", interface["link_state"], re.IGNORECASE):
-                is_up = True
-            # SVIs cannot be administratively disabled
-            is_enabled = True
-            interface_dict[interface_name] = {"is_up": is_up, "is_enabled": is_enabled}
-        # Set some defaults
-        for interface in interface_dict:
-            interface_dict[interface]["description"] = ""
-            interface_dict[interface]["last_flapped"] = last_flapped
-            interface_dict[interface]["mtu"] = 1500
-            interface_dict[interface]["mac_address"] = ""
-            interface_dict[interface]["speed"] = -1
-        for interface in show_switch_stack_ports:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            if re.search("link down", interface["link_state"], re.IGNORECASE):
-                is_up = False
-            if re.search("link up", interface["link_state"], re.IGNORECASE):
-                is_up = True
-            speed = -1
-            if interface["speed"].isdigit():
-                # Speed is reported in Gbps
-                speed = int(interface["speed"]) * 1000
-            interface_dict[interface_name]["is_up"] = is_up
-            interface_dict[interface_name]["speed"] = speed
-        for interface in show_int_config:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            if interface_name in interface_dict:
-                if re.search("down", interface["admin_state"], re.IGNORECASE):
-                    is_enabled = False
-                if re.search("up", interface["admin_state"], re.IGNORECASE):
-                    is_enabled = True
-                if interface["speed"].isdigit():
-                    interface_dict[interface_name]["speed"] = int(interface["speed"])
-                if not interface["mtu"].isdigit():
-                    mtu = -1
-                else:
-                    mtu = int(interface["mtu"])
-                interface_dict[interface_name]["is_enabled"] = is_enabled
-                interface_dict[interface_name]["mtu"] = mtu
-        for interface in show_int_desc:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            if interface_name in interface_dict:
-                interface_dict[interface_name]["description"] = interface["desc"]
-        for interface in show_int:
-            interface_name = canonical_interface_name(
-                interface["interface"], addl_name_map=dellos6_interfaces
-            )
-            interface_dict[interface_name]["mac_address"] = mac(
-                interface["mac_address"]
-            )
+        commands = self.parser.interfaces_commands(fields)
+        ports = routed = None
+        if interfaces is not None:
+            ports = [name for name in interfaces if self._is_port(name)]
+            routed = [name for name in interfaces if not self._is_port(name)]
+
+        prefetch = []
+        if interfaces is None:
+            prefetch = self._bulk_commands(commands)
+        if self.config_cache:
+            # Descriptions come from the cached running-config
+            prefetch = [c for c in prefetch if c != "show interfaces description"]
+        with self._parallel_commands(prefetch):
+            outputs = {
+                "show interfaces status": self._get_interface_entries(
+                    "show interfaces status", "show_interfaces_status", ports
+                ),
+                "show ip interface": self._get_interface_entries(
+                    "show ip interface", "show_ip_interface", routed
+                ),
+            }
+            if "show switch stack-ports" in commands:
+                outputs["show switch stack-ports"] = []
+                if ports != []:
+                    outputs["show switch stack-ports"] = self._send_command(
+                        "show switch stack-ports"
+                    )
+            for command, template in (
+                ("show interfaces configuration", "show_interfaces_configuration"),
+                ("show interfaces", "show_interfaces"),
+                ("show interfaces description", "show_interfaces_description"),
+            ):
+                if command not in commands:
+                    continue
+                if command == "show interfaces description" and self.config_cache:
+                    descriptions = self._get_config_tree().interface_descriptions()
+                    outputs[command] = [
+                        {"interface": short_interface_name(interface), "desc": desc}
+                        for interface, desc in descriptions.items()
+                    ]
+                    continue
+                outputs[command] = self._get_interface_entries(command, template, ports)
 
-        return interface_dict
+        return self.parser.get_interfaces(outputs, fields, interfaces)
 
     def get_lldp_neighbors(self):
         """
@@ -497,39 +842,10 @@ class DellOS6Driver(NetworkDriver):
                 ]
             }
         """
+        if self.lldp_probe:
+            return self._get_lldp_probed("get_lldp_neighbors")
 
-        raw_show_lldp_remote_device_all = self._send_command(
-            "show lldp remote-device all"
-        )
-
-        show_lldp_remote_device_all = textfsm_extractor(
-            self, "show_lldp_remote-device_all", raw_show_lldp_remote_device_all
-        )
-
-        lldp = {}
-        for lldp_entry in show_lldp_remote_device_all:
-            interface = canonical_interface_name(
-                lldp_entry["interface"], addl_name_map=dellos6_interfaces
-            )
-            lldp[interface] = []
-            hostname = lldp_entry["host_name"]
-            if not hostname:
-                hostname = lldp_entry["chassis_id"]
-            else:
-                if hostname.rfind("...", (len(hostname) - 2), len(hostname)):
-                    raw_show_lldp_remote_device_detail = self._send_command(
-                        "show lldp remote-device detail " + lldp_entry["interface"]
-                    )
-                    show_lldp_remote_device_detail = textfsm_extractor(
-                        self,
-                        "show_lldp_remote-device_detail",
-                        raw_show_lldp_remote_device_detail,
-                    )
-                    hostname = show_lldp_remote_device_detail[0]["host_name"]
-            lldp_dict = {"port": lldp_entry["port_id"], "hostname": hostname}
-            lldp[interface].append(lldp_dict)
-
-        return lldp
+        return self._collect("get_lldp_neighbors")
 
     def get_bgp_neighbors(self):
         """
@@ -583,81 +899,55 @@ class DellOS6Driver(NetworkDriver):
                 }
         """
 
-        raw_show_ip_bgp_summary = self._send_command("show ip bgp summary")
-        raw_show_ip_bgp_neighbors = self._send_command("show ip bgp neighbors")
-        raw_show_bgp_ipv6_neighbors = self._send_command("show bgp ipv6 neighbors")
+        return self._collect("get_bgp_neighbors")
 
-        show_ip_bgp_summary = textfsm_extractor(
-            self, "show_ip_bgp_summary", raw_show_ip_bgp_summary
-        )
-        show_ip_bgp_neighbors = textfsm_extractor(
-            self, "show_ip_bgp_neighbors", raw_show_ip_bgp_neighbors
-        )
-        show_bgp_ipv6_neighbors = textfsm_extractor(
-            self, "show_bgp_ipv6_neighbors", raw_show_bgp_ipv6_neighbors
+    def get_bgp_neighbors_detail(self, neighbor_address=""):
+        """
+        Returns a detailed view of the BGP neighbors as a dictionary of lists, keyed by
+        VRF (only "global" on OS6) and then by remote AS number.
+
+        The counters are taken from "show ip bgp neighbors" and "show bgp ipv6
+        neighbors"; timers not reported by the device fall back to the global defaults
+        from "show ip bgp summary". Prefix counts are summed over both address families.
+        """
+        return self._collect(
+            "get_bgp_neighbors_detail", neighbor_address=neighbor_address
         )
 
-        router_id = show_ip_bgp_summary[0]["bgp_router_id"]
-        local_as = int(show_ip_bgp_summary[0]["local_as"])
-        bgp_neighbors = {"global": {"router_id": router_id, "peers": {}}}
-        for neighbor in show_ip_bgp_neighbors:
-            peer_addr = neighbor["peer_addr"]
-            bgp_neighbors["global"]["peers"][peer_addr] = {
-                "local_as": local_as,
-                "remote_as": int(neighbor["peer_as"]),
-                "remote_id": neighbor["peer_id"],
-                "is_up": (neighbor["peer_state"] == "ESTABLISHED"),
-                "is_enabled": (neighbor["peer_status_admin"] == "START"),
-                "description": "",
-                "uptime": -1,
-                "address_family": {},
-            }
-            if neighbor["ipv4_ucast"] != "None":
-                bgp_neighbors["global"]["peers"][peer_addr]["address_family"][
-                    "ipv4"
-                ] = {
-                    "sent_prefixes": int(neighbor["ipv4_pfx_adv_tx"]),
-                    "accepted_prefixes": int(neighbor["ipv4_pfx_current_rx"]),
-                    "received_prefixes": int(neighbor["ipv4_pfx_adv_rx"]),
-                }
-            if neighbor["ipv6_ucast"] != "None":
-                bgp_neighbors["global"]["peers"][peer_addr]["address_family"][
-                    "ipv6"
-                ] = {
-                    "sent_prefixes": int(neighbor["ipv6_pfx_adv_tx"]),
-                    "accepted_prefixes": int(neighbor["ipv6_pfx_current_rx"]),
-                    "received_prefixes": int(neighbor["ipv6_pfx_adv_rx"]),
-                }
-        for neighbor in show_bgp_ipv6_neighbors:
-            peer_addr = neighbor["peer_addr"]
-            bgp_neighbors["global"]["peers"][peer_addr] = {
-                "local_as": local_as,
-                "remote_as": int(neighbor["peer_as"]),
-                "remote_id": neighbor["peer_id"],
-                "is_up": (neighbor["peer_state"] == "ESTABLISHED"),
-                "is_enabled": (neighbor["peer_status_admin"] == "START"),
-                "description": neighbor["desc"],
-                "uptime": -1,
-                "address_family": {},
-            }
-            if neighbor["ipv4_ucast"] != "None":
-                bgp_neighbors["global"]["peers"][peer_addr]["address_family"][
-                    "ipv4"
-                ] = {
-                    "sent_prefixes": int(neighbor["ipv4_pfx_adv_tx"]),
-                    "accepted_prefixes": int(neighbor["ipv4_pfx_current_rx"]),
-                    "received_prefixes": int(neighbor["ipv4_pfx_adv_rx"]),
-                }
-            if neighbor["ipv6_ucast"] != "None":
-                bgp_neighbors["global"]["peers"][peer_addr]["address_family"][
-                    "ipv6"
-                ] = {
-                    "sent_prefixes": int(neighbor["ipv6_pfx_adv_tx"]),
-                    "accepted_prefixes": int(neighbor["ipv6_pfx_current_rx"]),
-                    "received_prefixes": int(neighbor["ipv6_pfx_adv_rx"]),
-                }
+    def _iter_bgp_routes(
+        self, neighbor_address="", direction="received", address_family="ipv4"
+    ):
+        """
+        Iterate over the BGP table, or over the routes received from/advertised to a
+        single neighbor, without buffering the whole output.
 
-        return bgp_neighbors
+        The output is read from the device and parsed line by line, so memory use does
+        not grow with the size of the table. Yields route dicts as returned by
+        BGPRouteParser (prefix, next_hop, metric, local_pref, as_path, origin, valid,
+        best, internal).
+
+        :param neighbor_address: peer to show the routes of (the whole table if empty)
+        :param direction: "received" or "advertised" (only used with neighbor_address)
+        :param address_family: "ipv4" or "ipv6"
+        """
+        if direction not in ("received", "advertised"):
+            raise ValueError("direction must be 'received' or 'advertised'")
+        if address_family == "ipv4":
+            command = "show ip bgp"
+        elif address_family == "ipv6":
+            command = "show bgp ipv6"
+        else:
+            raise ValueError("address_family must be 'ipv4' or 'ipv6'")
+        if neighbor_address:
+            command += " neighbors {} {}-routes".format(neighbor_address, direction)
+
+        parser = BGPRouteParser()
+        lines = self._stream_command(command)
+        try:
+            for route in parser.parse(lines):
+                yield route
+        finally:
+            lines.close()
 
     def get_environment(self):
         """
@@ -682,66 +972,7 @@ class DellOS6Driver(NetworkDriver):
             * cpu hard-coded to cpu0 (i.e. only a single CPU)
         """
 
-        raw_show_sys = self._send_command("show system")
-        raw_show_proc_cpu = self._send_command("show process cpu")
-
-        show_sys_fans = textfsm_extractor(self, "show_system-fans", raw_show_sys)
-        show_sys_temps = textfsm_extractor(self, "show_system-temps", raw_show_sys)
-        show_sys_power = textfsm_extractor(
-            self, "show_system-power_supplies", raw_show_sys
-        )
-        show_proc_cpu = textfsm_extractor(self, "show_process_cpu", raw_show_proc_cpu)
-
-        environment = {}
-        environment.setdefault("fans", {})
-        environment.setdefault("temperature", {})
-        environment.setdefault("power", {})
-        environment.setdefault("cpu", {})
-        environment.setdefault("memory", {})
-
-        for fan in show_sys_fans:
-            environment["fans"].setdefault(
-                "unit " + fan["unit"] + " " + fan["description"], {}
-            )
-            if fan["status"] == "OK":
-                environment["fans"]["unit " + fan["unit"] + " " + fan["description"]][
-                    "status"
-                ] = True
-            else:
-                environment["fans"]["unit " + fan["unit"] + " " + fan["description"]][
-                    "status"
-                ] = False
-        for temp in show_sys_temps:
-            environment["temperature"].setdefault(
-                "unit " + temp["unit"] + " " + temp["description"], {}
-            )
-            environment["temperature"][
-                "unit " + temp["unit"] + " " + temp["description"]
-            ] = {
-                "temperature": float(temp["temp"]),
-                "is_alert": False,
-                "is_critical": False,
-            }
-        for power in show_sys_power:
-            environment["power"].setdefault(
-                "unit " + power["unit"] + " " + power["description"], {}
-            )
-            environment["power"][
-                "unit " + power["unit"] + " " + power["description"]
-            ] = {"status": False, "capacity": -1.0, "output": float(power["pwr_cur"])}
-            if power["status"] == "OK":
-                environment["power"][
-                    "unit " + power["unit"] + " " + power["description"]
-                ]["status"] = True
-        environment["cpu"][0] = {}
-        environment["cpu"][0]["%usage"] = 0.0
-        environment["cpu"][0]["%usage"] = float(show_proc_cpu[0]["cpu_60"])
-        environment["memory"] = {
-            "available_ram": int(show_proc_cpu[0]["mem_free"]) * 1024,
-            "used_ram": int(show_proc_cpu[0]["mem_alloc"]) * 1024,
-        }
-
-        return environment
+        return self._collect("get_environment")
 
     def get_interfaces_counters(self):
         """
@@ -804,128 +1035,51 @@ class DellOS6Driver(NetworkDriver):
                      'rx_unicast_packets': 0
                 }
             }
+        With the snmp_counters optional argument, the counters are read from the IF-MIB
+        over SNMP instead, see dellos6_snmp.interface_counters(). Only the interface
+        list is then read from the CLI.
         """
+        return self._get_interfaces_counters()
 
-        interface_list = self._get_interface_list()
-
-        raw_show_int_count = self._send_command("show interfaces counters")
-        raw_show_int_count_err = self._send_command("show interfaces counters errors")
-
-        show_int_count = textfsm_extractor(
-            self, "show_interfaces_counters", raw_show_int_count
-        )
-        show_int_count_err = textfsm_extractor(
-            self, "show_interfaces_counters_errors", raw_show_int_count_err
-        )
+    def _get_interfaces_counters(self, interfaces=None):
+        """
+        get_interfaces_counters() limited to some interfaces: only the counters of
+        those interfaces are fetched (see _get_interface_entries()) and returned.
+        """
+        if self.snmp_counters:
+            if interfaces is None:
+                # The interfaces of the CLI backend, rather than every ifIndex (CPU,
+                # all the VLANs, ...)
+                interfaces = self._get_interface_list()
+            else:
+                interfaces = [
+                    canonical_interface_name(
+                        self._short_interface_name(interface),
+                        addl_name_map=dellos6_interfaces,
+                    )
+                    for interface in interfaces
+                ]
+            return interface_counters(self._get_snmp_walker(), interfaces)
 
-        int_counters = {}
-        for int_list in interface_list:
-
-            int_counters[int_list] = {
-                "tx_errors": -1,
-                "rx_errors": -1,
-                "tx_discards": -1,
-                "rx_discards": -1,
-                "tx_octets": -1,
-                "rx_octets": -1,
-                "tx_unicast_packets": -1,
-                "rx_unicast_packets": -1,
-                "tx_multicast_packets": -1,
-                "rx_multicast_packets": -1,
-                "tx_broadcast_packets": -1,
-                "rx_broadcast_packets": -1,
-            }
+        prefetch = []
+        if interfaces is None:
+            prefetch = self._bulk_commands(
+                self.parser.commands("get_interfaces_counters")
+            )
+        with self._stack_check(), self._parallel_commands(prefetch):
+            outputs = {}
+            if interfaces is None:
+                outputs = self._get_interface_list_outputs()
+            outputs["show interfaces counters"] = self._get_interface_entries(
+                "show interfaces counters", "show_interfaces_counters", interfaces
+            )
+            outputs["show interfaces counters errors"] = self._get_interface_entries(
+                "show interfaces counters errors",
+                "show_interfaces_counters_errors",
+                interfaces,
+            )
 
-            for int_count_err in show_int_count_err:
-                interface_name = canonical_interface_name(
-                    int_count_err["interface"], addl_name_map=dellos6_interfaces
-                )
-                if interface_name == int_list:
-                    if (
-                        int_count_err["out_total"].isdigit()
-                        and int(int_count_err["out_total"]) >= 0
-                    ):
-                        int_counters[int_list]["tx_errors"] = int(
-                            int_count_err["out_total"]
-                        )
-                    if (
-                        int_count_err["in_total"].isdigit()
-                        and int(int_count_err["in_total"]) >= 0
-                    ):
-                        int_counters[int_list]["rx_errors"] = int(
-                            int_count_err["in_total"]
-                        )
-                    if (
-                        int_count_err["out_discard"].isdigit()
-                        and int(int_count_err["out_discard"]) >= 0
-                    ):
-                        int_counters[int_list]["tx_discards"] = int(
-                            int_count_err["out_discard"]
-                        )
-
-            for int_count in show_int_count:
-                interface_name = canonical_interface_name(
-                    int_count["interface"], addl_name_map=dellos6_interfaces
-                )
-                if interface_name == int_list:
-                    if (
-                        int_count["out_total_octs"].isdigit()
-                        and int(int_count["out_total_octs"]) >= 0
-                    ):
-                        int_counters[int_list]["tx_octets"] = int(
-                            int_count["out_total_octs"]
-                        )
-                    if (
-                        int_count["in_total_octs"].isdigit()
-                        and int(int_count["in_total_octs"]) >= 0
-                    ):
-                        int_counters[int_list]["rx_octets"] = int(
-                            int_count["in_total_octs"]
-                        )
-                    if (
-                        int_count["out_ucast_pkts"].isdigit()
-                        and int(int_count["out_ucast_pkts"]) >= 0
-                    ):
-                        int_counters[int_list]["tx_unicast_packets"] = int(
-                            int_count["out_ucast_pkts"]
-                        )
-                    if (
-                        int_count["in_ucast_pkts"].isdigit()
-                        and int(int_count["in_ucast_pkts"]) >= 0
-                    ):
-                        int_counters[int_list]["rx_unicast_packets"] = int(
-                            int_count["in_ucast_pkts"]
-                        )
-                    if (
-                        int_count["out_mcast_pkts"].isdigit()
-                        and int(int_count["out_mcast_pkts"]) >= 0
-                    ):
-                        int_counters[int_list]["tx_multicast_packets"] = int(
-                            int_count["out_mcast_pkts"]
-                        )
-                    if (
-                        int_count["in_mcast_pkts"].isdigit()
-                        and int(int_count["in_mcast_pkts"]) >= 0
-                    ):
-                        int_counters[int_list]["rx_multicast_packets"] = int(
-                            int_count["in_mcast_pkts"]
-                        )
-                    if (
-                        int_count["out_bcast_pkts"].isdigit()
-                        and int(int_count["out_bcast_pkts"]) >= 0
-                    ):
-                        int_counters[int_list]["tx_broadcast_packets"] = int(
-                            int_count["out_bcast_pkts"]
-                        )
-                    if (
-                        int_count["in_bcast_pkts"].isdigit()
-                        and int(int_count["in_bcast_pkts"]) >= 0
-                    ):
-                        int_counters[int_list]["rx_broadcast_packets"] = int(
-                            int_count["in_bcast_pkts"]
-                        )
-
-        return int_counters
+        return self.parser.get_interfaces_counters(outputs, interfaces)
 
     def get_lldp_neighbors_detail(self, interface=""):
         """
@@ -968,69 +1122,56 @@ class DellOS6Driver(NetworkDriver):
                 ]
             }
         """
-        raw_show_lldp_remote_device_all = self._send_command(
-            "show lldp remote-device all"
-        )
-
-        show_lldp_remote_device_all = textfsm_extractor(
-            self, "show_lldp_remote-device_all", raw_show_lldp_remote_device_all
-        )
-
-        lldp = {}
-        for lldp_entry in show_lldp_remote_device_all:
-            interface = canonical_interface_name(
-                lldp_entry["interface"], addl_name_map=dellos6_interfaces
-            )
-            lldp[interface] = {}
-            raw_show_lldp_remote_device_detail = self._send_command(
-                "show lldp remote-device detail " + lldp_entry["interface"]
+        if self.lldp_probe:
+            return self._get_lldp_probed(
+                "get_lldp_neighbors_detail", interface=interface
             )
-            show_lldp_remote_device_detail = textfsm_extractor(
-                self,
-                "show_lldp_remote-device_detail",
-                raw_show_lldp_remote_device_detail,
+        return self._collect("get_lldp_neighbors_detail", interface=interface)
+
+    def _get_lldp_probed(self, getter, **kwargs):
+        """
+        Runs an LLDP getter with the lldp_probe optional argument: "show lldp
+        statistics" is read first, and while its insert, delete, drop and ageout
+        counters are unchanged the previous result is returned from the probe cache.
+        Otherwise "show lldp remote-device all" is fetched again, and the detail only
+        for the ports whose summary row changed. driver.probe_cache.stats() reports
+        how often the full fetch was avoided.
+        """
+        cache = self.probe_cache
+        key = self._call_key(getter, kwargs)
+        try:
+            probe = self.parser.lldp_statistics(
+                {"show lldp statistics": self._send_command("show lldp statistics")}
             )
-            # We don't yet support reporting the parent interface
-            parent_interface = ""
-            remote_chassis_id = lldp_entry["chassis_id"]
-            remote_system_name = show_lldp_remote_device_detail[0]["host_name"]
-            remote_port = show_lldp_remote_device_detail[0]["port_id"]
-            remote_port_description = show_lldp_remote_device_detail[0]["port_desc"]
-            remote_system_description = show_lldp_remote_device_detail[0]["sys_desc"]
-            if show_lldp_remote_device_detail[0]["sys_cap_sup"]:
-                remote_system_capab = (
-                    show_lldp_remote_device_detail[0]["sys_cap_sup"]
-                    .replace(" ", "")
-                    .split(",")
-                )
-            else:
-                remote_system_capab = []
-            if show_lldp_remote_device_detail[0]["sys_cap_oper"]:
-                remote_system_enable_capab = (
-                    show_lldp_remote_device_detail[0]["sys_cap_oper"]
-                    .replace(" ", "")
-                    .split(",")
-                )
-            else:
-                remote_system_enable_capab = []
-
-            entry_list = []
-            entry = {
-                "parent_interface": parent_interface,
-                "remote_chassis_id": remote_chassis_id,
-                "remote_system_name": remote_system_name,
-                "remote_port": remote_port,
-                "remote_port_description": remote_port_description,
-                "remote_system_description": remote_system_description,
-                "remote_system_capab": remote_system_capab,
-                "remote_system_enable_capab": remote_system_enable_capab,
+        except CommandErrorException:
+            # Without statistics, fetch the neighbors as usual
+            probe = None
+        if probe is not None:
+            result = cache.get(key, probe)
+            if result is not None:
+                return result
+
+        summary = "show lldp remote-device all"
+        outputs = {summary: self._send_command(summary)}
+        previous = cache.outputs(key)
+        partial = False
+        if summary in previous:
+            template = "show_lldp_remote-device_all"
+            rows = {
+                row["interface"]: row
+                for row in self.parser.parse(template, previous[summary])
             }
-            entry_list.append(entry)
-            lldp[interface] = entry_list
-
-        return lldp
+            for row in self.parser.parse(template, outputs[summary]):
+                command = "show lldp remote-device detail " + row["interface"]
+                if rows.get(row["interface"]) == row and command in previous:
+                    outputs[command] = previous[command]
+                    partial = True
+        outputs = self._collect_outputs(getter, outputs, **kwargs)
+        result = getattr(self.parser, getter)(outputs, **kwargs)
+        cache.put(key, probe, result, outputs, partial)
+        return result
 
-    def cli(self, commands):
+    def cli(self, commands, encoding="text"):
 
         """
         Will execute a list of commands and return the output in a dictionary format.
@@ -1054,6 +1195,9 @@ class DellOS6Driver(NetworkDriver):
             }
         """
 
+        if encoding != "text":
+            raise NotImplementedError("{} is not a supported encoding".format(encoding))
+
         cli_output = dict()
         if type(commands) is not list:
             raise TypeError("Please enter a valid list of commands!")
@@ -1093,29 +1237,65 @@ class DellOS6Driver(NetworkDriver):
                 }
             ]
         """
-        if vrf:
-            command = "show arp vrf {}".format(vrf)
-        else:
-            command = "show arp"
-
-        raw_show_arp = self._send_command(command)
+        if "get_arp_table" in self.table_probes:
+            return self._get_table_probed(
+                "get_arp_table", lambda: self._get_arp_table(vrf), vrf=vrf
+            )
+        return self._get_arp_table(vrf)
+
+    def _get_arp_table(self, vrf=""):
+        outputs = None
+        if not vrf:
+            # The tables of the VRFs are independent and can be large, so they are
+            # read concurrently over the session pool, also without parallel_commands
+            outputs = {"show ip vrf": self._send_command("show ip vrf")}
+            commands = self.parser.commands("get_arp_table", outputs)
+            with self._parallel_commands(commands, always=True):
+                for command in commands:
+                    outputs[command] = self._send_command(command)
+        return self._collect("get_arp_table", outputs, vrf=vrf)
+
+    def _iter_arp_table(self, vrf="", interface="", vlan=None):
+        """
+        Iterate over the ARP table like get_arp_table(), without buffering the whole
+        output: the entries are parsed while "show arp" is read from the device, so
+        memory use does not grow with the size of the table. The tables of all VRFs
+        are read one after the other if vrf is empty.
 
-        show_arp = textfsm_extractor(self, "show_arp", raw_show_arp)
+        The interface and VLAN filters are sent to the device with "| include", and
+        the entries of other interfaces which match it are skipped.
 
-        arp_table = []
-        for entry in show_arp:
-            arp_table.append(
-                {
-                    "interface": canonical_interface_name(
-                        entry["interface"], addl_name_map=dellos6_interfaces
-                    ),
-                    "mac": mac(entry["mac_address"]),
-                    "ip": entry["ip_address"],
-                    "age": float(self.parse_arp_age(entry["age"])),
-                }
-            )
+        :param vrf: VRF name (all VRFs if empty)
+        :param interface: only the entries of this interface, e.g. "Vl10"
+        :param vlan: only the entries of the routing interface of this VLAN
+        """
+        interface, output_filter = self._neighbor_filter(interface, vlan)
+        if vrf:
+            vrfs = [vrf]
+        else:
+            vrfs = self.parser.vrfs({"show ip vrf": self._send_command("show ip vrf")})
+        for name in vrfs:
+            parser = ARPTableParser(interface)
+            lines = self._stream_command(self.parser.arp_command(name) + output_filter)
+            try:
+                for entry in parser.parse(lines):
+                    yield entry
+            finally:
+                lines.close()
 
-        return arp_table
+    @staticmethod
+    def _neighbor_filter(interface="", vlan=None):
+        """
+        Return the interface to keep the ARP or IPv6 neighbor entries of, and the
+        output filter which selects its lines on the device.
+        """
+        if vlan is not None:
+            if interface:
+                raise ValueError("interface and vlan are mutually exclusive")
+            interface = "Vl{}".format(int(vlan))
+        if not interface:
+            return "", ""
+        return interface, " | include {}".format(short_interface_name(interface))
 
     def get_ntp_peers(self):
 
@@ -1132,17 +1312,7 @@ class DellOS6Driver(NetworkDriver):
             }
         """
 
-        raw_show_sntp_status = self._send_command("show sntp status")
-
-        show_sntp_status = textfsm_extractor(
-            self, "show_sntp_status", raw_show_sntp_status
-        )
-
-        ntp_peers = {}
-        for peer in show_sntp_status:
-            ntp_peers[peer["server_ip"]] = {}
-
-        return ntp_peers
+        return self._collect("get_ntp_peers")
 
     def get_ntp_servers(self):
 
@@ -1159,17 +1329,10 @@ class DellOS6Driver(NetworkDriver):
             }
         """
 
-        raw_show_sntp_server = self._send_command("show sntp server")
-
-        show_sntp_server = textfsm_extractor(
-            self, "show_sntp_server", raw_show_sntp_server
-        )
-
-        ntp_servers = {}
-        for server in show_sntp_server:
-            ntp_servers[server["server_ip"]] = {}
+        if self.config_cache:
+            return self._get_config_tree().ntp_servers()
 
-        return ntp_servers
+        return self._collect("get_ntp_servers")
 
     def get_ntp_stats(self):
 
@@ -1204,44 +1367,7 @@ class DellOS6Driver(NetworkDriver):
             ]
         """
 
-        raw_show_sntp_stats = self._send_command("show sntp server")
-
-        show_sntp_stats = textfsm_extractor(
-            self, "show_sntp_server", raw_show_sntp_stats
-        )
-
-        ntp_stats = []
-        for server in show_sntp_stats:
-            if server["status"] == "Success":
-                synchronized = True
-            else:
-                synchronized = False
-            ntp_stats.append(
-                {
-                    "remote": server["server_ip"],
-                    # Not supported
-                    "referenceid": "",
-                    "synchronized": synchronized,
-                    # Not supported
-                    "stratum": -1,
-                    # We only support parsing unicast servers right now
-                    "type": "u",
-                    # We don't support parsing this right now
-                    "when": "",
-                    # Not supported
-                    "hostpoll": -1,
-                    # Not supported
-                    "reachability": -1,
-                    # Not supported
-                    "delay": -0.0,
-                    # Not supported
-                    "offset": -0.0,
-                    # Not supported
-                    "jitter": -0.0,
-                }
-            )
-
-        return ntp_stats
+        return self._collect("get_ntp_stats")
 
     def get_interfaces_ip(self):
 
@@ -1293,99 +1419,7 @@ class DellOS6Driver(NetworkDriver):
             }
         """
 
-        raw_show_ip_int = self._send_command("show ip interface")
-        raw_show_ip_int_oob = self._send_command("show ip interface out-of-band")
-        raw_show_ipv6_int = self._send_command("show ipv6 interface")
-        raw_show_ipv6_int_oob = self._send_command("show ipv6 interface out-of-band")
-
-        show_ip_int = textfsm_extractor(self, "show_ip_interface", raw_show_ip_int)
-        show_ip_int_oob = textfsm_extractor(
-            self, "show_ip_interface_out-of-band", raw_show_ip_int_oob
-        )
-        show_ipv6_int = textfsm_extractor(
-            self, "show_ipv6_interface", raw_show_ipv6_int
-        )
-        show_ipv6_int_oob = textfsm_extractor(
-            self, "show_ipv6_interface_out-of-band", raw_show_ipv6_int_oob
-        )
-
-        interfaces_ip = {}
-        for int in show_ip_int:
-            interface = canonical_interface_name(
-                int["interface"], addl_name_map=dellos6_interfaces
-            )
-            raw_show_ip_int_vlan = self._send_command("show ip interface " + interface)
-            show_ip_int_vlan = textfsm_extractor(
-                self, "show_ip_interface_vlan", raw_show_ip_int_vlan
-            )
-            for vlan_int in show_ip_int_vlan:
-                if vlan_int["ip_addr_pri"]:
-                    interfaces_ip.setdefault(interface, {})
-                    interfaces_ip[interface].setdefault("ipv4", {})
-                    ip_address = str(IPv4Interface(vlan_int["ip_addr_pri"]).ip)
-                    prefix_len = IPv4Interface(
-                        vlan_int["ip_addr_pri"]
-                    ).network.prefixlen
-                    interfaces_ip[interface]["ipv4"][ip_address] = {
-                        "prefix_length": prefix_len
-                    }
-                if vlan_int["ip_addr_sec"]:
-                    for ip in vlan_int["ip_addr_sec"]:
-                        ip_address = str(IPv4Interface(ip).ip)
-                        prefix_len = IPv4Interface(ip).network.prefixlen
-                        interfaces_ip[interface]["ipv4"][ip_address] = {
-                            "prefix_length": prefix_len
-                        }
-
-        for int in show_ipv6_int:
-            interface = canonical_interface_name(
-                int["interface"], addl_name_map=dellos6_interfaces
-            )
-            raw_show_ipv6_int_vlan = self._send_command(
-                "show ipv6 interface " + interface
-            )
-            show_ipv6_int_vlan = textfsm_extractor(
-                self, "show_ipv6_interface_vlan", raw_show_ipv6_int_vlan
-            )
-            for vlan_int in show_ipv6_int_vlan:
-                if vlan_int["ipv6_pfx"]:
-                    interfaces_ip.setdefault(interface, {})
-                    interfaces_ip[interface].setdefault("ipv6", {})
-                    for ipv6 in vlan_int["ipv6_pfx"]:
-                        ipv6_address = str(IPv6Interface(ipv6).ip)
-                        prefix_len = IPv6Interface(ipv6).network.prefixlen
-                        interfaces_ip[interface]["ipv6"][ipv6_address] = {
-                            "prefix_length": prefix_len
-                        }
-
-        if show_ip_int_oob[0]["ip_addr"]:
-            interfaces_ip.setdefault("out-of-band", {})
-            interfaces_ip["out-of-band"].setdefault("ipv4", {})
-            ip_address = show_ip_int_oob[0]["ip_addr"]
-            prefix_len = IPv4Interface(
-                show_ip_int_oob[0]["ip_addr"] + "/" + show_ip_int_oob[0]["subnet_mask"]
-            ).network.prefixlen
-            interfaces_ip["out-of-band"]["ipv4"][ip_address] = {
-                "prefix_length": prefix_len
-            }
-            raw_show_ipv6_int_vlan = self._send_command(
-                "show ipv6 interface " + interface
-            )
-            show_ipv6_int_vlan = textfsm_extractor(
-                self, "show_ipv6_interface_vlan", raw_show_ipv6_int_vlan
-            )
-
-        if show_ipv6_int_oob[0]["ipv6_pfx"]:
-            interfaces_ip.setdefault("out-of-band", {})
-            interfaces_ip["out-of-band"].setdefault("ipv6", {})
-            for ipv6 in show_ipv6_int_oob[0]["ipv6_pfx"]:
-                ipv6_address = str(IPv6Interface(ipv6).ip)
-                prefix_len = IPv6Interface(ipv6).network.prefixlen
-                interfaces_ip["out-of-band"]["ipv6"][ipv6_address] = {
-                    "prefix_length": prefix_len
-                }
-
-        return interfaces_ip
+        return self._collect("get_interfaces_ip")
 
     def get_ipv6_neighbors_table(self):
         """
@@ -1415,56 +1449,27 @@ class DellOS6Driver(NetworkDriver):
             ]
         """
 
-        raw_show_ipv6_neighbors = self._send_command("show ipv6 neighbors")
-        show_ipv6_neighbors = textfsm_extractor(
-            self, "show_ipv6_neighbors", raw_show_ipv6_neighbors
-        )
-
-        ipv6_neighbors = []
-        for neighbor in show_ipv6_neighbors:
-            interface_name = canonical_interface_name(
-                neighbor["int_name"], addl_name_map=dellos6_interfaces
+        if "get_ipv6_neighbors_table" in self.table_probes:
+            return self._get_table_probed(
+                "get_ipv6_neighbors_table",
+                lambda: self._collect("get_ipv6_neighbors_table"),
             )
-            mac_addr = mac(neighbor["mac_addr"])
-            ipv6_addr = neighbor["ipv6_addr"]
-            # Dell OS6 doesn't support age
-            age = -0.0
-            state = neighbor["state"].upper()
-            ipv6_neighbors.append(
-                {
-                    "interface": interface_name,
-                    "mac": mac_addr,
-                    "ip": ipv6_addr,
-                    "age": age,
-                    "state": state,
-                }
-            )
-
-        return ipv6_neighbors
+        return self._collect("get_ipv6_neighbors_table")
 
-    def _expand_ranges(self, iflist):
+    def _iter_ipv6_neighbors_table(self, interface="", vlan=None):
         """
-        In: ["Gi1/0/42-43"]
-        Out: ["Gi1/0/42", "Gi1/0/43"]
+        Iterate over the IPv6 neighbor table like get_ipv6_neighbors_table(), parsing
+        the entries while "show ipv6 neighbors" is read from the device. See
+        _iter_arp_table() for the interface and VLAN filters.
         """
-        expanded_interfaces = []
-        for interface in iflist:
-            m = re.match(r"(\S\S|.+/)((\d+)-(\d+))", interface)
-            if m is None:
-                expanded_interfaces.append(interface)
-            else:
-                interfaces = []
-                for i in range(int(m.group(3)), int(m.group(4)) + 1):
-                    interfaces.append("%s%d" % (m.group(1), i))
-                expanded_interfaces = expanded_interfaces + interfaces
-        return expanded_interfaces
-
-    def _ensure_ports_split(self, ports):
-        "textFSM cannot split repeated values in the same line. Do it here."
-        result = []
-        for port in ports:
-            result = result + port.split(",")
-        return result
+        interface, output_filter = self._neighbor_filter(interface, vlan)
+        parser = IPv6NeighborsParser(interface)
+        lines = self._stream_command("show ipv6 neighbors" + output_filter)
+        try:
+            for entry in parser.parse(lines):
+                yield entry
+        finally:
+            lines.close()
 
     def get_vlans(self):
         """
@@ -1484,25 +1489,30 @@ class DellOS6Driver(NetworkDriver):
             }
         }
         """
-        raw_show_vlan = self._send_command("show vlan")
-        show_vlan = textfsm_extractor(self, "show_vlan", raw_show_vlan)
-        interface_dict = self._get_interface_dict()
-
-        vlans = {}
-        for vlan_entry in show_vlan:
-            canonical_interfaces = []
-            ports = self._ensure_ports_split(vlan_entry["ports"])
-            for interface in self._expand_ranges(ports):
-                interface_name = canonical_interface_name(
-                    interface, addl_name_map=dellos6_interfaces
+        return self._get_vlans()
+
+    def _get_vlans(self, vlan_ids=None, validate_interfaces=True):
+        """
+        get_vlans() limited to some VLANs.
+
+        If vlan_ids is given (e.g. [10, 20], "100-199" or range(100, 200)), only
+        those VLANs are fetched, with "show vlan id <list>". Member ports are checked
+        against "show interfaces status", as "show vlan" ranges may name ports which
+        do not exist (e.g. "Po1-128"); validate_interfaces=False skips that command
+        and returns the ports "show vlan" names.
+        """
+        commands = self.parser.commands(
+            "get_vlans", vlan_ids=vlan_ids, validate_interfaces=validate_interfaces
+        )
+        vlan_command = commands[0]
+        with self._parallel_commands(self._bulk_commands(commands)):
+            outputs = {vlan_command: self._send_command(vlan_command)}
+            if validate_interfaces:
+                outputs["show interfaces status"] = self._get_interface_entries(
+                    "show interfaces status", "show_interfaces_status"
                 )
-                if interface_name in interface_dict.keys():
-                    canonical_interfaces.append(interface_name)
-            vlans[int(vlan_entry["vlan_id"])] = {
-                "name": vlan_entry["vlan_name"],
-                "interfaces": canonical_interfaces,
-            }
-        return vlans
+
+        return self.parser.get_vlans(outputs, vlan_ids, validate_interfaces)
 
     def get_mac_address_table(self):
         """
@@ -1548,27 +1558,152 @@ class DellOS6Driver(NetworkDriver):
                 }
             ]
         """
-        raw_get_mac_address_table = self._send_command("show mac address-table")
-        get_mac_address_table = textfsm_extractor(
-            self, "show_mac_address_table", raw_get_mac_address_table
-        )
-        table = []
-        for entry in get_mac_address_table:
-            table.append(
-                {
-                    "mac": mac(entry["mac"]),
-                    "interface": canonical_interface_name(
-                        entry["port"], addl_name_map=dellos6_interfaces
-                    ),
-                    "vlan": int(entry["vlan"]),
-                    "static": entry["type"] == "Static"
-                    or entry["type"] == "Management",
-                    "active": True,
-                    "moves": -1,
-                    "last_move": -1.0,
-                }
+        if "get_mac_address_table" in self.table_probes:
+            return self._get_table_probed(
+                "get_mac_address_table", self._get_mac_address_table
+            )
+        return self._get_mac_address_table()
+
+    def _get_mac_address_table(self):
+        outputs = {
+            "show mac address-table": self._get_interface_entries(
+                "show mac address-table", "show_mac_address_table", key="port"
             )
-        return table
+        }
+
+        return self.parser.get_mac_address_table(outputs)
+
+    def _get_table_probed(self, getter, fetch, **kwargs):
+        """
+        Runs a table getter with the table_probes optional argument: the summary
+        command of the table (see D6C.DELLOS6_TABLE_PROBES), e.g. "show mac
+        address-table count", is read first, and while its counters are unchanged
+        the previous result is returned from the probe cache. Otherwise the table is
+        fetched again with fetch(). Tables without a summary command are reused for
+        probe_max_age seconds, and fetched every time without it.
+
+        Counters can stay the same while entries are replaced, so probe_max_age
+        should be set to the staleness the caller can accept.
+        """
+        cache = self.probe_cache
+        key = self._call_key(getter, kwargs)
+        probe = None
+        if self.parser.table_probe_command(getter) is None:
+            if cache.max_age is not None:
+                probe = {}
+        else:
+            try:
+                outputs = self._collect_outputs("table_probe", table=getter, **kwargs)
+                probe = self.parser.table_probe(outputs, getter, **kwargs)
+            except CommandErrorException:
+                # Without a summary, fetch the table as usual
+                probe = None
+        if probe is not None:
+            result = cache.get(key, probe)
+            if result is not None:
+                return result
+
+        result = fetch()
+        cache.put(key, probe, result)
+        return result
+
+    def get_route_to(self, destination="", protocol="", longer=False):
+        """
+        Returns a dictionary of dictionaries containing details of all available routes to a
+        destination.
+        :param destination: The destination prefix to be used when filtering the routes. An
+        address without prefix length returns the longest matching prefix. Empty returns
+        all the routes. Raises ValueError if it is not an address or a prefix.
+        :param protocol (optional): Retrieve the routes only for a specific protocol.
+        :param longer (optional): Retrieve more specific routes as well.
+        Each inner dictionary contains the following fields:
+            * protocol (string)
+            * current_active (True/False)
+            * last_active (True/False)
+            * age (int)
+            * next_hop (string)
+            * outgoing_interface (string)
+            * selected_next_hop (True/False)
+            * preference (int)
+            * inactive_reason (string)
+            * routing_table (string)
+            * protocol_attributes (dictionary) (NOT IMPLEMENTED)
+        The routing tables of all VRFs are searched. Every call fetches fresh routing
+        tables; use _get_route_table() to resolve many destinations from one snapshot.
+        Example::
+            {
+                "1.0.0.0/24": [
+                    {
+                        "protocol"          : u"BGP",
+                        "inactive_reason"   : u"Local Preference",
+                        "last_active"       : False,
+                        "age"               : 105219,
+                        "next_hop"          : u"172.17.17.17",
+                        "selected_next_hop" : True,
+                        "preference"        : 170,
+                        "current_active"    : False,
+                        "outgoing_interface": u"ae9.0",
+                        "routing_table"     : "inet.0",
+                        "protocol_attributes": {}
+                    }
+                ]
+            }
+        """
+
+        vrfs = self.parser.vrfs({"show ip vrf": self._send_command("show ip vrf")})
+        with self._parallel_commands([self.parser.route_command(vrf) for vrf in vrfs]):
+            route_tables = [self._get_route_table(vrf, refresh=True) for vrf in vrfs]
+
+        return match_routes(route_tables, destination, protocol, longer)
+
+    def _get_route_table(self, vrf="", refresh=False):
+        """
+        Returns a RouteTable snapshot of the IPv4 routing table of the given VRF (the
+        default VRF if empty). The snapshot is parsed once from "show ip route" and
+        reused by later calls until refresh is set or _invalidate_route_tables() is
+        called. RouteTable.lookup() then resolves destinations locally, e.g.::
+
+            table = device._get_route_table()
+            prefix, routes = table.lookup("192.0.2.1")
+        """
+        if refresh or vrf not in self._route_tables:
+            command = self.parser.route_command(vrf)
+            self._route_tables[vrf] = self.parser.get_route_table(
+                {command: self._send_command(command)}, vrf
+            )
+        return self._route_tables[vrf]
+
+    def _invalidate_route_tables(self):
+        """Discard the routing table snapshots returned by _get_route_table()."""
+        self._route_tables = {}
+
+    def _get_changes(self, getter, **kwargs):
+        """
+        Runs the given getter (e.g. "get_mac_address_table", "get_lldp_neighbors" or
+        "get_interfaces") with kwargs and returns what changed since the previous call
+        with the same arguments, as a list of ChangeEvent(op, key, value) tuples:
+            * op (str) - "+" (added), "-" (removed, value is None) or "~" (modified)
+            * key - the dict key of the entry, or a tuple of its identifying fields
+              for list getters (e.g. (mac, vlan) for get_mac_address_table)
+            * value - the new entry
+
+        The previous result is only kept as one digest per entry. The first call
+        reports every entry as added; dellos6_changes.encode_events() turns the events
+        into compact JSON lines.
+        """
+        tracker_key = self._call_key(getter, kwargs)
+        tracker = self._change_trackers.get(tracker_key)
+        if tracker is None:
+            tracker = ChangeTracker(
+                D6C.DELLOS6_CHANGE_KEYS.get(getter),
+                D6C.DELLOS6_CHANGE_IGNORE.get(getter, ()),
+            )
+            self._change_trackers[tracker_key] = tracker
+        return tracker.update(getattr(self, getter)(**kwargs))
+
+    def _reset_changes(self):
+        """Forget the results kept by _get_changes()."""
+        self._change_trackers = {}
 
     def get_snmp_information(self):
 
@@ -1608,36 +1743,10 @@ class DellOS6Driver(NetworkDriver):
             }
         """
 
-        raw_show_sys = self._send_command("show system")
-        raw_show_snmp = self._send_command("show snmp")
+        if self.config_cache:
+            return self._get_config_tree().snmp_information()
 
-        show_sys = textfsm_extractor(self, "show_system-basic", raw_show_sys)
-        show_snmp_basic = textfsm_extractor(self, "show_snmp-basic", raw_show_snmp)
-        show_snmp_communities = textfsm_extractor(
-            self, "show_snmp-communities", raw_show_snmp
-        )
-        snmp_info = {
-            # Dell OS6 doesn't support setting the chassis ID, it's derived from the hostname
-            "chassis_id": show_sys[0]["sys_name"],
-            "community": {},
-            "contact": show_snmp_basic[0]["contact"],
-            "location": show_snmp_basic[0]["location"],
-        }
-
-        for entry in show_snmp_communities:
-            community = entry["community"]
-            if entry["acl"] == "All":
-                acl = u"N/A"
-            else:
-                # Dell OS6 only supports direct host entries, no ACLs
-                acl = entry["acl"] + "/32"
-            if entry["mode"] == "Read Only":
-                mode = u"ro"
-            if entry["mode"] == "Read/Write":
-                mode = u"rw"
-            snmp_info["community"][community] = {"acl": acl, "mode": mode}
-
-        return snmp_info
+        return self._collect("get_snmp_information")
 
     def ping(
         self,
@@ -1648,6 +1757,7 @@ class DellOS6Driver(NetworkDriver):
         size=C.PING_SIZE,
         count=C.PING_COUNT,
         vrf=C.PING_VRF,
+        source_interface="",
     ):
         """
         Executes ping on the device and returns a dictionary with the result
@@ -1657,6 +1767,7 @@ class DellOS6Driver(NetworkDriver):
         :param timeout (optional): Maximum seconds to wait after sending final packet
         :param size (optional): Size of request (bytes)
         :param count (optional): Number of ping request to send
+        :param source_interface (optional): Not supported, use source
         Output dictionary has one of following keys:
             * success
             * error
@@ -1697,14 +1808,60 @@ class DellOS6Driver(NetworkDriver):
                 'error': 'unknown host 8.8.8.8.8'
             }
         """
+        if source_interface:
+            raise NotImplementedError("source_interface is not supported, use source")
+
+        cmd = self._ping_command(destination, source, ttl, timeout, size, count, vrf)
+        return self._parse_ping(cmd, self._send_command(cmd))
+
+    def _ping_many(
+        self,
+        destinations,
+        source=C.PING_SOURCE,
+        ttl=C.PING_TTL,
+        timeout=C.PING_TIMEOUT,
+        size=C.PING_SIZE,
+        count=C.PING_COUNT,
+        vrf=C.PING_VRF,
+        max_sessions=None,
+    ):
+        """
+        Executes ping() towards several destinations concurrently, each over its own
+        session to the device (see the ``max_sessions`` optional argument), and yields
+        ``(destination, result)`` tuples as the pings complete. ``result`` has the same
+        format as the return value of ping().
+        :param destinations: List of hosts or IP Addresses
+        :param max_sessions (optional): Use at most this many concurrent sessions
+        Example::
+            for destination, result in device._ping_many(["192.0.2.1", "192.0.2.2"]):
+                if "error" in result:
+                    print(destination, "unreachable")
+        """
+
+        def run_ping(session, destination):
+            cmd = self._ping_command(
+                destination, source, ttl, timeout, size, count, vrf
+            )
+            try:
+                output = self._send_command(cmd, device=session)
+            except CommandErrorException as exp:
+                return {"error": str(exp)}
+            return self._parse_ping(cmd, output)
+
+        pool = self._get_session_pool()
+        for destination, result in pool.map(run_ping, destinations, max_sessions):
+            yield destination, result
 
+    @staticmethod
+    def _ping_command(destination, source, ttl, timeout, size, count, vrf):
+        """Returns the ping command for the given ping() arguments."""
         vrf_name = ""
         if vrf:
             vrf_name = " vrf " + str(vrf)
 
         params = ""
         if source:
-            params = params + " source "
+            params = params + " source " + str(source)
         if timeout:
             params = params + " timeout " + str(timeout)
         if size:
@@ -1712,22 +1869,12 @@ class DellOS6Driver(NetworkDriver):
         if count:
             params = params + " repeat " + str(count)
 
-        cmd = "ping{} {}{}".format(vrf_name, destination, params)
-        ping_dict = {}
+        return "ping{} {}{}".format(vrf_name, destination, params)
 
-        send_received_regexp = (
-            r"(\d+)\s+packets transmitted\S+\s+(\d+)\s+"
-            r"packets received\S+\s+\S+\s+packet loss"
-        )
-        icmp_result_regexp = (
-            r"Reply From\s+(\S+)\:\s+icmp_seq\s+=\s+(\d+)\.\s+"
-            r"time=\s+(\d+)\s+usec\."
-        )
-        min_avg_max_reg_exp = (
-            r"round-trip \(msec\)\s+min\/avg\/max\s+=\s+(\S+)\/" r"(\S+)\/(\S+)"
-        )
-
-        output = self._send_command(cmd)
+    @staticmethod
+    def _parse_ping(cmd, output):
+        """Parses the output of a ping command into the ping() result format."""
+        ping_dict = {}
 
         if "% Error" in output:
             status = "error"
@@ -1748,7 +1895,7 @@ class DellOS6Driver(NetworkDriver):
             for line in output.splitlines():
                 status = "success"
                 if "packets transmitted" in line:
-                    sent_and_received = re.search(send_received_regexp, line)
+                    sent_and_received = PING_SENT_RECEIVED_REGEX.search(line)
                     probes_sent = int(sent_and_received.groups()[0])
                     probes_received = int(sent_and_received.groups()[1])
                     if probes_received == 0:
@@ -1756,7 +1903,7 @@ class DellOS6Driver(NetworkDriver):
                     ping_dict["probes_sent"] = probes_sent
                     ping_dict["packet_loss"] = probes_sent - probes_received
                 elif "icmp_seq" in line:
-                    icmp_result = re.search(icmp_result_regexp, line)
+                    icmp_result = PING_ICMP_RESULT_REGEX.search(line)
                     results_array.append(
                         {
                             "ip_address": icmp_result.groups()[0],
@@ -1766,8 +1913,10 @@ class DellOS6Driver(NetworkDriver):
                     ping_dict.update({"results": results_array})
                     std_dev_list.append(float(icmp_result.groups()[2]) / 1000)
                 elif "round-trip (msec)" in line:
-                    min_avg = re.search(min_avg_max_reg_exp, line)
+                    min_avg = PING_MIN_AVG_MAX_REGEX.search(line)
                     if std_dev_list:
+                        from statistics import stdev
+
                         rtt_stddev = stdev(std_dev_list)
                     else:
                         rtt_stddev = 0.0
@@ -1791,9 +1940,166 @@ class DellOS6Driver(NetworkDriver):
                             "rtt_stddev": rtt_stddev,
                         }
                     )
+        else:
+            # Neither an error nor statistics, e.g. a timeout or a truncated read
+            return {"error": output}
 
         return {status: ping_dict}
 
+    def traceroute(
+        self,
+        destination,
+        source=C.TRACEROUTE_SOURCE,
+        ttl=C.TRACEROUTE_TTL,
+        timeout=C.TRACEROUTE_TIMEOUT,
+        vrf=C.TRACEROUTE_VRF,
+    ):
+        """
+        Executes traceroute on the device and returns a dictionary with the result.
+        :param destination: Host or IP Address of the destination
+        :param source (optional): Use a specific IP Address to execute the traceroute
+        :param ttl (optional): Maximum number of hops
+        :param timeout (optional): Not supported by Dell OS6
+        :param vrf (optional): VRF to execute the traceroute in
+        Output dictionary has one of the following keys:
+            * success
+            * error
+        In case of success, the keys of the dictionary represent the hop ID, while values
+        are dictionaries containing the probes results:
+            * rtt (float)
+            * ip_address (str)
+            * host_name (str)
+        Example::
+            {
+                'success': {
+                    1: {
+                        'probes': {
+                            1: {
+                                'rtt': 1.123,
+                                'ip_address': u'206.223.116.21',
+                                'host_name': u'eqixsj-google-gige.google.com'
+                            },
+                            2: {
+                                'rtt': 1.9100000000000001,
+                                'ip_address': u'206.223.116.21',
+                                'host_name': u'eqixsj-google-gige.google.com'
+                            },
+                            3: {
+                                'rtt': 3.347,
+                                'ip_address': u'198.32.176.31',
+                                'host_name': u'core2-1-1-0.pao.net.google.com'}
+                            }
+                        }
+                    }
+                }
+            OR
+            {
+                'error': 'unknown host 8.8.8.8.8'
+            }
+        """
+
+        cmd = self._traceroute_command(destination, source, ttl, vrf)
+        output = self._send_command(cmd)
+
+        if "% Error" in output or "Traceroute to" not in output:
+            return {"error": output.strip()}
+
+        hops = {}
+        for line in output.splitlines():
+            hop = self._parse_traceroute_hop(line)
+            if hop is not None:
+                hops[hop[0]] = hop[1]
+
+        return {"success": hops}
+
+    def _traceroute_stream(
+        self,
+        destination,
+        source=C.TRACEROUTE_SOURCE,
+        ttl=C.TRACEROUTE_TTL,
+        timeout=C.TRACEROUTE_TIMEOUT,
+        vrf=C.TRACEROUTE_VRF,
+    ):
+        """
+        Executes traceroute on the device like traceroute(), but yields a
+        ``(hop_id, {"probes": {...}})`` tuple for every hop as soon as the device
+        prints it. Closing the generator early aborts the traceroute on the device.
+        Raises CommandErrorException if the device reports an error.
+        Example::
+            for hop_id, hop in device._traceroute_stream("8.8.8.8"):
+                print(hop_id, hop["probes"][1]["ip_address"])
+        """
+
+        cmd = self._traceroute_command(destination, source, ttl, vrf)
+        # Hops with unresponsive routers can take several seconds each
+        for line in self._stream_command(cmd, timeout=max(self.timeout, 30)):
+            if "% Error" in line:
+                raise CommandErrorException(
+                    "Error while executing the command : {} output :: {}".format(
+                        cmd, line
+                    )
+                )
+            hop = self._parse_traceroute_hop(line)
+            if hop is not None:
+                yield hop
+
+    @staticmethod
+    def _traceroute_command(destination, source, ttl, vrf):
+        """Returns the traceroute command for the given traceroute() arguments."""
+        vrf_name = ""
+        if vrf:
+            vrf_name = " vrf " + str(vrf)
+
+        params = ""
+        if ttl:
+            params = params + " maxTtl " + str(ttl)
+        if source:
+            params = params + " source " + str(source)
+
+        return "traceroute{} {}{}".format(vrf_name, destination, params)
+
+    @staticmethod
+    def _parse_traceroute_hop(line):
+        """
+        Parses a single hop line of the traceroute output, e.g.
+        "2 10.240.1.252 0 msec 0 msec 1 msec", into (hop_id, {"probes": {...}}).
+        Returns None for any other line.
+        """
+        match = TRACEROUTE_HOP_REGEX.match(line)
+        if match is None:
+            return None
+        ip_address = match.group(2)
+        probes_output = match.group(3)
+        if ip_address == "*":
+            ip_address = C.TRACEROUTE_NULL_IP_ADDRESS
+            probes_output = "* " + probes_output
+        elif not re.match(r"^[\da-fA-F.:]+$", ip_address):
+            return None
+
+        probes = {}
+        for probe_id, probe in enumerate(
+            TRACEROUTE_PROBE_REGEX.finditer(probes_output), 1
+        ):
+            if probe.group(0) == "*":
+                probes[probe_id] = {
+                    "rtt": 0.0,
+                    "ip_address": C.TRACEROUTE_NULL_IP_ADDRESS,
+                    "host_name": C.TRACEROUTE_NULL_HOST_NAME,
+                }
+                continue
+            rtt = probe.group(1)
+            probes[probe_id] = {
+                # Dell OS6 reports sub-10ms times as "<10"
+                "rtt": 0.0 if rtt.startswith("<") else float(rtt),
+                "ip_address": ip_address,
+                # Dell OS6 doesn't resolve hop addresses
+                "host_name": ip_address,
+            }
+        if not probes:
+            return None
+
+        return int(match.group(1)), {"probes": probes}
+
     def get_users(self):
         """
         Returns a dictionary with the configured users.
@@ -1821,31 +2127,10 @@ class DellOS6Driver(NetworkDriver):
             }
         """
 
-        username_regex = (
-            r"^username\s+\"(?P<username>\S+)\"\s+password\s+(?P<pwd_hash>[0-9a-f]+).*"
-        )
-
-        raw_show_users_accounts = self._send_command("show users accounts")
-        show_users_accounts = textfsm_extractor(
-            self, "show_users_accounts", raw_show_users_accounts
-        )
-        users = {}
-        for user in show_users_accounts:
-            users[user["username"]] = {
-                "level": int(user["priv"]),
-                "password": "",
-                "sshkeys": [],
-            }
-
-        command = "show running-config | section username"
-        output = self._send_command(command)
-
-        for match in re.finditer(username_regex, output, re.M):
-            username = match.groupdict()["username"]
-            pwd_hash = match.groupdict()["pwd_hash"]
-            users[username]["password"] = pwd_hash
+        if self.config_cache:
+            return self._get_config_tree().users()
 
-        return users
+        return self._collect("get_users")
 
     def get_optics(self):
         """Fetches the power usage on the various transceivers installed
@@ -1905,59 +2190,25 @@ class DellOS6Driver(NetworkDriver):
                 }
             }
         """
+        return self._get_optics()
 
-        raw_show_fiber_ports_optical_transceiver = self._send_command(
-            "show fiber-ports optical transceiver"
-        )
-        show_fiber_ports_optical_transceiver = textfsm_extractor(
-            self,
-            "show_fiber-ports_optical-transceiver",
-            raw_show_fiber_ports_optical_transceiver,
-        )
-
-        optics = {}
-        for interface in show_fiber_ports_optical_transceiver:
-            interface_name = canonical_interface_name(
-                interface["int_name"], addl_name_map=dellos6_interfaces
+    def _get_optics(self, interfaces=None):
+        """
+        get_optics() limited to some ports: only the transceivers of those ports are
+        fetched (see _get_interface_entries()) and returned.
+        """
+        outputs = {
+            "show fiber-ports optical transceiver": self._get_interface_entries(
+                "show fiber-ports optical transceiver",
+                "show_fiber-ports_optical-transceiver",
+                interfaces,
+                key="int_name",
             )
-            pwr_rx = float(interface["pwr_rx"])
-            pwr_tx = float(interface["pwr_tx"])
-            current = float(interface["current"])
-
-            optics[interface_name] = {
-                "physical_channels": {
-                    "channel": [
-                        {
-                            # We do not yet support multiple channels
-                            "index": 0,
-                            "state": {
-                                "input_power": {
-                                    "instant": pwr_rx,
-                                    "avg": -0.0,
-                                    "min": -0.0,
-                                    "max": -0.0,
-                                },
-                                "output_power": {
-                                    "instant": pwr_tx,
-                                    "avg": -0.0,
-                                    "min": -0.0,
-                                    "max": -0.0,
-                                },
-                                "laser_bias_current": {
-                                    "instant": current,
-                                    "avg": -0.0,
-                                    "min": -0.0,
-                                    "max": -0.0,
-                                },
-                            },
-                        }
-                    ]
-                }
-            }
+        }
 
-        return optics
+        return self.parser.get_optics(outputs, interfaces)
 
-    def get_config(self, retrieve="all", full=False, sanitized=False):
+    def get_config(self, retrieve="all", full=False, sanitized=False, format="text"):
         """
         Return the configuration of a device.
 
@@ -1966,6 +2217,7 @@ class DellOS6Driver(NetworkDriver):
                               The rest will be set to "".
             full(bool): Retrieve all the configuration. For instance, on ios, "sh run all".
             sanitized(bool): Remove secret data. Default: ``False``.
+            format(string): The configuration format, only "text" is supported.
 
         Returns:
           The object returned is a dictionary with a key for each configuration store:
@@ -1978,24 +2230,16 @@ class DellOS6Driver(NetworkDriver):
               device doesnt differentiate between running and startup configuration this will an
               empty string
         """
-        running_config = ""
-        startup_config = ""
-
-        if retrieve in ["all", "running"]:
-            running_config = self._send_command("show running-config")
-        if retrieve in ["all", "startup"]:
-            startup_config = self._send_command("show startup-config")
-
-        configs = {
-            "running": running_config,
-            "startup": startup_config,
-            "candidate": "",
-        }
+        if format != "text":
+            raise NotImplementedError("{} is not a supported format".format(format))
 
-        if sanitized:
-            return sanitize_configs(configs, D6C.DELLOS6_SANITIZE_FILTERS)
+        outputs = {}
+        if self.config_cache and retrieve in ["all", "running"]:
+            outputs["show running-config"] = self._get_config_tree().text
 
-        return configs
+        return self._collect(
+            "get_config", outputs, retrieve=retrieve, full=full, sanitized=sanitized
+        )
 
     def get_network_instances(self, name=""):
         """
@@ -2044,42 +2288,4 @@ class DellOS6Driver(NetworkDriver):
             }
         """
 
-        raw_show_ip_vrf = self._send_command("show ip vrf")
-        raw_show_ip_vrf_interface = self._send_command("show ip vrf interface")
-        show_ip_vrf = textfsm_extractor(self, "show_ip_vrf", raw_show_ip_vrf)
-        show_ip_vrf_interface = textfsm_extractor(
-            self, "show_ip_vrf_interface", raw_show_ip_vrf_interface
-        )
-
-        default_ip_interfaces = self.get_interfaces_ip()
-
-        network_instances = {}
-        network_instances[u"default"] = {
-            u"name": u"default",
-            u"type": u"DEFAULT_INSTANCE",
-            u"state": {u"route_distinguisher": ""},
-            u"interfaces": {u"interface": {}},
-        }
-
-        for interface in default_ip_interfaces.keys():
-            network_instances["default"]["interfaces"]["interface"][interface] = {}
-
-        for vrf in show_ip_vrf:
-            network_instances[vrf["vrf_name"]] = {
-                u"name": vrf["vrf_name"],
-                u"type": u"L3VRF",
-                u"state": {
-                    # Dell OS6 doesn't support RDs
-                    u"route_distinguisher": ""
-                },
-                u"interfaces": {u"interface": {}},
-            }
-
-        for interface in show_ip_vrf_interface:
-            vrf_name = interface["vrf_name"]
-            interface_name = canonical_interface_name(
-                interface["int_name"], addl_name_map=dellos6_interfaces
-            )
-            network_instances[vrf_name]["interfaces"]["interface"][interface_name] = {}
-
-        return network_instances
+        return self._collect("get_network_instances", name=name)
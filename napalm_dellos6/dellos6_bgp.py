@@ -0,0 +1,112 @@
+"""Incremental parser for the Dell OS6 BGP table outputs."""
+import re
+
+BGP_ROUTE_REGEX = re.compile(
+    r"^(?P<status>[sdhr*>i= ]*?)\s*(?P<network>[\da-fA-F.:]+/\d+)"
+    r"(?:\s+(?P<next_hop>[\da-fA-F.:]+)(?P<rest>.*))?$"
+)
+BGP_NEXT_HOP_REGEX = re.compile(r"^\s+(?P<next_hop>[\da-fA-F.:]+)(?P<rest>.*)$")
+# Alternate path of the previous prefix, with a blank Network column
+BGP_PATH_REGEX = re.compile(
+    r"^(?P<status>[sdhr*>i=][sdhr*>i= ]*?)\s+"
+    r"(?P<next_hop>[\da-fA-F]*[.:][\da-fA-F.:]*)(?P<rest>.*)$"
+)
+BGP_TOKEN_REGEX = re.compile(r"\S+")
+
+
+class BGPRouteParser(object):
+    """
+    Turns the lines of "show ip bgp", "show bgp ipv6" and the neighbor
+    "received-routes"/"advertised-routes" outputs into route dicts, one line at a time,
+    so arbitrarily large tables are parsed in constant memory.
+
+    The Metric and LocPref columns are often blank, so numbers are assigned to a
+    column by their position below the table header. The Network column is blank on
+    the lines of the alternate paths of a prefix, which get the prefix of the line
+    above. Each route is a dict with:
+        * prefix (str)
+        * next_hop (str)
+        * metric (int, -1 if not present)
+        * local_pref (int, -1 if not present)
+        * as_path (str)
+        * origin (str) - "i", "e" or "?"
+        * valid (bool)
+        * best (bool)
+        * internal (bool)
+    """
+
+    def __init__(self):
+        self._columns = None
+        self._pending = None
+        self._network = None
+
+    def parse(self, lines):
+        """Yield a route dict for every route line in the iterable of lines."""
+        for line in lines:
+            route = self.parse_line(line)
+            if route is not None:
+                yield route
+
+    def parse_line(self, line):
+        """Parse a single line, returning a route dict or None."""
+        line = line.rstrip()
+        if "Network" in line and "Next Hop" in line:
+            self._columns = {
+                name: line.index(name) for name in ("Metric", "LocPref", "Path")
+            }
+            self._network = None
+            return None
+        if self._pending is not None:
+            # Long prefixes are printed on a line of their own
+            status, network = self._pending
+            self._pending = None
+            match = BGP_NEXT_HOP_REGEX.match(line)
+            if match is not None:
+                return self._route(status, network, match)
+        match = BGP_ROUTE_REGEX.match(line)
+        if match is None:
+            match = BGP_PATH_REGEX.match(line)
+            if match is None or self._network is None:
+                return None
+            return self._route(match.group("status"), self._network, match)
+        self._network = match.group("network")
+        if match.group("next_hop") is None:
+            self._pending = (match.group("status"), self._network)
+            return None
+        return self._route(match.group("status"), self._network, match)
+
+    def _route(self, status, network, match):
+        metric, local_pref, as_path, origin = -1, -1, [], ""
+        rest_start = match.start("rest")
+        for token in BGP_TOKEN_REGEX.finditer(match.group("rest")):
+            value = token.group(0)
+            if value in ("i", "e", "?"):
+                origin = value
+                continue
+            column = self._column(rest_start + token.start())
+            if column == "Metric" and value.isdigit():
+                metric = int(value)
+            elif column == "LocPref" and value.isdigit():
+                local_pref = int(value)
+            else:
+                as_path.append(value)
+        return {
+            "prefix": network,
+            "next_hop": match.group("next_hop"),
+            "metric": metric,
+            "local_pref": local_pref,
+            "as_path": " ".join(as_path),
+            "origin": origin,
+            "valid": "*" in status,
+            "best": ">" in status,
+            "internal": "i" in status,
+        }
+
+    def _column(self, position):
+        if self._columns is None:
+            return "Path"
+        if position >= self._columns["Path"] - 1:
+            return "Path"
+        if position >= self._columns["LocPref"] - 1:
+            return "LocPref"
+        return "Metric"
@@ -0,0 +1,61 @@
+"""Low-copy accumulation of large command outputs."""
+import re
+
+ERROR_MARKER = b"% Invalid"
+
+
+class OutputBuffer(object):
+    """
+    Accumulates the raw channel data of one command in a growable bytearray.
+
+    Carriage returns are dropped from each chunk as it arrives, the error marker is
+    searched only in the newly received data, and the prompt only in the last line,
+    through memoryview slices. The output is decoded once, by text(), without the
+    echoed command line and the trailing prompt.
+    """
+
+    def __init__(self, prompt, error_marker=ERROR_MARKER, encoding="utf-8"):
+        self._prompt_regex = re.compile(
+            re.escape(prompt.encode(encoding)) + rb"[>#]\s*$"
+        )
+        self.error_marker = error_marker
+        self.encoding = encoding
+        self._data = bytearray()
+        self._scanned = 0
+        self._last_newline = -1
+        self.error = False
+
+    def __len__(self):
+        return len(self._data)
+
+    def feed(self, chunk):
+        """Append a chunk of bytes; return True once the prompt has been received."""
+        if b"\r" in chunk:
+            chunk = chunk.replace(b"\r", b"")
+        data = self._data
+        data += chunk
+        if not self.error:
+            # Markers split across two chunks are found as well
+            start = max(0, self._scanned - len(self.error_marker) + 1)
+            self.error = data.find(self.error_marker, start) != -1
+        newline = data.rfind(b"\n", self._scanned)
+        if newline != -1:
+            self._last_newline = newline
+        self._scanned = len(data)
+        return self.prompt_reached()
+
+    def prompt_reached(self):
+        if self._last_newline == -1:
+            return False
+        with memoryview(self._data) as view:
+            return self._prompt_regex.match(view[self._last_newline + 1 :]) is not None
+
+    def text(self):
+        """Decode the output between the echoed command and the prompt."""
+        data = self._data
+        start = data.find(b"\n") + 1
+        end = self._last_newline if self.prompt_reached() else len(data)
+        if end < start:
+            return ""
+        with memoryview(data) as view:
+            return str(view[start:end], self.encoding, "replace")
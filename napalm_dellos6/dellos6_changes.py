@@ -0,0 +1,95 @@
+"""Track changes between successive getter results."""
+import hashlib
+import json
+from collections import namedtuple
+
+ADD = "+"
+REMOVE = "-"
+MODIFY = "~"
+
+ChangeEvent = namedtuple("ChangeEvent", ["op", "key", "value"])
+
+
+def _digest(value):
+    data = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest()
+
+
+class ChangeTracker(object):
+    """
+    Keeps the last result of a getter as a dict of entry key to an 8-byte digest of
+    the entry, and turns every new result into add, remove and modify events.
+
+    Dict results (e.g. get_interfaces, get_lldp_neighbors) are keyed by their keys;
+    list results (e.g. get_mac_address_table) need ``key_fields``, the entry fields
+    identifying an entry. Fields in ``ignore`` (e.g. the ARP age) are left out of
+    the comparison. Each update costs one pass over the result.
+    """
+
+    def __init__(self, key_fields=None, ignore=()):
+        self.key_fields = key_fields
+        self.ignore = ignore
+        self._digests = None
+
+    def _items(self, result):
+        if isinstance(result, dict):
+            return result.items()
+        if self.key_fields is None:
+            raise ValueError("key_fields are needed to track list results")
+        return (
+            (tuple(entry[field] for field in self.key_fields), entry)
+            for entry in result
+        )
+
+    def update(self, result):
+        """Return the list of ChangeEvents since the previous result."""
+        previous = self._digests or {}
+        digests = {}
+        events = []
+        for key, value in self._items(result):
+            if self.ignore and isinstance(value, dict):
+                compared = {k: v for k, v in value.items() if k not in self.ignore}
+            else:
+                compared = value
+            digest = _digest(compared)
+            digests[key] = digest
+            old = previous.get(key)
+            if old is None:
+                events.append(ChangeEvent(ADD, key, value))
+            elif old != digest:
+                events.append(ChangeEvent(MODIFY, key, value))
+        for key in previous:
+            if key not in digests:
+                events.append(ChangeEvent(REMOVE, key, None))
+        self._digests = digests
+        return events
+
+    def reset(self):
+        """Forget the last result, so the next update reports every entry as added."""
+        self._digests = None
+
+
+def encode_events(getter, events):
+    """
+    Encode events as JSON lines: ``["<getter>", "+", key, value]`` for additions,
+    ``["<getter>", "~", key, value]`` for modifications and
+    ``["<getter>", "-", key]`` for removals.
+    """
+    lines = []
+    for event in events:
+        record = [getter, event.op, event.key]
+        if event.op != REMOVE:
+            record.append(event.value)
+        lines.append(json.dumps(record, separators=(",", ":")))
+    return "".join(line + "\n" for line in lines)
+
+
+def decode_events(data):
+    """Decode the output of encode_events() into ``(getter, ChangeEvent)`` pairs."""
+    for line in data.splitlines():
+        if not line:
+            continue
+        record = json.loads(line)
+        key = tuple(record[2]) if isinstance(record[2], list) else record[2]
+        value = record[3] if len(record) > 3 else None
+        yield record[0], ChangeEvent(record[1], key, value)
@@ -0,0 +1,207 @@
+"""Indexed tree over the Dell OS6 running-config."""
+import re
+
+from napalm.base.helpers import canonical_interface_name
+
+from napalm_dellos6.dellos6_canonical_map import (
+    dellos6_interfaces,
+    dellos6_reverse_mapping,
+)
+from napalm_dellos6.dellos6_constants import (
+    DELLOS6_CONFIG_SECTIONS,
+    DELLOS6_CONFIG_SUBSECTIONS,
+)
+
+SECTION_REGEX = re.compile("|".join(DELLOS6_CONFIG_SECTIONS))
+SUBSECTION_REGEX = re.compile("|".join(DELLOS6_CONFIG_SUBSECTIONS))
+
+
+def config_interface_name(name):
+    """
+    Convert an interface name as written in the running-config (e.g. "vlan 666",
+    "port-channel 10") to the canonical name used by the getters.
+    """
+    name = name.strip()
+    lower_name = name.lower()
+    for long_name, short_name in dellos6_reverse_mapping.items():
+        long_name = long_name.strip().lower()
+        if lower_name.startswith(long_name):
+            name = short_name + name[len(long_name) :].strip()
+            break
+    return canonical_interface_name(name, addl_name_map=dellos6_interfaces)
+
+
+def unquote(value):
+    """Strip the double quotes OS6 puts around names and descriptions."""
+    value = value.strip()
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+class ConfigNode(object):
+    """A single line of configuration and the lines nested under it."""
+
+    __slots__ = ("line", "parent", "children")
+
+    def __init__(self, line, parent=None):
+        self.line = line
+        self.parent = parent
+        self.children = []
+
+    def __repr__(self):
+        return "ConfigNode({!r})".format(self.line)
+
+    def lines(self, prefix=""):
+        """Return the child lines starting with ``prefix``."""
+        return [child.line for child in self.children if child.line.startswith(prefix)]
+
+    def value(self, keyword, default=""):
+        """
+        Return the argument of the first child line starting with ``keyword``,
+        e.g. ``node.value("description")`` returns the unquoted description.
+        """
+        for child in self.children:
+            if child.line == keyword:
+                return ""
+            if child.line.startswith(keyword + " "):
+                return unquote(child.line[len(keyword) + 1 :])
+        return default
+
+
+class DellOS6Config(object):
+    """
+    Parse a Dell OS6 running-config into a tree of ConfigNode objects.
+
+    OS6 does not indent its configuration; sections are opened by a known set of
+    commands (see DELLOS6_CONFIG_SECTIONS and DELLOS6_CONFIG_SUBSECTIONS) and
+    closed with "exit". Sections are
+    indexed by their header line and interfaces by their canonical name, so
+    looking either up is a single dict access.
+    """
+
+    def __init__(self, config):
+        self.text = config
+        self.root = ConfigNode("")
+        self._sections = {}
+        self._keywords = {}
+        self._interfaces = {}
+        self._parse(config)
+
+    def _parse(self, config):
+        node = self.root
+        for line in config.splitlines():
+            line = line.strip()
+            if not line or line.startswith("!") or line == "configure":
+                continue
+            if line == "exit":
+                if node.parent is not None:
+                    node = node.parent
+                continue
+            child = ConfigNode(line, node)
+            node.children.append(child)
+            if node is self.root:
+                is_section = SECTION_REGEX.match(line)
+            else:
+                is_section = SUBSECTION_REGEX.match(line)
+            if is_section:
+                self._index(child)
+                node = child
+
+    def _index(self, node):
+        # Nested sections (e.g. address-family) are only indexed by keyword
+        if node.parent is self.root:
+            self._sections[node.line] = node
+            if node.line.startswith("interface "):
+                name = config_interface_name(node.line[len("interface ") :])
+                self._interfaces[name] = node
+        self._keywords.setdefault(node.line.split()[0], []).append(node)
+
+    def section(self, header):
+        """Return the top-level section with the given header line, or None."""
+        return self._sections.get(header)
+
+    def sections(self, keyword):
+        """Return all sections whose header starts with the given keyword."""
+        return self._keywords.get(keyword, [])
+
+    def interface(self, name):
+        """Return the section of the interface with the given canonical name, or None."""
+        return self._interfaces.get(name)
+
+    @property
+    def interfaces(self):
+        """Dict of canonical interface name to its configuration section."""
+        return self._interfaces
+
+    def lines(self, prefix=""):
+        """Return the top-level lines starting with ``prefix``."""
+        return self.root.lines(prefix)
+
+    def hostname(self):
+        return self.root.value("hostname")
+
+    def users(self):
+        """
+        Return a dict of configured users with their password hash and privilege level.
+        Users without a ``privilege`` keyword get level 1, the default of the username
+        command and the level "show users accounts" reports for them.
+        """
+        users = {}
+        for line in self.lines("username "):
+            match = re.match(
+                r"^username\s+\"?(?P<username>[^\"\s]+)\"?\s+password\s+(?P<pwd_hash>\S+)"
+                r"(.*\s+privilege\s+(?P<priv>\d+))?",
+                line,
+            )
+            if match:
+                users[match.group("username")] = {
+                    "level": int(match.group("priv") or 1),
+                    "password": match.group("pwd_hash"),
+                    "sshkeys": [],
+                }
+        return users
+
+    def ntp_servers(self):
+        servers = {}
+        for line in self.lines("sntp server "):
+            servers[line.split()[2]] = {}
+        return servers
+
+    def snmp_communities(self):
+        """Return SNMP communities in the get_snmp_information format."""
+        communities = {}
+        for line in self.lines("snmp-server community "):
+            match = re.match(
+                r"^snmp-server community\s+(\"[^\"]+\"|\S+)(\s+(?P<mode>ro|rw))?"
+                r"(.*\s+ipaddress\s+(?P<ip>\S+))?",
+                line,
+            )
+            if not match:
+                continue
+            acl = "N/A"
+            if match.group("ip"):
+                acl = match.group("ip") + "/32"
+            communities[unquote(match.group(1))] = {
+                "acl": acl,
+                "mode": match.group("mode") or "ro",
+            }
+        return communities
+
+    def snmp_information(self):
+        return {
+            "chassis_id": self.hostname(),
+            "community": self.snmp_communities(),
+            "contact": self.root.value("snmp-server contact"),
+            "location": self.root.value("snmp-server location"),
+        }
+
+    def interface_descriptions(self):
+        """
+        Return a dict of canonical interface name to description, stripped like the
+        output of "show interfaces description".
+        """
+        descriptions = {}
+        for interface, node in self._interfaces.items():
+            descriptions[interface] = node.value("description").strip()
+        return descriptions
@@ -10,3 +10,150 @@ DELLOS6_SANITIZE_FILTERS = {
     r"^(snmp-server host \S+ informs\s*(timeout \d+)?\s*(retries \d+)?)\s*\S+$": r"\1 <removed>",
     r"^(enable\s+password)\s+(\S+)(\s+encrypted)?$": r"\1 <removed>\3",
 }
+
+# Route codes of "show ip route"
+DELLOS6_ROUTE_PROTOCOLS = {
+    "B": "bgp",
+    "C": "connected",
+    "K": "kernel",
+    "L": "leaked",
+    "O": "ospf",
+    "R": "rip",
+    "S": "static",
+}
+
+# Global configuration commands which open a section terminated by "exit"
+DELLOS6_CONFIG_SECTIONS = [
+    r"^interface\s",
+    r"^vlan\s+\d",
+    r"^stack$",
+    r"^line\s",
+    r"^router\s",
+    r"^ipv6 router\s",
+    r"^ip vrf\s",
+    r"^logging\s+[\da-fA-F:.]+$",
+    r"^(radius|tacacs)-server host\s",
+    r"^(ip|ipv6|mac) access-list\s",
+    r"^management access-list\s",
+    r"^vpc domain\s",
+    r"^spanning-tree mst configuration$",
+    r"^(policy-map|class-map)\s",
+    r"^(ip|ipv6) dhcp pool\s",
+    r"^mail-server\s",
+]
+
+# Commands which open a nested section inside one of the above
+DELLOS6_CONFIG_SUBSECTIONS = [
+    r"^address-family\s",
+    r"^class\s",
+]
+
+# Commands get_interfaces() needs for each field, in addition to "show interfaces
+# status" and "show ip interface" which are always sent to list the interfaces
+DELLOS6_INTERFACE_FIELD_COMMANDS = {
+    "is_up": ["show switch stack-ports"],
+    "is_enabled": ["show interfaces configuration"],
+    "description": ["show interfaces description"],
+    "last_flapped": [],
+    "speed": ["show switch stack-ports", "show interfaces configuration"],
+    "mtu": ["show interfaces configuration"],
+    "mac_address": ["show interfaces"],
+}
+
+# Interface types the per-interface forms of the "show interfaces ..." commands do not
+# accept; they are always read from the bulk output
+DELLOS6_NON_PORT_INTERFACES = ("vlan", "loopback", "out-of-band", "tunnel")
+
+# Largest number of ports queried one command at a time before switching to the bulk
+# command. benchmarks/bench_interface_pushdown.py puts the crossover at 10-12 ports
+# of a 12-unit stack with a 50ms round trip
+DELLOS6_PUSHDOWN_THRESHOLD = 10
+
+# Per-unit forms of the heavy whole-stack commands used in stack mode, formatted with
+# an interface range such as "Te2/0/1-48"
+DELLOS6_UNIT_COMMANDS = {
+    "show interfaces status": "show interfaces status {}",
+    "show interfaces counters": "show interfaces counters {}",
+    "show interfaces counters errors": "show interfaces counters errors {}",
+    "show mac address-table": "show mac address-table interface {}",
+}
+
+# Seconds each tier of the get_facts cache is kept: serial number, model, OS version
+# and domain name change on upgrades or hardware swaps only, the interface list
+# whenever VLAN interfaces or port-channels are added
+DELLOS6_FACTS_CACHE_TTLS = {
+    "static": 24 * 3600,
+    "interfaces": 3600,
+}
+
+# Parsed outputs kept by the parse cache when it is enabled with parse_cache=True
+DELLOS6_PARSE_CACHE_SIZE = 256
+
+# Entry fields identifying an entry of the list getters followed by _get_changes();
+# dict getters (get_interfaces, get_lldp_neighbors, ...) are keyed by their keys
+DELLOS6_CHANGE_KEYS = {
+    "get_mac_address_table": ("mac", "vlan"),
+    "get_arp_table": ("interface", "ip"),
+    "get_ipv6_neighbors_table": ("interface", "ip"),
+}
+
+# Entry fields changing on every poll, left out when comparing entries
+DELLOS6_CHANGE_IGNORE = {
+    "get_arp_table": ("age",),
+    "get_ipv6_neighbors_table": ("age",),
+}
+
+# Largest chunk read from the SSH channel at a time by the buffered reader
+DELLOS6_READ_CHUNK_SIZE = 65536
+
+# Commands each getter of DellOS6Parser needs, for the getters whose commands do not
+# depend on their arguments or on the output of other commands
+DELLOS6_GETTER_COMMANDS = {
+    "get_facts": [
+        "show system",
+        "show version",
+        "show switch",
+        "show hosts",
+        "show interfaces status",
+        "show ip interface",
+    ],
+    "get_bgp_neighbors": [
+        "show ip bgp summary",
+        "show ip bgp neighbors",
+        "show bgp ipv6 neighbors",
+    ],
+    "get_bgp_neighbors_detail": [
+        "show ip bgp summary",
+        "show ip bgp neighbors",
+        "show bgp ipv6 neighbors",
+    ],
+    "get_environment": ["show system", "show process cpu"],
+    "get_ntp_peers": ["show sntp status"],
+    "get_ntp_servers": ["show sntp server"],
+    "get_ntp_stats": ["show sntp server"],
+    "get_ipv6_neighbors_table": ["show ipv6 neighbors"],
+    "get_mac_address_table": ["show mac address-table"],
+    "get_snmp_information": ["show system", "show snmp"],
+    "get_users": ["show users accounts", "show running-config | section username"],
+    "get_optics": ["show fiber-ports optical transceiver"],
+}
+
+# Parse jobs sent to a worker process at a time by dellos6_pipeline.ParsePipeline, so
+# the pickling and the round trip to the worker are paid once per chunk, see
+# benchmarks/bench_parse_pipeline.py
+DELLOS6_PIPELINE_CHUNK_SIZE = 16
+
+# Switches polled at a time by dellos6_topology.TopologyCrawler
+DELLOS6_CRAWL_WORKERS = 8
+
+# Summary command and template probing the table of each getter supported by the
+# table_probes optional argument, None if OS6 has no summary of the table (the
+# IPv6 neighbor cache has no count command)
+DELLOS6_TABLE_PROBES = {
+    "get_mac_address_table": (
+        "show mac address-table count",
+        "show_mac_address-table_count",
+    ),
+    "get_arp_table": ("show arp brief", "show_arp_brief"),
+    "get_ipv6_neighbors_table": None,
+}
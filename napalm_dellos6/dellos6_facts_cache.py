@@ -0,0 +1,83 @@
+"""On-disk cache of the get_facts attributes which rarely change."""
+import json
+import os
+import re
+import tempfile
+import time
+
+
+def default_cache_dir():
+    """Return the directory used when the facts cache location is not configured."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "napalm-dellos6")
+
+
+class FactsCache(object):
+    """
+    Facts of one device stored in a JSON file, split in tiers with their own TTL
+    (e.g. serial number and model for a day, the interface list for an hour).
+
+    Every tier is dropped when the device reloaded (its uptime went backwards) or the
+    stack membership changed, see validate().
+    """
+
+    def __init__(self, directory, hostname, ttls):
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", hostname)
+        self.path = os.path.join(directory, "{}.json".format(name))
+        self.ttls = ttls
+        self._data = None
+
+    def _load(self):
+        if self._data is None:
+            try:
+                with open(self.path) as f:
+                    self._data = json.load(f)
+            except (IOError, OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._data, f)
+        os.replace(tmp_path, self.path)
+
+    def validate(self, uptime, units):
+        """
+        Drop all tiers if the uptime is lower than the one last seen or the stack
+        units differ, then remember the current values.
+        """
+        data = self._load()
+        units = sorted(units)
+        if uptime < data.get("uptime", -1) or units != data.get("units", units):
+            data.pop("tiers", None)
+        data["uptime"] = uptime
+        data["units"] = units
+
+    def get(self, tier):
+        """Return the cached values of a tier, or None if missing or expired."""
+        entry = self._load().get("tiers", {}).get(tier)
+        if entry is None or time.time() - entry["timestamp"] > self.ttls[tier]:
+            return None
+        return entry["values"]
+
+    def put(self, tier, values):
+        self._load().setdefault("tiers", {})[tier] = {
+            "timestamp": time.time(),
+            "values": values,
+        }
+
+    def save(self):
+        """Write the cache (including the uptime and units last seen) to disk."""
+        if self._data is not None:
+            self._save()
+
+    def clear(self):
+        self._data = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,97 @@
+"""Incremental parsers for the Dell OS6 ARP and IPv6 neighbor tables."""
+import re
+
+from napalm.base.helpers import canonical_interface_name, mac
+
+from napalm_dellos6.dellos6_canonical_map import dellos6_interfaces
+from napalm_dellos6.dellos6_parser import parse_arp_age, short_interface_name
+
+ARP_ENTRY_REGEX = re.compile(
+    r"^(?P<ip>\d+\.\d+\.\d+\.\d+)\s+(?P<mac>\S+)\s+(?P<interface>\S+)\s+"
+    r"(?P<type>\S+)\s+(?P<age>\S.*?)\s*$"
+)
+IPV6_NEIGHBOR_REGEX = re.compile(
+    r"^(?P<ip>[\da-fA-F]*:[\da-fA-F:.]*)\s+(?P<mac>\S+)\s+(?P<is_rtr>\S+)\s+"
+    r"(?P<state>\S+)\s+(?P<interface>\S+)\s*$"
+)
+# MAC address in the dotted format of the CLI, e.g. "F8B1.5695.CFF1"
+DOTTED_MAC_REGEX = re.compile(
+    r"^([\da-fA-F]{2})([\da-fA-F]{2})\.([\da-fA-F]{2})([\da-fA-F]{2})\."
+    r"([\da-fA-F]{2})([\da-fA-F]{2})$"
+)
+
+
+def fast_mac(address):
+    """napalm's mac(), without building an EUI for the dotted format of the CLI."""
+    match = DOTTED_MAC_REGEX.match(address)
+    if match is None:
+        return mac(address)
+    return ":".join(match.groups()).upper()
+
+
+class ARPTableParser(object):
+    """
+    Turns the lines of "show arp" into get_arp_table() entries, one line at a time,
+    so tables of tens of thousands of entries are parsed while they are read and in
+    constant memory. Lines which are not entries (the summary, the header) are
+    skipped.
+
+    With ``interface`` (short or canonical name), only the entries of that interface
+    are kept. Interface names are made canonical once per interface.
+    """
+
+    regex = ARP_ENTRY_REGEX
+
+    def __init__(self, interface=""):
+        self._names = {}
+        self.interface = ""
+        if interface:
+            self.interface = self._name(short_interface_name(interface))
+
+    def parse(self, lines):
+        """Yield an entry for every entry line in the iterable of lines."""
+        for line in lines:
+            entry = self.parse_line(line)
+            if entry is not None:
+                yield entry
+
+    def parse_line(self, line):
+        """Parse a single line, returning an entry or None."""
+        match = self.regex.match(line)
+        if match is None:
+            return None
+        interface = self._name(match.group("interface"))
+        if self.interface and interface != self.interface:
+            return None
+        return self._entry(match, interface)
+
+    def _name(self, interface):
+        name = self._names.get(interface)
+        if name is None:
+            name = canonical_interface_name(interface, addl_name_map=dellos6_interfaces)
+            self._names[interface] = name
+        return name
+
+    def _entry(self, match, interface):
+        return {
+            "interface": interface,
+            "mac": fast_mac(match.group("mac")),
+            "ip": match.group("ip"),
+            "age": float(parse_arp_age(match.group("age"))),
+        }
+
+
+class IPv6NeighborsParser(ARPTableParser):
+    """Same as ARPTableParser, for the get_ipv6_neighbors_table() entries."""
+
+    regex = IPV6_NEIGHBOR_REGEX
+
+    def _entry(self, match, interface):
+        return {
+            "interface": interface,
+            "mac": fast_mac(match.group("mac")),
+            "ip": match.group("ip"),
+            # Dell OS6 doesn't support age
+            "age": -0.0,
+            "state": match.group("state").upper(),
+        }
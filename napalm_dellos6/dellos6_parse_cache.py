@@ -0,0 +1,73 @@
+"""Memoization of parsed command outputs."""
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def _copy(entries):
+    # TextFSM values are strings or, for List values, lists of strings
+    return [
+        {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in entry.items()
+        }
+        for entry in entries
+    ]
+
+
+class ParseCache(object):
+    """
+    Bounded LRU cache of parse results keyed by (template, hash of the raw output).
+
+    Unchanged outputs, such as the VLAN table or the user accounts between two polls,
+    are then not run through TextFSM again. Only a digest of each output is kept, and
+    at most ``size`` results. Results are copied on the way in and out, so callers
+    may modify them freely.
+    """
+
+    def __init__(self, size=256):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(template, raw_output):
+        digest = hashlib.blake2b(raw_output.encode("utf-8"), digest_size=16)
+        return template, digest.digest()
+
+    def parse(self, template, raw_output, parser):
+        """Return parser(raw_output) for the template, reusing a previous result."""
+        key = self._key(template, raw_output)
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(entries)
+            self.misses += 1
+        entries = parser(raw_output)
+        with self._lock:
+            self._entries[key] = _copy(entries)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return the number of hits, misses, cached results and the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,1566 @@
+"""Connection-free parsing of Dell OS6 command outputs into the getter structures."""
+import re
+from ipaddress import IPv4Interface, IPv6Interface, ip_network
+
+from napalm.base.helpers import (
+    abbreviated_interface_name,
+    canonical_interface_name,
+    mac,
+    sanitize_configs,
+    textfsm_extractor,
+)
+
+import napalm_dellos6.dellos6_constants as D6C
+from napalm_dellos6.dellos6_canonical_map import (
+    dellos6_interfaces,
+    dellos6_reverse_mapping,
+)
+from napalm_dellos6.dellos6_routes import RouteTable
+from napalm_dellos6.dellos6_sections import COMMAND_SECTIONS
+from napalm_dellos6.dellos6_vlans import (
+    VlanIndex,
+    member_ports,
+    vlan_ids_list,
+    vlan_list,
+)
+
+# Easier to store these as constants
+HOUR_SECONDS = 3600
+DAY_SECONDS = 24 * HOUR_SECONDS
+WEEK_SECONDS = 7 * DAY_SECONDS
+YEAR_SECONDS = 365 * DAY_SECONDS
+
+# ARP entry age, e.g. "0h 13m 33s" ("n/a" for local entries)
+ARP_AGE_REGEX = re.compile(r"(?:(\d+)h)?\s*(?:(\d+)m)?\s*(?:(\d+)s)?")
+
+USERNAME_REGEX = re.compile(
+    r"^username\s+\"(?P<username>\S+)\"\s+password\s+(?P<pwd_hash>[0-9a-f]+).*", re.M
+)
+
+
+def parse_uptime(uptime_str):
+    """
+    Extract the uptime string from the given Dell OS6 Device.
+    Return the uptime in seconds as an integer
+    """
+    # Initialize to zero
+    (days, hours, minutes, seconds) = (0, 0, 0, 0)
+
+    uptime_str = uptime_str.strip()
+    time_list = re.split(", |:", uptime_str)
+    for element in time_list:
+        if re.search("days", element):
+            days = int(element.strip(" days"))
+        elif re.search("h", element):
+            hours = int(element.strip("h"))
+        elif re.search("m", element):
+            minutes = int(element.strip("m"))
+        elif re.search("s", element):
+            seconds = int(element.strip("s"))
+
+    uptime_sec = (
+        (days * DAY_SECONDS) + (hours * HOUR_SECONDS) + (minutes * 60) + seconds
+    )
+    return uptime_sec
+
+
+def parse_arp_age(arp_age_str):
+    """
+    Extract the ARP time string from the given Dell OS6 Device.
+    Return the ARP time in seconds as an integer
+    """
+    hours, minutes, seconds = ARP_AGE_REGEX.match(arp_age_str.strip()).groups()
+    return int(hours or 0) * HOUR_SECONDS + int(minutes or 0) * 60 + int(seconds or 0)
+
+
+def parse_route_age(route_age_str):
+    """
+    Extract the route age string (e.g. "12d:04h:27m" or "00h:05m:12s") from the
+    given Dell OS6 Device.
+    Return the route age in seconds as an integer
+    """
+    units = {
+        "w": WEEK_SECONDS,
+        "d": DAY_SECONDS,
+        "h": HOUR_SECONDS,
+        "m": 60,
+        "s": 1,
+    }
+    route_age_sec = 0
+    for value, unit in re.findall(r"(\d+)([wdhms])", route_age_str):
+        route_age_sec += int(value) * units[unit]
+    return route_age_sec
+
+
+def short_interface_name(interface):
+    """Return the short name of an interface as the CLI expects it, e.g. "Te1/0/1"."""
+    return abbreviated_interface_name(
+        canonical_interface_name(interface, addl_name_map=dellos6_interfaces),
+        addl_name_map=dellos6_interfaces,
+        addl_reverse_map=dellos6_reverse_mapping,
+    )
+
+
+def is_port(interface):
+    """True for ports and port-channels, which have per-interface show commands."""
+    name = canonical_interface_name(interface, addl_name_map=dellos6_interfaces)
+    return not name.lower().startswith(D6C.DELLOS6_NON_PORT_INTERFACES)
+
+
+def match_routes(route_tables, destination, protocol="", longer=False):
+    """
+    Return the get_route_to() result for destination from a list of RouteTable
+    snapshots, see DellOS6Driver.get_route_to(). An empty destination matches all
+    the routes. Prefixes are returned normalized, e.g. "10.1.2.0/24" for
+    "10.1.2.3/24".
+    """
+    prefix = ""
+    if destination:
+        # Raises ValueError for a destination which is not an address or a prefix
+        prefix = str(ip_network(destination, strict=False))
+    routes = {}
+    for route_table in route_tables:
+        if not prefix:
+            matches = route_table.to_dict()
+        elif longer:
+            matches = route_table.longer(prefix)
+        elif "/" in destination:
+            matches = {prefix: route_table.routes(prefix)}
+        else:
+            match, prefix_routes = route_table.lookup(destination)
+            matches = {match: prefix_routes}
+        for route_prefix, prefix_routes in matches.items():
+            for route in prefix_routes:
+                if protocol and route["protocol"] != protocol.lower():
+                    continue
+                routes.setdefault(route_prefix, []).append(dict(route))
+    return routes
+
+
+class DellOS6Parser(object):
+    """
+    Turns the raw outputs of Dell OS6 show commands into the structures returned by
+    the getters of DellOS6Driver, without a connection to the device.
+
+    Each get_*() method takes ``outputs``, a dict of command to raw output, and the
+    keyword arguments of the driver getter of the same name. commands() returns the
+    commands a getter still needs. Some depend on the output of others (e.g. the
+    per-neighbor "show lldp remote-device detail" commands), so it is called again
+    until it returns nothing::
+
+        parser = DellOS6Parser()
+        outputs = {}
+        commands = parser.commands("get_lldp_neighbors_detail")
+        while commands:
+            outputs.update((command, run(command)) for command in commands)
+            commands = parser.commands("get_lldp_neighbors_detail", outputs)
+        parser.get_lldp_neighbors_detail(outputs)
+
+    The value of a command parsed with a single template may also be the list of
+    entries already parsed from its output, as the driver passes for per-interface
+    and per-unit queries. Apart from the optional ParseCache, the parser keeps no
+    state, so one instance can parse the outputs of many devices.
+    """
+
+    def __init__(self, parse_cache=None):
+        self.parse_cache = parse_cache
+
+    def parse(self, template, raw_output):
+        """
+        Parse ``raw_output`` with a TextFSM template. With a parse cache, an output
+        identical to one parsed before is not parsed again.
+        """
+        if self.parse_cache is None:
+            return textfsm_extractor(self, template, raw_output)
+        return self.parse_cache.parse(
+            template, raw_output, lambda raw: textfsm_extractor(self, template, raw)
+        )
+
+    @staticmethod
+    def _output(outputs, command):
+        try:
+            return outputs[command]
+        except KeyError:
+            raise ValueError("No output for {!r}".format(command))
+
+    def _entries(self, outputs, command, template):
+        """Return the entries parsed from the output of command with template."""
+        output = self._output(outputs, command)
+        if isinstance(output, list):
+            return output
+        return self.parse(template, output)
+
+    def _sections(self, outputs, command, templates):
+        """
+        Return a dict of template name to the entries parsed from the output of
+        command, a multi-section output of dellos6_sections.COMMAND_SECTIONS, walking
+        the output once for all the templates. With a parse cache, the walk only
+        happens if one of the templates misses.
+        """
+        output = self._output(outputs, command)
+        if isinstance(output, list):
+            return {template: output for template in templates}
+        if self.parse_cache is None:
+            return COMMAND_SECTIONS[command].parse(output, templates)
+        walked = {}
+
+        def walk(template):
+            if not walked:
+                walked.update(COMMAND_SECTIONS[command].parse(output, templates))
+            return walked[template]
+
+        return {
+            template: self.parse_cache.parse(
+                template, output, lambda raw, template=template: walk(template)
+            )
+            for template in templates
+        }
+
+    @staticmethod
+    def _filter(entries, interfaces, key="interface"):
+        """Return the entries of the given interfaces, or all of them if None."""
+        if interfaces is None:
+            return entries
+        wanted = set(short_interface_name(name) for name in interfaces)
+        return [
+            entry for entry in entries if short_interface_name(entry[key]) in wanted
+        ]
+
+    def commands(self, getter, outputs=None, **kwargs):
+        """
+        Return the commands ``getter`` (e.g. "get_vlans") needs for the given keyword
+        arguments which are not in outputs yet.
+        """
+        if outputs is None:
+            outputs = {}
+        method = getattr(self, "_{}_commands".format(getter), None)
+        if method is not None:
+            commands = method(outputs, **kwargs)
+        elif getter in D6C.DELLOS6_GETTER_COMMANDS:
+            commands = D6C.DELLOS6_GETTER_COMMANDS[getter]
+        else:
+            raise ValueError("Unknown getter: {}".format(getter))
+        return [
+            command for command in dict.fromkeys(commands) if command not in outputs
+        ]
+
+    def interface_list(self, outputs):
+        """
+        Returns a list of all interfaces on the device, from "show interfaces status"
+        and "show ip interface"
+        """
+        show_int_status = self._entries(
+            outputs, "show interfaces status", "show_interfaces_status"
+        )
+        show_ip_int = self._entries(outputs, "show ip interface", "show_ip_interface")
+
+        interface_list = []
+        for interface in show_int_status + show_ip_int:
+            interface_list.append(
+                canonical_interface_name(
+                    interface["interface"], addl_name_map=dellos6_interfaces
+                )
+            )
+
+        return interface_list
+
+    def system_facts(self, outputs):
+        """Return the uptime, hostname and stack unit numbers of "show system"."""
+        sections = self._sections(
+            outputs, "show system", ["show_system-basic", "show_system-units"]
+        )
+        show_sys = sections["show_system-basic"]
+        return {
+            "uptime": parse_uptime(show_sys[0]["uptime"]),
+            "hostname": show_sys[0]["sys_name"],
+            "units": [int(unit["unit"]) for unit in sections["show_system-units"]],
+        }
+
+    def lldp_local(self, outputs):
+        """
+        Return the LLDP chassis ID (the burned-in MAC address) and system name of the
+        switch from "show system".
+        """
+        show_sys = self._sections(outputs, "show system", ["show_system-basic"])[
+            "show_system-basic"
+        ]
+        return {
+            "chassis_id": mac(show_sys[0]["mac_addr"]),
+            "system_name": show_sys[0]["sys_name"],
+        }
+
+    def static_facts(self, outputs):
+        """
+        Return the OS version, serial number, model and domain name from "show
+        version", "show switch" and "show hosts".
+        """
+        show_ver = self._entries(outputs, "show version", "show_version")
+        show_sw = self._entries(outputs, "show switch", "show_switch")
+        show_hosts = self._entries(outputs, "show hosts", "show_hosts")
+
+        os_version = ""
+        for switch in show_sw:
+            if switch["status_mgmt"] == "Mgmt Sw":
+                os_version = switch["version"]
+
+        return {
+            "os_version": str(os_version),
+            "serial_number": str(show_ver[0]["serial_num"]),
+            "model": str(show_ver[0]["model"]),
+            "domain_name": show_hosts[0]["domain"],
+        }
+
+    def get_facts(self, outputs, system=None, static=None, interface_list=None):
+        """
+        See DellOS6Driver.get_facts(). system, static and interface_list are the
+        results of system_facts(), static_facts() and interface_list() if already
+        known, e.g. from the facts cache.
+        """
+        if system is None:
+            system = self.system_facts(outputs)
+        if static is None:
+            static = self.static_facts(outputs)
+        if interface_list is None:
+            interface_list = self.interface_list(outputs)
+
+        hostname = system["hostname"]
+        fqdn = "N/A"
+        domain_name = static["domain_name"]
+        if domain_name != "Unknown" and hostname != "Unknown":
+            fqdn = "{}.{}".format(hostname, domain_name)
+
+        return {
+            "uptime": system["uptime"],
+            "vendor": "Dell",
+            "os_version": static["os_version"],
+            "serial_number": static["serial_number"],
+            "model": static["model"],
+            "hostname": str(hostname),
+            "fqdn": fqdn,
+            "interface_list": interface_list,
+        }
+
+    @staticmethod
+    def interfaces_commands(fields=None):
+        """
+        Return the commands get_interfaces() needs for the given fields (all fields if
+        None). See D6C.DELLOS6_INTERFACE_FIELD_COMMANDS.
+        """
+        if fields is None:
+            fields = D6C.DELLOS6_INTERFACE_FIELD_COMMANDS
+        commands = ["show interfaces status", "show ip interface"]
+        for field in fields:
+            if field not in D6C.DELLOS6_INTERFACE_FIELD_COMMANDS:
+                raise ValueError("Unknown interface field: {}".format(field))
+            for command in D6C.DELLOS6_INTERFACE_FIELD_COMMANDS[field]:
+                if command not in commands:
+                    commands.append(command)
+        return commands
+
+    def _get_interfaces_commands(self, outputs, fields=None, interfaces=None):
+        return self.interfaces_commands(fields)
+
+    def get_interfaces(self, outputs, fields=None, interfaces=None):
+        """See DellOS6Driver.get_interfaces()."""
+
+        # default values.
+        last_flapped = -1.0
+
+        commands = self.interfaces_commands(fields)
+        show_int_status = self._filter(
+            self._entries(outputs, "show interfaces status", "show_interfaces_status"),
+            interfaces,
+        )
+        show_ip_int = self._filter(
+            self._entries(outputs, "show ip interface", "show_ip_interface"),
+            interfaces,
+        )
+        show_switch_stack_ports = []
+        show_int_config = []
+        show_int = []
+        show_int_desc = []
+        if "show switch stack-ports" in commands:
+            show_switch_stack_ports = self._entries(
+                outputs, "show switch stack-ports", "show_switch_stack-ports"
+            )
+        if "show interfaces configuration" in commands:
+            show_int_config = self._entries(
+                outputs,
+                "show interfaces configuration",
+                "show_interfaces_configuration",
+            )
+        if "show interfaces" in commands:
+            show_int = self._entries(outputs, "show interfaces", "show_interfaces")
+        if "show interfaces description" in commands:
+            show_int_desc = self._entries(
+                outputs, "show interfaces description", "show_interfaces_description"
+            )
+
+        interface_dict = {}
+        for interface in show_int_status:
+            interface_name = canonical_interface_name(
+                interface["interface"], addl_name_map=dellos6_interfaces
+            )
+            if re.search("down", interface["link_state"], re.IGNORECASE):
+                is_up = False
+            if re.search("up", interface["link_state"], re.IGNORECASE):
+                is_up = True
+            interface_dict[interface_name] = {"is_up": is_up}
+        for interface in show_ip_int:
+            interface_name = canonical_interface_name(
+                interface["interface"], addl_name_map=dellos6_interfaces
+            )
+            if re.search("down", interface["link_state"], re.IGNORECASE):
+                is_up = False
+            if re.search("up", interface["link_state"], re.IGNORECASE):
+                is_up = True
+            # SVIs cannot be administratively disabled
+            is_enabled = True
+            interface_dict[interface_name] = {"is_up": is_up, "is_enabled": is_enabled}
+        # Set some defaults
+        for interface in interface_dict:
+            interface_dict[interface]["description"] = ""
+            interface_dict[interface]["last_flapped"] = last_flapped
+            interface_dict[interface]["mtu"] = 1500
+            interface_dict[interface]["mac_address"] = ""
+            interface_dict[interface]["speed"] = -1
+        for interface in show_switch_stack_ports:
+            interface_name = canonical_interface_name(
+                interface["interface"], addl_name_map=dellos6_interfaces
+            )
+            if interface_name not in interface_dict:
+                continue
+            if re.search("link down", interface["link_state"], re.IGNORECASE):
+                is_up = False
+            if re.search("link up", interface["link_state"], re.IGNORECASE):
+                is_up = True
+            speed = -1
+            if interface["speed"].isdigit():
+                # Speed is reported in Gbps
+                speed = int(interface["speed"]) * 1000
+            interface_dict[interface_name]["is_up"] = is_up
+            interface_dict[interface_name]["speed"] = speed
+        for interface in show_int_config:
+            interface_name = canonical_interface_name(
+                interface["interface"], addl_name_map=dellos6_interfaces
+            )
+            if interface_name in interface_dict:
+                if re.search("down", interface["admin_state"], re.IGNORECASE):
+                    is_enabled = False
+                if re.search("up", interface["admin_state"], re.IGNORECASE):
+                    is_enabled = True
+                if interface["speed"].isdigit():
+                    interface_dict[interface_name]["speed"] = int(interface["speed"])
+                if not interface["mtu"].isdigit():
+                    mtu = -1
+                else:
+                    mtu = int(interface["mtu"])
+                interface_dict[interface_name]["is_enabled"] = is_enabled
+                interface_dict[interface_name]["mtu"] = mtu
+        for interface in show_int_desc:
+            interface_name = canonical_interface_name(
+                interface["interface"], addl_name_map=dellos6_interfaces
+            )
+            if interface_name in interface_dict:
+                interface_dict[interface_name]["description"] = interface["desc"]
+        for interface in show_int:
+            interface_name = canonical_interface_name(
+                interface["interface"], addl_name_map=dellos6_interfaces
+            )
+            if interface_name in interface_dict:
+                interface_dict[interface_name]["mac_address"] = mac(
+                    interface["mac_address"]
+                )
+
+        if fields is not None:
+            for interface in interface_dict:
+                interface_dict[interface] = {
+                    field: interface_dict[interface][field]
+                    for field in fields
+                    if field in interface_dict[interface]
+                }
+
+        return interface_dict
+
+    def _lldp_detail(self, outputs, lldp_entry):
+        return self._entries(
+            outputs,
+            "show lldp remote-device detail " + lldp_entry["interface"],
+            "show_lldp_remote-device_detail",
+        )
+
+    def _get_lldp_neighbors_commands(self, outputs):
+        commands = ["show lldp remote-device all"]
+        if commands[0] in outputs:
+            for lldp_entry in self._entries(
+                outputs, commands[0], "show_lldp_remote-device_all"
+            ):
+                # The host name column may be truncated, the detail has it in full
+                if lldp_entry["host_name"]:
+                    commands.append(
+                        "show lldp remote-device detail " + lldp_entry["interface"]
+                    )
+        return commands
+
+    def get_lldp_neighbors(self, outputs):
+        """See DellOS6Driver.get_lldp_neighbors()."""
+        show_lldp_remote_device_all = self._entries(
+            outputs, "show lldp remote-device all", "show_lldp_remote-device_all"
+        )
+
+        lldp = {}
+        for lldp_entry in show_lldp_remote_device_all:
+            interface = canonical_interface_name(
+                lldp_entry["interface"], addl_name_map=dellos6_interfaces
+            )
+            lldp[interface] = []
+            hostname = lldp_entry["host_name"]
+            if not hostname:
+                hostname = lldp_entry["chassis_id"]
+            else:
+                hostname = self._lldp_detail(outputs, lldp_entry)[0]["host_name"]
+            lldp_dict = {"port": lldp_entry["port_id"], "hostname": hostname}
+            lldp[interface].append(lldp_dict)
+
+        return lldp
+
+    def lldp_statistics(self, outputs):
+        """
+        Return the LLDP table statistics of "show lldp statistics": inserts,
+        deletes, drops, ageouts and last update. None if they cannot be read.
+        """
+        show_lldp_stats = self._entries(
+            outputs, "show lldp statistics", "show_lldp_statistics"
+        )
+        if not show_lldp_stats:
+            return None
+        stats = show_lldp_stats[0]
+        return {
+            "inserts": int(stats["inserts"]),
+            "deletes": int(stats["deletes"]),
+            "drops": int(stats["drops"]),
+            "ageouts": int(stats["ageouts"]),
+            "last_update": stats["last_update"],
+        }
+
+    def _get_lldp_neighbors_detail_commands(self, outputs, interface=""):
+        commands = ["show lldp remote-device all"]
+        if commands[0] in outputs:
+            for lldp_entry in self._entries(
+                outputs, commands[0], "show_lldp_remote-device_all"
+            ):
+                commands.append(
+                    "show lldp remote-device detail " + lldp_entry["interface"]
+                )
+        return commands
+
+    def get_lldp_neighbors_detail(self, outputs, interface=""):
+        """See DellOS6Driver.get_lldp_neighbors_detail()."""
+        show_lldp_remote_device_all = self._entries(
+            outputs, "show lldp remote-device all", "show_lldp_remote-device_all"
+        )
+
+        lldp = {}
+        for lldp_entry in show_lldp_remote_device_all:
+            interface = canonical_interface_name(
+                lldp_entry["interface"], addl_name_map=dellos6_interfaces
+            )
+            lldp[interface] = {}
+            show_lldp_remote_device_detail = self._lldp_detail(outputs, lldp_entry)
+            # We don't yet support reporting the parent interface
+            parent_interface = ""
+            remote_chassis_id = lldp_entry["chassis_id"]
+            remote_system_name = show_lldp_remote_device_detail[0]["host_name"]
+            remote_port = show_lldp_remote_device_detail[0]["port_id"]
+            remote_port_description = show_lldp_remote_device_detail[0]["port_desc"]
+            remote_system_description = show_lldp_remote_device_detail[0]["sys_desc"]
+            if show_lldp_remote_device_detail[0]["sys_cap_sup"]:
+                remote_system_capab = (
+                    show_lldp_remote_device_detail[0]["sys_cap_sup"]
+                    .replace(" ", "")
+                    .split(",")
+                )
+            else:
+                remote_system_capab = []
+            if show_lldp_remote_device_detail[0]["sys_cap_oper"]:
+                remote_system_enable_capab = (
+                    show_lldp_remote_device_detail[0]["sys_cap_oper"]
+                    .replace(" ", "")
+                    .split(",")
+                )
+            else:
+                remote_system_enable_capab = []
+
+            entry_list = []
+            entry = {
+                "parent_interface": parent_interface,
+                "remote_chassis_id": remote_chassis_id,
+                "remote_system_name": remote_system_name,
+                "remote_port": remote_port,
+                "remote_port_description": remote_port_description,
+                "remote_system_description": remote_system_description,
+                "remote_system_capab": remote_system_capab,
+                "remote_system_enable_capab": remote_system_enable_capab,
+            }
+            entry_list.append(entry)
+            lldp[interface] = entry_list
+
+        return lldp
+
+    def _bgp_neighbor_entries(self, outputs):
+        """
+        Return the parsed "show ip bgp summary" output and the combined list of IPv4
+        and IPv6 neighbor entries.
+        """
+        show_ip_bgp_summary = self._entries(
+            outputs, "show ip bgp summary", "show_ip_bgp_summary"
+        )
+        show_ip_bgp_neighbors = self._entries(
+            outputs, "show ip bgp neighbors", "show_ip_bgp_neighbors"
+        )
+        show_bgp_ipv6_neighbors = self._entries(
+            outputs, "show bgp ipv6 neighbors", "show_bgp_ipv6_neighbors"
+        )
+
+        return show_ip_bgp_summary, show_ip_bgp_neighbors + show_bgp_ipv6_neighbors
+
+    def get_bgp_neighbors(self, outputs):
+        """See DellOS6Driver.get_bgp_neighbors()."""
+        show_ip_bgp_summary, neighbors = self._bgp_neighbor_entries(outputs)
+
+        router_id = show_ip_bgp_summary[0]["bgp_router_id"]
+        local_as = int(show_ip_bgp_summary[0]["local_as"])
+        bgp_neighbors = {"global": {"router_id": router_id, "peers": {}}}
+        for neighbor in neighbors:
+            peer_addr = neighbor["peer_addr"]
+            bgp_neighbors["global"]["peers"][peer_addr] = {
+                "local_as": local_as,
+                "remote_as": int(neighbor["peer_as"]),
+                "remote_id": neighbor["peer_id"],
+                "is_up": (neighbor["peer_state"] == "ESTABLISHED"),
+                "is_enabled": (neighbor["peer_status_admin"] == "START"),
+                "description": neighbor.get("desc", ""),
+                "uptime": -1,
+                "address_family": {},
+            }
+            if neighbor["ipv4_ucast"] != "None":
+                bgp_neighbors["global"]["peers"][peer_addr]["address_family"][
+                    "ipv4"
+                ] = {
+                    "sent_prefixes": int(neighbor["ipv4_pfx_adv_tx"]),
+                    "accepted_prefixes": int(neighbor["ipv4_pfx_current_rx"]),
+                    "received_prefixes": int(neighbor["ipv4_pfx_adv_rx"]),
+                }
+            if neighbor["ipv6_ucast"] != "None":
+                bgp_neighbors["global"]["peers"][peer_addr]["address_family"][
+                    "ipv6"
+                ] = {
+                    "sent_prefixes": int(neighbor["ipv6_pfx_adv_tx"]),
+                    "accepted_prefixes": int(neighbor["ipv6_pfx_current_rx"]),
+                    "received_prefixes": int(neighbor["ipv6_pfx_adv_rx"]),
+                }
+
+        return bgp_neighbors
+
+    def get_bgp_neighbors_detail(self, outputs, neighbor_address=""):
+        """See DellOS6Driver.get_bgp_neighbors_detail()."""
+
+        def _int(value, default=-1):
+            return int(value) if value and value.isdigit() else default
+
+        def _pfx(neighbor, field):
+            return sum(
+                _int(neighbor.get("{}_pfx_{}".format(afi, field)), 0)
+                for afi in ("ipv4", "ipv6")
+            )
+
+        show_ip_bgp_summary, neighbors = self._bgp_neighbor_entries(outputs)
+
+        summary = show_ip_bgp_summary[0]
+        router_id = summary["bgp_router_id"]
+        local_as = int(summary["local_as"])
+        multipath = int(summary["paths_max"]) > 1 or int(summary["paths_ibgp_max"]) > 1
+        bgp_detail = {"global": {}}
+        for neighbor in neighbors:
+            if neighbor_address and neighbor["peer_addr"] != neighbor_address:
+                continue
+            remote_as = int(neighbor["peer_as"])
+            holdtime_configured = _int(
+                neighbor["hold_time_admin"], int(summary["hold_time_admin"])
+            )
+            keepalive_configured = _int(
+                neighbor["keepalive_admin"], int(summary["keepalive_admin"])
+            )
+            bgp_detail["global"].setdefault(remote_as, []).append(
+                {
+                    "up": (neighbor["peer_state"] == "ESTABLISHED"),
+                    "local_as": local_as,
+                    "remote_as": remote_as,
+                    "router_id": router_id,
+                    "local_address": neighbor["local_addr"],
+                    "routing_table": "",
+                    "local_address_configured": (
+                        neighbor["upd_src"] not in ("", "None", ".")
+                    ),
+                    "local_port": int(neighbor["local_port"]),
+                    "remote_address": neighbor["peer_addr"],
+                    "remote_port": int(neighbor["peer_port"]),
+                    "multihop": False,
+                    "multipath": multipath,
+                    "remove_private_as": False,
+                    "import_policy": "",
+                    "export_policy": "",
+                    "input_messages": int(neighbor["msg_rx_total"]),
+                    "output_messages": int(neighbor["msg_tx_total"]),
+                    "input_updates": int(neighbor["msg_rx_upd"]),
+                    "output_updates": int(neighbor["msg_tx_upd"]),
+                    "messages_queued_out": 0,
+                    "connection_state": neighbor["peer_state"].capitalize(),
+                    "previous_connection_state": "",
+                    "last_event": neighbor["error_last"],
+                    "suppress_4byte_as": False,
+                    "local_as_prepend": False,
+                    "holdtime": _int(neighbor["hold_time_oper"], holdtime_configured),
+                    "configured_holdtime": holdtime_configured,
+                    "keepalive": _int(neighbor["keepalive_oper"], keepalive_configured),
+                    "configured_keepalive": keepalive_configured,
+                    "active_prefix_count": _pfx(neighbor, "current_rx"),
+                    "received_prefix_count": _pfx(neighbor, "adv_rx"),
+                    "accepted_prefix_count": _pfx(neighbor, "accept_rx"),
+                    "suppressed_prefix_count": 0,
+                    "advertised_prefix_count": _pfx(neighbor, "adv_tx"),
+                    "flap_count": int(neighbor["estab_trans"]),
+                }
+            )
+
+        return bgp_detail
+
+    def get_environment(self, outputs):
+        """See DellOS6Driver.get_environment()."""
+        sections = self._sections(
+            outputs,
+            "show system",
+            ["show_system-fans", "show_system-temps", "show_system-power_supplies"],
+        )
+        show_sys_fans = sections["show_system-fans"]
+        show_sys_temps = sections["show_system-temps"]
+        show_sys_power = sections["show_system-power_supplies"]
+        show_proc_cpu = self._entries(outputs, "show process cpu", "show_process_cpu")
+
+        environment = {}
+
+        environment.setdefault("fans", {})
+        environment.setdefault("temperature", {})
+        environment.setdefault("power", {})
+        environment.setdefault("cpu", {})
+        environment.setdefault("memory", {})
+
+        for fan in show_sys_fans:
+            environment["fans"].setdefault(
+                "unit " + fan["unit"] + " " + fan["description"], {}
+            )
+            if fan["status"] == "OK":
+                environment["fans"]["unit " + fan["unit"] + " " + fan["description"]][
+                    "status"
+                ] = True
+            else:
+                environment["fans"]["unit " + fan["unit"] + " " + fan["description"]][
+                    "status"
+                ] = False
+        for temp in show_sys_temps:
+            environment["temperature"].setdefault(
+                "unit " + temp["unit"] + " " + temp["description"], {}
+            )
+            environment["temperature"][
+                "unit " + temp["unit"] + " " + temp["description"]
+            ] = {
+                "temperature": float(temp["temp"]),
+                "is_alert": False,
+                "is_critical": False,
+            }
+        for power in show_sys_power:
+            environment["power"].setdefault(
+                "unit " + power["unit"] + " " + power["description"], {}
+            )
+            environment["power"][
+                "unit " + power["unit"] + " " + power["description"]
+            ] = {"status": False, "capacity": -1.0, "output": float(power["pwr_cur"])}
+            if power["status"] == "OK":
+                environment["power"][
+                    "unit " + power["unit"] + " " + power["description"]
+                ]["status"] = True
+        environment["cpu"][0] = {}
+        environment["cpu"][0]["%usage"] = 0.0
+        environment["cpu"][0]["%usage"] = float(show_proc_cpu[0]["cpu_60"])
+        environment["memory"] = {
+            "available_ram": int(show_proc_cpu[0]["mem_free"]) * 1024,
+            "used_ram": int(show_proc_cpu[0]["mem_alloc"]) * 1024,
+        }
+
+        return environment
+
+    def _get_interfaces_counters_commands(self, outputs, interfaces=None):
+        commands = ["show interfaces counters", "show interfaces counters errors"]
+        if interfaces is None:
+            commands = ["show interfaces status", "show ip interface"] + commands
+        return commands
+
+    def get_interfaces_counters(self, outputs, interfaces=None):
+        """See DellOS6Driver.get_interfaces_counters()."""
+        if interfaces is None:
+            interface_list = self.interface_list(outputs)
+        else:
+            interface_list = [
+                canonical_interface_name(
+                    short_interface_name(interface), addl_name_map=dellos6_interfaces
+                )
+                for interface in interfaces
+            ]
+
+        show_int_count = self._filter(
+            self._entries(
+                outputs, "show interfaces counters", "show_interfaces_counters"
+            ),
+            interfaces,
+        )
+        show_int_count_err = self._filter(
+            self._entries(
+                outputs,
+                "show interfaces counters errors",
+                "show_interfaces_counters_errors",
+            ),
+            interfaces,
+        )
+        # The outputs are split in several tables, each with a row per interface
+        int_count_by_name = {}
+        for int_count in show_int_count:
+            interface_name = canonical_interface_name(
+                int_count["interface"], addl_name_map=dellos6_interfaces
+            )
+            int_count_by_name.setdefault(interface_name, []).append(int_count)
+        int_count_err_by_name = {}
+        for int_count_err in show_int_count_err:
+            interface_name = canonical_interface_name(
+                int_count_err["interface"], addl_name_map=dellos6_interfaces
+            )
+            int_count_err_by_name.setdefault(interface_name, []).append(int_count_err)
+
+        int_counters = {}
+        for int_list in interface_list:
+            int_counters[int_list] = {
+                "tx_errors": -1,
+                "rx_errors": -1,
+                "tx_discards": -1,
+                "rx_discards": -1,
+                "tx_octets": -1,
+                "rx_octets": -1,
+                "tx_unicast_packets": -1,
+                "rx_unicast_packets": -1,
+                "tx_multicast_packets": -1,
+                "rx_multicast_packets": -1,
+                "tx_broadcast_packets": -1,
+                "rx_broadcast_packets": -1,
+            }
+
+            for int_count_err in int_count_err_by_name.get(int_list, []):
+                if (
+                    int_count_err["out_total"].isdigit()
+                    and int(int_count_err["out_total"]) >= 0
+                ):
+                    int_counters[int_list]["tx_errors"] = int(
+                        int_count_err["out_total"]
+                    )
+                if (
+                    int_count_err["in_total"].isdigit()
+                    and int(int_count_err["in_total"]) >= 0
+                ):
+                    int_counters[int_list]["rx_errors"] = int(int_count_err["in_total"])
+                if (
+                    int_count_err["out_discard"].isdigit()
+                    and int(int_count_err["out_discard"]) >= 0
+                ):
+                    int_counters[int_list]["tx_discards"] = int(
+                        int_count_err["out_discard"]
+                    )
+
+            for int_count in int_count_by_name.get(int_list, []):
+                if (
+                    int_count["out_total_octs"].isdigit()
+                    and int(int_count["out_total_octs"]) >= 0
+                ):
+                    int_counters[int_list]["tx_octets"] = int(
+                        int_count["out_total_octs"]
+                    )
+                if (
+                    int_count["in_total_octs"].isdigit()
+                    and int(int_count["in_total_octs"]) >= 0
+                ):
+                    int_counters[int_list]["rx_octets"] = int(
+                        int_count["in_total_octs"]
+                    )
+                if (
+                    int_count["out_ucast_pkts"].isdigit()
+                    and int(int_count["out_ucast_pkts"]) >= 0
+                ):
+                    int_counters[int_list]["tx_unicast_packets"] = int(
+                        int_count["out_ucast_pkts"]
+                    )
+                if (
+                    int_count["in_ucast_pkts"].isdigit()
+                    and int(int_count["in_ucast_pkts"]) >= 0
+                ):
+                    int_counters[int_list]["rx_unicast_packets"] = int(
+                        int_count["in_ucast_pkts"]
+                    )
+                if (
+                    int_count["out_mcast_pkts"].isdigit()
+                    and int(int_count["out_mcast_pkts"]) >= 0
+                ):
+                    int_counters[int_list]["tx_multicast_packets"] = int(
+                        int_count["out_mcast_pkts"]
+                    )
+                if (
+                    int_count["in_mcast_pkts"].isdigit()
+                    and int(int_count["in_mcast_pkts"]) >= 0
+                ):
+                    int_counters[int_list]["rx_multicast_packets"] = int(
+                        int_count["in_mcast_pkts"]
+                    )
+                if (
+                    int_count["out_bcast_pkts"].isdigit()
+                    and int(int_count["out_bcast_pkts"]) >= 0
+                ):
+                    int_counters[int_list]["tx_broadcast_packets"] = int(
+                        int_count["out_bcast_pkts"]
+                    )
+                if (
+                    int_count["in_bcast_pkts"].isdigit()
+                    and int(int_count["in_bcast_pkts"]) >= 0
+                ):
+                    int_counters[int_list]["rx_broadcast_packets"] = int(
+                        int_count["in_bcast_pkts"]
+                    )
+
+        return int_counters
+
+    @staticmethod
+    def arp_command(vrf=""):
+        """Return the command listing the ARP table of vrf (the default VRF if empty)."""
+        if vrf:
+            return "show arp vrf {}".format(vrf)
+        return "show arp"
+
+    def table_probe_command(self, table, vrf=""):
+        """
+        Return the summary command probing the table of the getter ``table`` (see
+        D6C.DELLOS6_TABLE_PROBES) in vrf, None if it has none.
+        """
+        probe = D6C.DELLOS6_TABLE_PROBES.get(table)
+        if probe is None:
+            return None
+        if vrf:
+            return "{} vrf {}".format(probe[0], vrf)
+        return probe[0]
+
+    def _table_probe_commands(self, outputs, table, vrf=""):
+        command = self.table_probe_command(table, vrf)
+        if command is None:
+            return []
+        if table != "get_arp_table" or vrf:
+            return [command]
+        # The ARP tables of all VRFs
+        commands = ["show ip vrf"]
+        if "show ip vrf" in outputs:
+            commands.extend(
+                self.table_probe_command(table, name) for name in self.vrfs(outputs)
+            )
+        return commands
+
+    def _table_counters(self, outputs, table, vrf=""):
+        entries = self._entries(
+            outputs,
+            self.table_probe_command(table, vrf),
+            D6C.DELLOS6_TABLE_PROBES[table][1],
+        )
+        if not entries:
+            return None
+        return {key: int(value) for key, value in entries[0].items() if value}
+
+    def table_probe(self, outputs, table, vrf=""):
+        """
+        Return the counters of the summary probing the table of the getter
+        ``table``, e.g. the dynamic, static and total counts of "show mac
+        address-table count", or for get_arp_table() of all VRFs a dict of VRF name
+        to counters. None if they cannot be read or the table has no summary.
+        """
+        if self.table_probe_command(table, vrf) is None:
+            return None
+        if table != "get_arp_table" or vrf:
+            return self._table_counters(outputs, table, vrf)
+        counters = {}
+        for name in self.vrfs(outputs):
+            counters[name] = self._table_counters(outputs, table, name)
+            if counters[name] is None:
+                return None
+        return counters
+
+    def _get_arp_table_commands(self, outputs, vrf=""):
+        if vrf:
+            return [self.arp_command(vrf)]
+        # The ARP tables of all VRFs
+        commands = ["show ip vrf"]
+        if "show ip vrf" in outputs:
+            commands.extend(self.arp_command(name) for name in self.vrfs(outputs))
+        return commands
+
+    def get_arp_table(self, outputs, vrf=""):
+        """
+        See DellOS6Driver.get_arp_table(). Without vrf, the tables of all the VRFs
+        of "show ip vrf", or of the default VRF only if that output is not given.
+        """
+        if vrf:
+            vrfs = [vrf]
+        elif "show ip vrf" in outputs:
+            vrfs = self.vrfs(outputs)
+        else:
+            vrfs = [""]
+        show_arp = []
+        for name in vrfs:
+            show_arp.extend(self._entries(outputs, self.arp_command(name), "show_arp"))
+
+        arp_table = []
+        for entry in show_arp:
+            arp_table.append(
+                {
+                    "interface": canonical_interface_name(
+                        entry["interface"], addl_name_map=dellos6_interfaces
+                    ),
+                    "mac": mac(entry["mac_address"]),
+                    "ip": entry["ip_address"],
+                    "age": float(parse_arp_age(entry["age"])),
+                }
+            )
+
+        return arp_table
+
+    def get_ntp_peers(self, outputs):
+        """See DellOS6Driver.get_ntp_peers()."""
+        show_sntp_status = self._entries(
+            outputs, "show sntp status", "show_sntp_status"
+        )
+
+        ntp_peers = {}
+        for peer in show_sntp_status:
+            ntp_peers[peer["server_ip"]] = {}
+
+        return ntp_peers
+
+    def get_ntp_servers(self, outputs):
+        """See DellOS6Driver.get_ntp_servers()."""
+        show_sntp_server = self._entries(
+            outputs, "show sntp server", "show_sntp_server"
+        )
+
+        ntp_servers = {}
+        for server in show_sntp_server:
+            ntp_servers[server["server_ip"]] = {}
+
+        return ntp_servers
+
+    def get_ntp_stats(self, outputs):
+        """See DellOS6Driver.get_ntp_stats()."""
+        show_sntp_stats = self._entries(outputs, "show sntp server", "show_sntp_server")
+
+        ntp_stats = []
+        for server in show_sntp_stats:
+            if server["status"] == "Success":
+                synchronized = True
+            else:
+                synchronized = False
+            ntp_stats.append(
+                {
+                    "remote": server["server_ip"],
+                    # Not supported
+                    "referenceid": "",
+                    "synchronized": synchronized,
+                    # Not supported
+                    "stratum": -1,
+                    # We only support parsing unicast servers right now
+                    "type": "u",
+                    # We don't support parsing this right now
+                    "when": "",
+                    # Not supported
+                    "hostpoll": -1,
+                    # Not supported
+                    "reachability": -1,
+                    # Not supported
+                    "delay": -0.0,
+                    # Not supported
+                    "offset": -0.0,
+                    # Not supported
+                    "jitter": -0.0,
+                }
+            )
+
+        return ntp_stats
+
+    def _get_interfaces_ip_commands(self, outputs):
+        commands = [
+            "show ip interface",
+            "show ip interface out-of-band",
+            "show ipv6 interface",
+            "show ipv6 interface out-of-band",
+        ]
+        for command, template in (
+            ("show ip interface", "show_ip_interface"),
+            ("show ipv6 interface", "show_ipv6_interface"),
+        ):
+            if command in outputs:
+                for int in self._entries(outputs, command, template):
+                    interface = canonical_interface_name(
+                        int["interface"], addl_name_map=dellos6_interfaces
+                    )
+                    commands.append(command + " " + interface)
+        return commands
+
+    def get_interfaces_ip(self, outputs):
+        """See DellOS6Driver.get_interfaces_ip()."""
+        show_ip_int = self._entries(outputs, "show ip interface", "show_ip_interface")
+        show_ip_int_oob = self._entries(
+            outputs, "show ip interface out-of-band", "show_ip_interface_out-of-band"
+        )
+        show_ipv6_int = self._entries(
+            outputs, "show ipv6 interface", "show_ipv6_interface"
+        )
+        show_ipv6_int_oob = self._entries(
+            outputs,
+            "show ipv6 interface out-of-band",
+            "show_ipv6_interface_out-of-band",
+        )
+
+        interfaces_ip = {}
+        for int in show_ip_int:
+            interface = canonical_interface_name(
+                int["interface"], addl_name_map=dellos6_interfaces
+            )
+            show_ip_int_vlan = self._entries(
+                outputs, "show ip interface " + interface, "show_ip_interface_vlan"
+            )
+            for vlan_int in show_ip_int_vlan:
+                if vlan_int["ip_addr_pri"]:
+                    interfaces_ip.setdefault(interface, {})
+                    interfaces_ip[interface].setdefault("ipv4", {})
+                    ip_address = str(IPv4Interface(vlan_int["ip_addr_pri"]).ip)
+                    prefix_len = IPv4Interface(
+                        vlan_int["ip_addr_pri"]
+                    ).network.prefixlen
+                    interfaces_ip[interface]["ipv4"][ip_address] = {
+                        "prefix_length": prefix_len
+                    }
+                if vlan_int["ip_addr_sec"]:
+                    for ip in vlan_int["ip_addr_sec"]:
+                        ip_address = str(IPv4Interface(ip).ip)
+                        prefix_len = IPv4Interface(ip).network.prefixlen
+                        interfaces_ip[interface]["ipv4"][ip_address] = {
+                            "prefix_length": prefix_len
+                        }
+        for int in show_ipv6_int:
+            interface = canonical_interface_name(
+                int["interface"], addl_name_map=dellos6_interfaces
+            )
+            show_ipv6_int_vlan = self._entries(
+                outputs, "show ipv6 interface " + interface, "show_ipv6_interface_vlan"
+            )
+            for vlan_int in show_ipv6_int_vlan:
+                if vlan_int["ipv6_pfx"]:
+                    interfaces_ip.setdefault(interface, {})
+                    interfaces_ip[interface].setdefault("ipv6", {})
+                    for ipv6 in vlan_int["ipv6_pfx"]:
+                        ipv6_address = str(IPv6Interface(ipv6).ip)
+                        prefix_len = IPv6Interface(ipv6).network.prefixlen
+                        interfaces_ip[interface]["ipv6"][ipv6_address] = {
+                            "prefix_length": prefix_len
+                        }
+        if show_ip_int_oob[0]["ip_addr"]:
+            interfaces_ip.setdefault("out-of-band", {})
+            interfaces_ip["out-of-band"].setdefault("ipv4", {})
+            ip_address = show_ip_int_oob[0]["ip_addr"]
+            prefix_len = IPv4Interface(
+                show_ip_int_oob[0]["ip_addr"] + "/" + show_ip_int_oob[0]["subnet_mask"]
+            ).network.prefixlen
+            interfaces_ip["out-of-band"]["ipv4"][ip_address] = {
+                "prefix_length": prefix_len
+            }
+        if show_ipv6_int_oob[0]["ipv6_pfx"]:
+            interfaces_ip.setdefault("out-of-band", {})
+            interfaces_ip["out-of-band"].setdefault("ipv6", {})
+            for ipv6 in show_ipv6_int_oob[0]["ipv6_pfx"]:
+                ipv6_address = str(IPv6Interface(ipv6).ip)
+                prefix_len = IPv6Interface(ipv6).network.prefixlen
+                interfaces_ip["out-of-band"]["ipv6"][ipv6_address] = {
+                    "prefix_length": prefix_len
+                }
+
+        return interfaces_ip
+
+    def get_ipv6_neighbors_table(self, outputs):
+        """See DellOS6Driver.get_ipv6_neighbors_table()."""
+        show_ipv6_neighbors = self._entries(
+            outputs, "show ipv6 neighbors", "show_ipv6_neighbors"
+        )
+
+        ipv6_neighbors = []
+        for neighbor in show_ipv6_neighbors:
+            interface_name = canonical_interface_name(
+                neighbor["int_name"], addl_name_map=dellos6_interfaces
+            )
+            mac_addr = mac(neighbor["mac_addr"])
+            ipv6_addr = neighbor["ipv6_addr"]
+            # Dell OS6 doesn't support age
+            age = -0.0
+            state = neighbor["state"].upper()
+            ipv6_neighbors.append(
+                {
+                    "interface": interface_name,
+                    "mac": mac_addr,
+                    "ip": ipv6_addr,
+                    "age": age,
+                    "state": state,
+                }
+            )
+
+        return ipv6_neighbors
+
+    @staticmethod
+    def vlan_command(vlan_ids=None):
+        """
+        Return the command listing the VLANs vlan_ids (see dellos6_vlans.vlan_ids_list())
+        or all of them if None.
+        """
+        if vlan_ids is None:
+            return "show vlan"
+        return "show vlan id {}".format(vlan_list(vlan_ids))
+
+    def _get_vlans_commands(self, outputs, vlan_ids=None, validate_interfaces=True):
+        commands = [self.vlan_command(vlan_ids)]
+        if validate_interfaces:
+            commands.append("show interfaces status")
+        return commands
+
+    def vlan_index(self, outputs, vlan_ids=None, validate_interfaces=True):
+        """
+        Return the VlanIndex of "show vlan" (or "show vlan id <list>" for vlan_ids)
+        over the ports of "show interfaces status". Without validate_interfaces, the
+        ports are those named by "show vlan" instead, including the members of port
+        ranges which do not exist on the switch. Port-channels come first, as "show
+        vlan" lists them.
+        """
+        show_vlan = self._entries(outputs, self.vlan_command(vlan_ids), "show_vlan")
+        if vlan_ids is not None:
+            wanted = set(vlan_ids_list(vlan_ids))
+            show_vlan = [
+                entry for entry in show_vlan if int(entry["vlan_id"]) in wanted
+            ]
+        if validate_interfaces:
+            show_int_status = self._entries(
+                outputs, "show interfaces status", "show_interfaces_status"
+            )
+            ports = [entry["interface"] for entry in show_int_status]
+        else:
+            ports = member_ports(
+                member for vlan_entry in show_vlan for member in vlan_entry["ports"]
+            )
+
+        index = VlanIndex(
+            [port for port in ports if port.startswith("Po")]
+            + [port for port in ports if not port.startswith("Po")]
+        )
+        for vlan_entry in show_vlan:
+            index.add(
+                vlan_entry["vlan_id"], vlan_entry["vlan_name"], vlan_entry["ports"]
+            )
+
+        return index
+
+    def get_vlans(self, outputs, vlan_ids=None, validate_interfaces=True):
+        """See DellOS6Driver.get_vlans()."""
+        return self.vlan_index(outputs, vlan_ids, validate_interfaces).to_dict()
+
+    def get_mac_address_table(self, outputs):
+        """See DellOS6Driver.get_mac_address_table()."""
+        get_mac_address_table = self._entries(
+            outputs, "show mac address-table", "show_mac_address_table"
+        )
+
+        table = []
+        for entry in get_mac_address_table:
+            table.append(
+                {
+                    "mac": mac(entry["mac"]),
+                    "interface": canonical_interface_name(
+                        entry["port"], addl_name_map=dellos6_interfaces
+                    ),
+                    "vlan": int(entry["vlan"]),
+                    "static": entry["type"] == "Static"
+                    or entry["type"] == "Management",
+                    "active": True,
+                    "moves": -1,
+                    "last_move": -1.0,
+                }
+            )
+
+        return table
+
+    @staticmethod
+    def route_command(vrf=""):
+        """Return the command listing the routes of vrf (the default VRF if empty)."""
+        if vrf:
+            return "show ip route vrf {}".format(vrf)
+        return "show ip route"
+
+    def vrfs(self, outputs):
+        """Return the VRF names of "show ip vrf", starting with "" for the default VRF."""
+        show_ip_vrf = self._entries(outputs, "show ip vrf", "show_ip_vrf")
+        return [""] + [vrf["vrf_name"] for vrf in show_ip_vrf]
+
+    def _get_route_table_commands(self, outputs, vrf=""):
+        return [self.route_command(vrf)]
+
+    def get_route_table(self, outputs, vrf=""):
+        """See DellOS6Driver._get_route_table()."""
+        show_ip_route = self._entries(outputs, self.route_command(vrf), "show_ip_route")
+
+        routes_per_prefix = {}
+        for route in show_ip_route:
+            routes_per_prefix[route["network"]] = (
+                routes_per_prefix.get(route["network"], 0) + 1
+            )
+        route_table = RouteTable(vrf or "default")
+        for route in show_ip_route:
+            # "*" marks the best route of a prefix which has several
+            active = bool(route["best"]) or routes_per_prefix[route["network"]] == 1
+            if route["interface"]:
+                outgoing_interface = canonical_interface_name(
+                    route["interface"], addl_name_map=dellos6_interfaces
+                )
+            else:
+                outgoing_interface = ""
+            route_table.add(
+                route["network"],
+                {
+                    "protocol": D6C.DELLOS6_ROUTE_PROTOCOLS.get(
+                        route["protocol"], route["protocol"]
+                    ),
+                    "current_active": active,
+                    "last_active": active,
+                    "age": parse_route_age(route["age"]),
+                    "next_hop": route["next_hop"],
+                    "outgoing_interface": outgoing_interface,
+                    "selected_next_hop": active,
+                    "preference": int(route["preference"]),
+                    "inactive_reason": "",
+                    "routing_table": vrf or "default",
+                    "protocol_attributes": {},
+                },
+            )
+
+        return route_table
+
+    def _get_route_to_commands(
+        self, outputs, destination="", protocol="", longer=False
+    ):
+        commands = ["show ip vrf"]
+        if "show ip vrf" in outputs:
+            commands.extend(self.route_command(vrf) for vrf in self.vrfs(outputs))
+        return commands
+
+    def get_route_to(self, outputs, destination="", protocol="", longer=False):
+        """See DellOS6Driver.get_route_to()."""
+        route_tables = [
+            self.get_route_table(outputs, vrf) for vrf in self.vrfs(outputs)
+        ]
+        return match_routes(route_tables, destination, protocol, longer)
+
+    def get_snmp_information(self, outputs):
+        """See DellOS6Driver.get_snmp_information()."""
+        show_sys = self._sections(outputs, "show system", ["show_system-basic"])[
+            "show_system-basic"
+        ]
+        sections = self._sections(
+            outputs, "show snmp", ["show_snmp-basic", "show_snmp-communities"]
+        )
+        show_snmp_basic = sections["show_snmp-basic"]
+        show_snmp_communities = sections["show_snmp-communities"]
+
+        snmp_info = {
+            # Dell OS6 doesn't support setting the chassis ID, it's derived from the hostname
+            "chassis_id": show_sys[0]["sys_name"],
+            "community": {},
+            "contact": show_snmp_basic[0]["contact"],
+            "location": show_snmp_basic[0]["location"],
+        }
+        for entry in show_snmp_communities:
+            community = entry["community"]
+            if entry["acl"] == "All":
+                acl = "N/A"
+            else:
+                # Dell OS6 only supports direct host entries, no ACLs
+                acl = entry["acl"] + "/32"
+            if entry["mode"] == "Read Only":
+                mode = "ro"
+            if entry["mode"] == "Read/Write":
+                mode = "rw"
+            snmp_info["community"][community] = {"acl": acl, "mode": mode}
+
+        return snmp_info
+
+    def get_users(self, outputs):
+        """
+        See DellOS6Driver.get_users(). The passwords are read from the output of "show
+        running-config | section username", and left empty without it.
+        """
+        show_users_accounts = self._entries(
+            outputs, "show users accounts", "show_users_accounts"
+        )
+
+        users = {}
+        for user in show_users_accounts:
+            users[user["username"]] = {
+                "level": int(user["priv"]),
+                "password": "",
+                "sshkeys": [],
+            }
+
+        output = outputs.get("show running-config | section username", "")
+        for match in USERNAME_REGEX.finditer(output):
+            username = match.groupdict()["username"]
+            pwd_hash = match.groupdict()["pwd_hash"]
+            users[username]["password"] = pwd_hash
+
+        return users
+
+    def get_optics(self, outputs, interfaces=None):
+        """See DellOS6Driver.get_optics()."""
+        show_fiber_ports_optical_transceiver = self._filter(
+            self._entries(
+                outputs,
+                "show fiber-ports optical transceiver",
+                "show_fiber-ports_optical-transceiver",
+            ),
+            interfaces,
+            key="int_name",
+        )
+
+        optics = {}
+        for interface in show_fiber_ports_optical_transceiver:
+            interface_name = canonical_interface_name(
+                interface["int_name"], addl_name_map=dellos6_interfaces
+            )
+            pwr_rx = float(interface["pwr_rx"])
+            pwr_tx = float(interface["pwr_tx"])
+            current = float(interface["current"])
+            optics[interface_name] = {
+                "physical_channels": {
+                    "channel": [
+                        {
+                            # We do not yet support multiple channels
+                            "index": 0,
+                            "state": {
+                                "input_power": {
+                                    "instant": pwr_rx,
+                                    "avg": -0.0,
+                                    "min": -0.0,
+                                    "max": -0.0,
+                                },
+                                "output_power": {
+                                    "instant": pwr_tx,
+                                    "avg": -0.0,
+                                    "min": -0.0,
+                                    "max": -0.0,
+                                },
+                                "laser_bias_current": {
+                                    "instant": current,
+                                    "avg": -0.0,
+                                    "min": -0.0,
+                                    "max": -0.0,
+                                },
+                            },
+                        }
+                    ]
+                }
+            }
+
+        return optics
+
+    def _get_config_commands(
+        self, outputs, retrieve="all", full=False, sanitized=False
+    ):
+        commands = []
+        if retrieve in ["all", "running"]:
+            commands.append("show running-config")
+        if retrieve in ["all", "startup"]:
+            commands.append("show startup-config")
+        return commands
+
+    def get_config(self, outputs, retrieve="all", full=False, sanitized=False):
+        """See DellOS6Driver.get_config()."""
+        running_config = ""
+        startup_config = ""
+        if retrieve in ["all", "running"]:
+            running_config = self._output(outputs, "show running-config")
+        if retrieve in ["all", "startup"]:
+            startup_config = self._output(outputs, "show startup-config")
+
+        configs = {
+            "running": running_config,
+            "startup": startup_config,
+            "candidate": "",
+        }
+
+        if sanitized:
+            return sanitize_configs(configs, D6C.DELLOS6_SANITIZE_FILTERS)
+
+        return configs
+
+    def _get_network_instances_commands(self, outputs, name=""):
+        commands = ["show ip vrf", "show ip vrf interface"]
+        return commands + self._get_interfaces_ip_commands(outputs)
+
+    def get_network_instances(self, outputs, name=""):
+        """See DellOS6Driver.get_network_instances()."""
+        show_ip_vrf = self._entries(outputs, "show ip vrf", "show_ip_vrf")
+        show_ip_vrf_interface = self._entries(
+            outputs, "show ip vrf interface", "show_ip_vrf_interface"
+        )
+        default_ip_interfaces = self.get_interfaces_ip(outputs)
+
+        network_instances = {}
+
+        network_instances["default"] = {
+            "name": "default",
+            "type": "DEFAULT_INSTANCE",
+            "state": {"route_distinguisher": ""},
+            "interfaces": {"interface": {}},
+        }
+        for interface in default_ip_interfaces.keys():
+            network_instances["default"]["interfaces"]["interface"][interface] = {}
+
+        for vrf in show_ip_vrf:
+            network_instances[vrf["vrf_name"]] = {
+                "name": vrf["vrf_name"],
+                "type": "L3VRF",
+                "state": {
+                    # Dell OS6 doesn't support RDs
+                    "route_distinguisher": ""
+                },
+                "interfaces": {"interface": {}},
+            }
+
+        for interface in show_ip_vrf_interface:
+            vrf_name = interface["vrf_name"]
+            interface_name = canonical_interface_name(
+                interface["int_name"], addl_name_map=dellos6_interfaces
+            )
+            network_instances[vrf_name]["interfaces"]["interface"][interface_name] = {}
+
+        return network_instances
@@ -0,0 +1,141 @@
+"""Parse command outputs collected from many devices in a pool of processes."""
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import napalm_dellos6.dellos6_constants as D6C
+from napalm_dellos6.dellos6_parse_cache import ParseCache
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+
+ParseResult = namedtuple("ParseResult", ["device", "getter", "result", "error"])
+
+# Parser of each worker process, created by the first chunk it parses
+_parser = None
+
+
+def _parse_chunk(jobs, parse_cache_size=0):
+    """Run a chunk of (device, getter, outputs, kwargs) jobs in a worker process."""
+    global _parser
+    if _parser is None:
+        parse_cache = ParseCache(parse_cache_size) if parse_cache_size else None
+        _parser = DellOS6Parser(parse_cache)
+    results = []
+    for device, getter, outputs, kwargs in jobs:
+        try:
+            result = getattr(_parser, getter)(outputs, **kwargs)
+        except Exception as exp:
+            results.append((device, getter, None, exp))
+        else:
+            results.append((device, getter, result, None))
+    return results
+
+
+class ParsePipeline(object):
+    """
+    Runs DellOS6Parser getters over collected outputs in a pool of processes, so
+    TextFSM and the getter loops of a fleet collection are not serialized by the GIL.
+
+    Jobs are submitted with submit(), which is thread safe: the collecting threads
+    submit the outputs of each device as soon as they have them (e.g. from
+    DellOS6Driver._collect_outputs()). Jobs are sent to the workers in chunks of
+    ``chunk_size`` to pay the pickling and inter-process round trip once per chunk.
+    results() yields a ParseResult(device, getter, result, error) for every job as
+    its chunk completes, in no particular order, until close() has been called and
+    every job is done::
+
+        with ParsePipeline() as pipeline:
+            for device, outputs in collected:
+                pipeline.submit(device, "get_interfaces", outputs)
+            pipeline.close()
+            for device, getter, result, error in pipeline.results():
+                ...
+
+    ``parse_cache`` sets the size of a ParseCache kept by each worker (none if 0).
+    """
+
+    def __init__(self, max_workers=None, chunk_size=None, parse_cache=0):
+        if chunk_size is None:
+            chunk_size = D6C.DELLOS6_PIPELINE_CHUNK_SIZE
+        self.chunk_size = chunk_size
+        self.parse_cache = parse_cache
+        self._executor = ProcessPoolExecutor(max_workers)
+        self._lock = threading.Lock()
+        self._chunk = []
+        self._pending = 0
+        self._closed = False
+        self._done = queue.Queue()
+
+    def submit(self, device, getter, outputs, **kwargs):
+        """Queue the parsing of outputs with getter, e.g. "get_vlans", for device."""
+        with self._lock:
+            if self._closed:
+                raise ValueError("The pipeline is closed")
+            self._chunk.append((device, getter, outputs, kwargs))
+            if len(self._chunk) >= self.chunk_size:
+                self._flush()
+
+    def flush(self):
+        """Send the jobs of the current, partial, chunk to the workers."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._chunk:
+            return
+        chunk, self._chunk = self._chunk, []
+        self._pending += 1
+        future = self._executor.submit(_parse_chunk, chunk, self.parse_cache)
+        future.add_done_callback(self._done.put)
+
+    def close(self):
+        """Flush the last chunk; no job can be submitted afterwards."""
+        with self._lock:
+            self._flush()
+            self._closed = True
+        # Wake up results() if it is waiting
+        self._done.put(None)
+
+    def results(self):
+        """
+        Yield the ParseResult of each job as its chunk completes, until the pipeline
+        is closed and all jobs are done. Errors raised by a getter are returned in the
+        error field; a failure of the pool itself is raised.
+        """
+        while True:
+            with self._lock:
+                if self._closed and not self._pending:
+                    return
+            future = self._done.get()
+            if future is None:
+                continue
+            with self._lock:
+                self._pending -= 1
+            for result in future.result():
+                yield ParseResult(*result)
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes."""
+        self._executor.shutdown(wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if not self._closed:
+            self.close()
+        self.shutdown()
+
+
+def parse_all(jobs, max_workers=None, chunk_size=None, parse_cache=0):
+    """
+    Parse an iterable of (device, getter, outputs) or (device, getter, outputs,
+    kwargs) jobs with a ParsePipeline and yield their ParseResults as they complete.
+    """
+    with ParsePipeline(max_workers, chunk_size, parse_cache) as pipeline:
+        for job in jobs:
+            kwargs = job[3] if len(job) > 3 else {}
+            pipeline.submit(job[0], job[1], job[2], **kwargs)
+        pipeline.close()
+        for result in pipeline.results():
+            yield result
@@ -0,0 +1,97 @@
+"""Probe-then-fetch caching of large getter results."""
+import threading
+import time
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+class ProbeCache(object):
+    """
+    Last result of probed getters, keyed by getter and arguments, along with the
+    probe it was fetched with: the output of a cheap command which changes whenever
+    the table does, such as the LLDP table statistics.
+
+    get() returns the cached result while the probe is unchanged and the result is
+    younger than ``max_age`` seconds (no limit if None); otherwise the caller
+    fetches the table again, possibly reusing the raw outputs kept by put() for the
+    parts which did not change, and stores it with put(). Results are copied on
+    the way in and out, so callers may modify them freely.
+    """
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age
+        self.probes = 0
+        self.unchanged = 0
+        self.partial = 0
+        self.full = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, probe):
+        """Return the cached result of key if probe is unchanged, else None."""
+        with self._lock:
+            self.probes += 1
+            entry = self._entries.get(key)
+            if entry is None or entry["probe"] != probe:
+                return None
+            if self.max_age is not None and (
+                time.monotonic() - entry["time"] > self.max_age
+            ):
+                return None
+            self.unchanged += 1
+            return _copy(entry["result"])
+
+    def outputs(self, key):
+        """Return the raw outputs by command stored with the last result of key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return dict(entry["outputs"]) if entry is not None else {}
+
+    def put(self, key, probe, result, outputs=None, partial=False):
+        """
+        Store the result of key fetched after probe, with the raw outputs it was
+        built from. ``partial`` tells that only the changed parts were fetched.
+        """
+        with self._lock:
+            self._entries[key] = {
+                "probe": probe,
+                "result": _copy(result),
+                "outputs": dict(outputs or {}),
+                "time": time.monotonic(),
+            }
+            if partial:
+                self.partial += 1
+            else:
+                self.full += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """
+        Return the number of probes, of unchanged results, of partial and full
+        fetches, the rate of unchanged results and the rate of probes which avoided a
+        full fetch.
+        """
+        probes = self.probes
+        return {
+            "probes": probes,
+            "unchanged": self.unchanged,
+            "partial": self.partial,
+            "full": self.full,
+            "hit_rate": float(self.unchanged) / probes if probes else 0.0,
+            "avoided_rate": (
+                float(self.unchanged + self.partial) / probes if probes else 0.0
+            ),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.probes = self.unchanged = self.partial = self.full = 0
@@ -0,0 +1,269 @@
+"""Record CLI sessions to a compressed file and replay them offline."""
+import gzip
+import json
+import threading
+import time
+
+from napalm.base.helpers import sanitize_config
+
+from napalm_dellos6.dellos6_constants import DELLOS6_SANITIZE_FILTERS
+
+RECORDING_FORMAT = "napalm-dellos6-session"
+RECORDING_VERSION = 1
+
+
+class SessionRecorder(object):
+    """
+    Writes every command sent over the recorded sessions to a gzip-compressed JSON
+    lines file. The first line is a header; each following line is an exchange::
+
+        {"s": 2, "t": 1.25, "w": "show vlan", "m": "send", "k": [[0.052, "..."]]}
+
+    where ``s`` is the session number, ``t`` the start time in seconds since the
+    recording began, ``w`` the command, ``m`` how it was sent ("send" for netmiko's
+    send_command(), "write" for write_channel(), "prompt" for the base prompt found by
+    set_base_prompt()) and ``k`` the output chunks with the delay in seconds since the
+    previous chunk (or the command) of each. Output read by netmiko's send_command()
+    is recorded as a single chunk, only output read from the SSH channel (e.g. with
+    the buffered_read optional argument) has the timing of each chunk.
+
+    The outputs are written through the ``filters`` of get_config(sanitized=True), so
+    the passwords and keys of the configuration are not written to the file. Secrets
+    they don't match, in other outputs or in commands, are written as they are.
+    """
+
+    def __init__(self, path, hostname="", filters=DELLOS6_SANITIZE_FILTERS):
+        self.path = path
+        self.filters = filters or {}
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._start = time.time()
+        self._sessions = 0
+        self._header = {
+            "format": RECORDING_FORMAT,
+            "version": RECORDING_VERSION,
+            "hostname": hostname,
+            "started": self._start,
+        }
+        self._write(self._header)
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def new_session(self):
+        with self._lock:
+            self._sessions += 1
+            return self._sessions
+
+    def record(self, session, started, command, mode, chunks):
+        exchange = {
+            "s": session,
+            "t": round(started - self._start, 3),
+            "w": command,
+            "m": mode,
+            "k": [[round(delay, 4), text] for delay, text in self._sanitize(chunks)],
+        }
+        with self._lock:
+            if self._file is not None:
+                self._write(exchange)
+
+    def _sanitize(self, chunks):
+        """
+        Apply the filters to the whole lines of the chunks. A line split across chunks
+        is moved to the chunk ending it, so the filters always see whole lines.
+        """
+        if not self.filters:
+            return chunks
+        sanitized = []
+        partial = ""
+        for delay, text in chunks:
+            lines = (partial + text).splitlines(True)
+            partial = ""
+            if lines and not lines[-1].endswith(("\n", "\r")):
+                partial = lines.pop()
+            sanitized.append((delay, "".join(map(self._sanitize_line, lines))))
+        if partial:
+            delay, text = sanitized[-1]
+            sanitized[-1] = (delay, text + self._sanitize_line(partial))
+        return sanitized
+
+    def _sanitize_line(self, line):
+        # The filters end with $, which doesn't match before the \r of \r\n
+        text = line.rstrip("\r\n")
+        return sanitize_config(text, self.filters) + line[len(text) :]
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _RecordingChannel(object):
+    """paramiko channel wrapper adding the received bytes to the current exchange."""
+
+    def __init__(self, channel, connection):
+        self._channel = channel
+        self._connection = connection
+
+    def recv(self, size):
+        data = self._channel.recv(size)
+        self._connection._chunk(data.decode("utf-8", "replace"))
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._channel, name)
+
+
+class RecordingConnection(object):
+    """
+    Wraps a netmiko connection and records the exchanges sent over it with a
+    SessionRecorder. Output read with read_channel() or from the SSH channel after a
+    write_channel() is recorded chunk by chunk until the next command; the output of
+    send_command() is recorded as one chunk, received after its whole duration.
+    """
+
+    def __init__(self, connection, recorder):
+        self._connection = connection
+        self._recorder = recorder
+        self._session = recorder.new_session()
+        self._pending = None
+        self._last = None
+        self._prompt = None
+        channel = getattr(connection, "remote_conn", None)
+        if channel is not None:
+            self.remote_conn = _RecordingChannel(channel, self)
+
+    def _flush(self):
+        if self._pending is not None:
+            started, command, chunks = self._pending
+            self._pending = None
+            self._recorder.record(self._session, started, command, "write", chunks)
+
+    def _chunk(self, text):
+        if self._pending is not None and text:
+            now = time.time()
+            self._pending[2].append((now - self._last, text))
+            self._last = now
+
+    def set_base_prompt(self, *args, **kwargs):
+        prompt = self._connection.set_base_prompt(*args, **kwargs)
+        if prompt != self._prompt:
+            self._prompt = prompt
+            self._recorder.record(
+                self._session, time.time(), "", "prompt", [(0, prompt)]
+            )
+        return prompt
+
+    def send_command(self, command, **kwargs):
+        self._flush()
+        started = time.time()
+        output = self._connection.send_command(command, **kwargs)
+        self._recorder.record(
+            self._session,
+            started,
+            command,
+            "send",
+            [(time.time() - started, output)],
+        )
+        return output
+
+    def write_channel(self, data):
+        self._flush()
+        self._last = time.time()
+        self._pending = (self._last, data, [])
+        return self._connection.write_channel(data)
+
+    def read_channel(self):
+        output = self._connection.read_channel()
+        self._chunk(output)
+        return output
+
+    def disconnect(self):
+        self._flush()
+        return self._connection.disconnect()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+def load_recording(path):
+    """Return the ``(header, exchanges)`` of a recording file."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError("{} is not a session recording".format(path))
+        exchanges = [json.loads(line) for line in f if line.strip()]
+    return header, exchanges
+
+
+class ReplayDevice(object):
+    """
+    netmiko connection stand-in serving the outputs of a recording, from all of its
+    sessions, for offline benchmarks and regression tests.
+
+    Each command returns its recorded outputs in order, then keeps returning the last
+    one. Chunk delays are replayed multiplied by ``time_scale``: 1.0 replays the
+    original timing, 0.5 twice as fast and 0 without any delay.
+    """
+
+    def __init__(self, recording, time_scale=1.0):
+        if isinstance(recording, str):
+            recording = load_recording(recording)
+        self.header, exchanges = recording
+        self.time_scale = time_scale
+        self.commands = []
+        self.prompt = "#"
+        self._replies = {}
+        for exchange in exchanges:
+            if exchange["m"] == "prompt":
+                self.prompt = exchange["k"][0][1]
+                continue
+            key = (exchange["m"], exchange["w"])
+            self._replies.setdefault(key, []).append(exchange["k"])
+        self._served = {}
+        self._chunks = []
+        self._due = 0.0
+
+    def _reply(self, mode, command):
+        replies = self._replies.get((mode, command))
+        if replies is None:
+            raise ValueError("{!r} is not in the recording".format(command))
+        index = self._served.get((mode, command), 0)
+        self._served[(mode, command)] = index + 1
+        return replies[min(index, len(replies) - 1)]
+
+    def set_base_prompt(self):
+        return self.prompt
+
+    def send_command(self, command, **kwargs):
+        self.commands.append(command)
+        chunks = self._reply("send", command)
+        delay = sum(chunk[0] for chunk in chunks) * self.time_scale
+        if delay:
+            time.sleep(delay)
+        return "".join(chunk[1] for chunk in chunks)
+
+    def write_channel(self, data):
+        self.commands.append(data)
+        try:
+            self._chunks = list(self._reply("write", data))
+        except ValueError:
+            # e.g. the Ctrl-C aborting a streamed command
+            self._chunks = []
+        self._due = time.time()
+
+    def read_channel(self):
+        """Return the chunks whose recorded delay has elapsed, like a live channel."""
+        output = []
+        now = time.time()
+        while self._chunks:
+            due = self._due + self._chunks[0][0] * self.time_scale
+            if due > now:
+                break
+            self._due = due
+            output.append(self._chunks.pop(0)[1])
+        return "".join(output)
+
+    def disconnect(self):
+        pass
@@ -0,0 +1,95 @@
+"""Longest-prefix-match index over a Dell OS6 routing table."""
+from ipaddress import ip_address, ip_network
+
+
+class RouteTable(object):
+    """
+    Snapshot of one routing table, indexed for longest-prefix-match lookups.
+
+    Prefixes are kept in one dict per (IP version, prefix length), keyed by the
+    network bits of the prefix. A lookup therefore costs at most one dict access per
+    prefix length present in the table, independent of the number of routes.
+    """
+
+    def __init__(self, name="default"):
+        self.name = name
+        self._routes = {}
+        self._index = {}
+        self._lengths = {4: [], 6: []}
+
+    def add(self, prefix, route):
+        """Add a route (a get_route_to() route dict) for the given prefix."""
+        network = ip_network(prefix, strict=False)
+        prefix = str(network)
+        if prefix not in self._routes:
+            self._routes[prefix] = []
+            key = (network.version, network.prefixlen)
+            if key not in self._index:
+                self._index[key] = {}
+                lengths = self._lengths[network.version]
+                lengths.append(network.prefixlen)
+                lengths.sort(reverse=True)
+            bits = network.max_prefixlen - network.prefixlen
+            self._index[key][int(network.network_address) >> bits] = prefix
+        self._routes[prefix].append(route)
+
+    def __len__(self):
+        return len(self._routes)
+
+    def __iter__(self):
+        return iter(self._routes)
+
+    def __contains__(self, prefix):
+        return str(ip_network(prefix, strict=False)) in self._routes
+
+    def routes(self, prefix):
+        """Return the routes of exactly the given prefix."""
+        return self._routes.get(str(ip_network(prefix, strict=False)), [])
+
+    def lookup(self, address):
+        """
+        Return ``(prefix, routes)`` of the longest prefix containing the given
+        address, or ``(None, [])`` if there is no matching route.
+        """
+        address = ip_address(address)
+        value = int(address)
+        max_prefixlen = address.max_prefixlen
+        for prefixlen in self._lengths[address.version]:
+            prefix = self._index[(address.version, prefixlen)].get(
+                value >> (max_prefixlen - prefixlen)
+            )
+            if prefix is not None:
+                return prefix, self._routes[prefix]
+        return None, []
+
+    def lookup_many(self, addresses):
+        """Return a dict of address to ``(prefix, routes)`` for many addresses."""
+        return {address: self.lookup(address) for address in addresses}
+
+    def longer(self, prefix):
+        """Return a dict of the given prefix and all more specific prefixes to routes."""
+        network = ip_network(prefix, strict=False)
+        value = int(network.network_address)
+        result = {}
+        for prefixlen in self._lengths[network.version]:
+            if prefixlen < network.prefixlen:
+                continue
+            bits = network.max_prefixlen - prefixlen
+            parent_bits = network.max_prefixlen - network.prefixlen
+            index = self._index[(network.version, prefixlen)]
+            # Only walk the candidate keys covered by the requested prefix
+            if len(index) <= 1 << (prefixlen - network.prefixlen):
+                for key, match in index.items():
+                    if key >> (parent_bits - bits) == value >> parent_bits:
+                        result[match] = self._routes[match]
+            else:
+                first = value >> bits
+                for key in range(first, first + (1 << (prefixlen - network.prefixlen))):
+                    match = index.get(key)
+                    if match is not None:
+                        result[match] = self._routes[match]
+        return result
+
+    def to_dict(self):
+        """Return the whole table in the get_route_to() format."""
+        return {prefix: list(routes) for prefix, routes in self._routes.items()}
@@ -0,0 +1,154 @@
+"""Single-pass parsing of command outputs made of several sections."""
+import os
+import re
+
+import textfsm
+
+TEMPLATES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "utils", "textfsm_templates"
+)
+
+
+class Section(object):
+    """
+    One section of a multi-section output, read from the TextFSM template of the
+    same name so that both parsers share one definition. The template may have one
+    state besides Start: the section then starts at the line matching the only rule
+    of Start, otherwise at the first line. The rules of the section are tried in
+    order on each line, the first match winning, as in TextFSM: the values of the
+    rule are assigned, "Record" appends them as an entry and clears them, "End"
+    ends the section and "Error" raises textfsm.TextFSMError. Values with the
+    Required option must be set for an entry to be recorded, and without an EOF
+    state, the values left at the end of the output are recorded.
+    """
+
+    def __init__(self, name, template_dir=TEMPLATES_DIR):
+        with open(os.path.join(template_dir, name + ".tpl")) as f:
+            fsm = textfsm.TextFSM(f)
+        self.name = name
+        self.fields = [value.name.lower() for value in fsm.values]
+        self.required = []
+        for value in fsm.values:
+            options = [option.name for option in value.options]
+            if any(option != "Required" for option in options):
+                raise ValueError("{}: unsupported value options".format(name))
+            if options:
+                self.required.append(value.name.lower())
+        rules = fsm.states["Start"]
+        self.start = None
+        if len(rules) == 1 and rules[0].new_state not in ("", "End"):
+            self.start = re.compile(rules[0].regex)
+            rules = fsm.states[rules[0].new_state]
+        for rule in rules:
+            if (
+                rule.line_op not in ("", "Next", "Error")
+                or rule.record_op not in ("", "NoRecord", "Record")
+                or (rule.new_state not in ("", "End") and rule.line_op != "Error")
+            ):
+                raise ValueError("{}: unsupported rule {}".format(name, rule.match))
+        self.rules = [(re.compile(rule.regex), rule) for rule in rules]
+        self.record_at_eof = "EOF" not in fsm.states
+
+
+class _SectionState(object):
+    __slots__ = ("section", "active", "values", "entries")
+
+    def __init__(self, section):
+        self.section = section
+        self.active = section.start is None
+        self.values = dict.fromkeys(section.fields)
+        self.entries = []
+
+    def record(self):
+        values = self.values
+        self.values = dict.fromkeys(self.section.fields)
+        if all(value is None for value in values.values()):
+            return
+        if any(not values[field] for field in self.section.required):
+            return
+        self.entries.append({field: value or "" for field, value in values.items()})
+
+
+def _error(rule, line):
+    """The error TextFSM raises for a line matching an Error rule."""
+    if rule.new_state:
+        return textfsm.TextFSMError(
+            "Error: {}. Rule Line: {}. Input Line: {}.".format(
+                rule.new_state, rule.line_num, line
+            )
+        )
+    return textfsm.TextFSMError(
+        "State Error raised. Rule Line: {}. Input Line: {}".format(rule.line_num, line)
+    )
+
+
+class MultiSectionParser(object):
+    """
+    Parses the sections of an output in a single walk over its lines, instead of
+    running it through one TextFSM template per section. The walk stops as soon as
+    every requested section is over.
+    """
+
+    def __init__(self, sections):
+        self.sections = {section.name: section for section in sections}
+
+    def parse(self, raw_output, names=None):
+        """
+        Return a dict of section name to the list of entries of the section, for the
+        given section names (all of them if None).
+        """
+        if names is None:
+            names = list(self.sections)
+        states = [_SectionState(self.sections[name]) for name in names]
+        pending = list(states)
+        for line in raw_output.splitlines():
+            done = False
+            for state in pending:
+                if not state.active:
+                    if state.section.start.match(line):
+                        state.active = True
+                    continue
+                for regex, rule in state.section.rules:
+                    match = regex.match(line)
+                    if match is None:
+                        continue
+                    if rule.line_op == "Error":
+                        raise _error(rule, line)
+                    for field, value in match.groupdict().items():
+                        state.values[field.lower()] = value
+                    if rule.record_op == "Record":
+                        state.record()
+                    if rule.new_state == "End":
+                        state.active = None
+                    break
+                if state.active is None:
+                    done = True
+            if done:
+                pending = [state for state in pending if state.active is not None]
+                if not pending:
+                    break
+        for state in states:
+            if state.active is not None and state.section.record_at_eof:
+                state.record()
+        return {state.section.name: state.entries for state in states}
+
+
+SHOW_SYSTEM = MultiSectionParser(
+    [
+        Section("show_system-basic"),
+        Section("show_system-units"),
+        Section("show_system-temps"),
+        Section("show_system-fans"),
+        Section("show_system-power_supplies"),
+    ]
+)
+
+SHOW_SNMP = MultiSectionParser(
+    [Section("show_snmp-basic"), Section("show_snmp-communities")]
+)
+
+# Outputs parsed in a single pass, by command
+COMMAND_SECTIONS = {
+    "show system": SHOW_SYSTEM,
+    "show snmp": SHOW_SNMP,
+}
@@ -0,0 +1,118 @@
+"""Pool of additional CLI sessions to a Dell OS6 device."""
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from napalm.base.exceptions import ConnectionClosedException
+
+
+class DellOS6SessionPool(object):
+    """
+    Keeps up to ``size`` extra sessions to the same device so independent commands
+    can run concurrently. Sessions are opened on demand with ``connect`` (a callable
+    returning a connected netmiko session) and reused until close() is called.
+    Sessions acquired before close() are not returned to the pool when released.
+    """
+
+    def __init__(self, connect, size):
+        self._connect = connect
+        self.size = size
+        self._idle = []
+        self._sessions = []
+        # Incremented by close(), so sessions opened meanwhile are not kept
+        self._generation = 0
+        self._available = threading.Condition()
+
+    def acquire(self):
+        """Return an idle session, opening a new one if the pool is not full yet."""
+        with self._available:
+            while not self._idle and len(self._sessions) >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            # Reserve the slot before connecting so other threads don't overshoot
+            self._sessions.append(None)
+            generation = self._generation
+        try:
+            session = self._connect()
+        except Exception:
+            with self._available:
+                if generation == self._generation:
+                    self._sessions.remove(None)
+                    self._available.notify()
+            raise
+        with self._available:
+            if generation == self._generation:
+                self._sessions[self._sessions.index(None)] = session
+                return session
+        # The pool was closed while connecting
+        self._disconnect(session)
+        raise ConnectionClosedException("The session pool was closed")
+
+    def release(self, session):
+        """Return a session to the pool. Does nothing if the pool was closed since."""
+        with self._available:
+            if session not in self._sessions:
+                return
+            self._idle.append(session)
+            self._available.notify()
+
+    def discard(self, session):
+        """Drop a session which is no longer usable (e.g. after a connection error)."""
+        with self._available:
+            if session not in self._sessions:
+                return
+            self._sessions.remove(session)
+            self._available.notify()
+        self._disconnect(session)
+
+    @staticmethod
+    def _disconnect(session):
+        try:
+            session.disconnect()
+        except Exception:
+            pass
+
+    def run(self, func, item):
+        """Call ``func(session, item)`` on a session from the pool."""
+        session = self.acquire()
+        try:
+            result = func(session, item)
+        except (ConnectionClosedException, OSError, EOFError):
+            self.discard(session)
+            raise
+        except Exception:
+            self.release(session)
+            raise
+        self.release(session)
+        return result
+
+    def map(self, func, items, max_workers=None):
+        """
+        Run ``func(session, item)`` for each item concurrently and yield
+        ``(item, result)`` pairs as they complete. Exceptions are re-raised when the
+        failed item is reached. Closing the generator early cancels pending items.
+        """
+        items = list(items)
+        workers = min(max_workers or self.size, self.size, len(items))
+        if not workers:
+            return
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {}
+        try:
+            futures = {executor.submit(self.run, func, item): item for item in items}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def close(self):
+        with self._available:
+            sessions = [session for session in self._sessions if session is not None]
+            self._sessions = []
+            self._idle = []
+            self._generation += 1
+            self._available.notify_all()
+        for session in sessions:
+            self._disconnect(session)
@@ -0,0 +1,149 @@
+"""SNMP backend for the Dell OS6 interface counters."""
+from napalm.base.exceptions import CommandErrorException, ConnectionException
+from napalm.base.helpers import canonical_interface_name
+
+from napalm_dellos6.dellos6_canonical_map import dellos6_interfaces
+
+# IF-MIB ifName, the short interface name (e.g. "Te1/0/1")
+IF_NAME_OID = "1.3.6.1.2.1.31.1.1.1.1"
+
+# IF-MIB columns of each get_interfaces_counters() field: 64-bit ifXTable counters
+# for octets and packets, ifTable counters for errors and discards
+IF_COUNTER_OIDS = {
+    "rx_octets": "1.3.6.1.2.1.31.1.1.1.6",
+    "rx_unicast_packets": "1.3.6.1.2.1.31.1.1.1.7",
+    "rx_multicast_packets": "1.3.6.1.2.1.31.1.1.1.8",
+    "rx_broadcast_packets": "1.3.6.1.2.1.31.1.1.1.9",
+    "tx_octets": "1.3.6.1.2.1.31.1.1.1.10",
+    "tx_unicast_packets": "1.3.6.1.2.1.31.1.1.1.11",
+    "tx_multicast_packets": "1.3.6.1.2.1.31.1.1.1.12",
+    "tx_broadcast_packets": "1.3.6.1.2.1.31.1.1.1.13",
+    "rx_discards": "1.3.6.1.2.1.2.2.1.13",
+    "rx_errors": "1.3.6.1.2.1.2.2.1.14",
+    "tx_discards": "1.3.6.1.2.1.2.2.1.19",
+    "tx_errors": "1.3.6.1.2.1.2.2.1.20",
+}
+
+
+def _oid_key(oid):
+    return tuple(int(arc) for arc in oid.strip(".").split("."))
+
+
+class SNMPWalker(object):
+    """
+    Walks MIB columns of a device with SNMPv2c GETBULK requests.
+
+    Needs pysnmp before 7 (which dropped the synchronous hlapi), only imported when
+    the walker is created. walk() yields
+    ``(oid, value)`` pairs, both as strings.
+    """
+
+    def __init__(
+        self,
+        hostname,
+        community="public",
+        port=161,
+        timeout=2,
+        retries=1,
+        max_repetitions=50,
+    ):
+        try:
+            from pysnmp import hlapi
+        except ImportError:
+            raise ImportError(
+                "The SNMP backend needs pysnmp, install it with: "
+                "pip install napalm-dellos6[snmp]"
+            )
+        self._hlapi = hlapi
+        self._engine = hlapi.SnmpEngine()
+        self._auth = hlapi.CommunityData(community, mpModel=1)
+        self._target = hlapi.UdpTransportTarget(
+            (hostname, port), timeout=timeout, retries=retries
+        )
+        self.max_repetitions = max_repetitions
+
+    def walk(self, oid):
+        hlapi = self._hlapi
+        responses = hlapi.bulkCmd(
+            self._engine,
+            self._auth,
+            self._target,
+            hlapi.ContextData(),
+            0,
+            self.max_repetitions,
+            hlapi.ObjectType(hlapi.ObjectIdentity(oid)),
+            lexicographicMode=False,
+        )
+        for error_indication, error_status, error_index, var_binds in responses:
+            if error_indication:
+                raise ConnectionException(str(error_indication))
+            if error_status:
+                raise CommandErrorException(
+                    "SNMP error while walking {}: {}".format(
+                        oid, error_status.prettyPrint()
+                    )
+                )
+            for name, value in var_binds:
+                yield str(name), value.prettyPrint()
+
+
+class RecordedWalker(object):
+    """
+    Serves walks from a recording in the snmprec format of snmpsim (one
+    ``oid|type|value`` line per object), e.g. to test without a device. The same
+    file can be served over the network with snmpsim and walked with SNMPWalker.
+    """
+
+    def __init__(self, recording):
+        self._objects = []
+        for line in recording.splitlines():
+            if not line.strip() or line.startswith("#"):
+                continue
+            oid, tag, value = line.split("|", 2)
+            if tag.endswith("x"):
+                # Hex-encoded value
+                value = bytes.fromhex(value).decode("utf-8", "replace")
+            self._objects.append((_oid_key(oid), oid.strip("."), value))
+        self._objects.sort()
+        self.walks = []
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as f:
+            return cls(f.read())
+
+    def walk(self, oid):
+        self.walks.append(oid)
+        prefix = _oid_key(oid)
+        for key, name, value in self._objects:
+            if key[: len(prefix)] == prefix and len(key) > len(prefix):
+                yield name, value
+
+
+def _column(walker, oid):
+    """Return a dict of ifIndex to value of one MIB column."""
+    return {int(name.rsplit(".", 1)[1]): value for name, value in walker.walk(oid)}
+
+
+def interface_counters(walker, interfaces=None):
+    """
+    Build the get_interfaces_counters() dict from IF-MIB walks: ifName maps each
+    ifIndex to its canonical interface name, then one walk per counter column. If
+    interfaces (canonical names) is given, only those interfaces are returned.
+    """
+    if interfaces is not None:
+        interfaces = set(interfaces)
+    names = {}
+    for if_index, if_name in _column(walker, IF_NAME_OID).items():
+        name = canonical_interface_name(if_name, addl_name_map=dellos6_interfaces)
+        if interfaces is None or name in interfaces:
+            names[if_index] = name
+
+    counters = {
+        name: {field: -1 for field in IF_COUNTER_OIDS} for name in names.values()
+    }
+    for field, oid in IF_COUNTER_OIDS.items():
+        for if_index, value in _column(walker, oid).items():
+            if if_index in names and value.isdigit():
+                counters[names[if_index]][field] = int(value)
+    return counters
@@ -0,0 +1,118 @@
+"""Split whole-stack show commands into per-unit interface ranges."""
+import re
+
+UNIT_PORT_REGEX = re.compile(
+    r"^(?P<type>[A-Za-z]+)(?P<unit>\d+)/(?P<slot>\d+)/(?P<port>\d+)$"
+)
+NUMBERED_REGEX = re.compile(r"^(?P<type>[A-Za-z]+)(?P<number>\d+)$")
+RANGE_REGEX = re.compile(
+    r"^(?P<prefix>\D+?(?:\d+/\d+/)?)(?P<first>\d+)(?:-(?P<last>\d+))?$"
+)
+
+
+def _runs(prefix, numbers):
+    numbers = sorted(set(numbers))
+    ranges = []
+    first = last = numbers[0]
+    for number in numbers[1:] + [None]:
+        if number is not None and number == last + 1:
+            last = number
+            continue
+        if first == last:
+            ranges.append("{}{}".format(prefix, first))
+        else:
+            ranges.append("{}{}-{}".format(prefix, first, last))
+        if number is not None:
+            first = last = number
+    return ranges
+
+
+def interface_ranges(names):
+    """
+    Compress interface short names into OS6 interface ranges grouped by stack unit.
+
+    Returns a dict of unit number to a list of ranges (e.g. ``{1: ["Te1/0/1-24"]}``);
+    interfaces which do not belong to a unit (port-channels, oob, ...) are grouped
+    under the key None.
+    """
+    groups = {}
+    others = {}
+    singles = []
+    for name in names:
+        match = UNIT_PORT_REGEX.match(name)
+        if match:
+            key = (
+                int(match.group("unit")),
+                match.group("type"),
+                int(match.group("slot")),
+            )
+            groups.setdefault(key, []).append(int(match.group("port")))
+            continue
+        match = NUMBERED_REGEX.match(name)
+        if match:
+            others.setdefault(match.group("type"), []).append(
+                int(match.group("number"))
+            )
+        elif name not in singles:
+            singles.append(name)
+
+    ranges = {}
+    for (unit, port_type, slot), ports in sorted(groups.items()):
+        prefix = "{}{}/{}/".format(port_type, unit, slot)
+        ranges.setdefault(unit, []).extend(_runs(prefix, ports))
+    for port_type, numbers in sorted(others.items()):
+        ranges.setdefault(None, []).extend(_runs(port_type, numbers))
+    if singles:
+        ranges.setdefault(None, []).extend(singles)
+    return ranges
+
+
+def in_range(name, interface_range):
+    """True if the interface short name is part of the given interface range."""
+    match = RANGE_REGEX.match(interface_range)
+    if match is None:
+        return name == interface_range
+    if not name.startswith(match.group("prefix")):
+        return False
+    number = name[len(match.group("prefix")) :]
+    if not number.isdigit():
+        return False
+    first = int(match.group("first"))
+    last = int(match.group("last") or first)
+    return first <= int(number) <= last
+
+
+class StackInventory(object):
+    """
+    Interface ranges of each stack unit, built from the port inventory of the stack
+    (the interfaces of "show interfaces status").
+
+    The ranges are only valid for the stack membership they were built with;
+    update_units() drops them when the members change.
+    """
+
+    def __init__(self):
+        self.units = None
+        self.ranges = None
+        self._bulk_commands = set()
+
+    def update_units(self, units):
+        units = tuple(sorted(units))
+        if units != self.units:
+            self.units = units
+            self.forget()
+
+    def learn(self, names):
+        """Build the ``{unit: [ranges]}`` of the interface short names."""
+        self.ranges = interface_ranges(names)
+
+    def is_bulk(self, command):
+        """True if the per-unit form of command was refused by the device."""
+        return command in self._bulk_commands
+
+    def set_bulk(self, command):
+        self._bulk_commands.add(command)
+
+    def forget(self):
+        self.ranges = None
+        self._bulk_commands = set()
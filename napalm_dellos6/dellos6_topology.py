@@ -0,0 +1,219 @@
+"""LLDP topology discovery across many Dell OS6 switches."""
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from napalm.base.helpers import mac
+from netaddr import valid_mac
+
+import napalm_dellos6.dellos6_constants as D6C
+
+Link = namedtuple("Link", ["chassis_id", "port", "remote_chassis_id", "remote_port"])
+
+
+def chassis_key(chassis_id):
+    """Normalize a chassis ID: MAC addresses in any format compare equal."""
+    if valid_mac(chassis_id):
+        return mac(chassis_id)
+    return chassis_id
+
+
+def follow_switches(neighbor):
+    """
+    Default crawler policy: follow the neighbors advertising an enabled bridge or
+    router capability, by their system name.
+    """
+    capabilities = neighbor["remote_system_enable_capab"]
+    if neighbor["remote_system_name"] and (
+        "bridge" in capabilities or "router" in capabilities
+    ):
+        return neighbor["remote_system_name"]
+    return None
+
+
+class TopologyGraph(object):
+    """
+    Adjacency graph built from the get_lldp_neighbors_detail() results of many
+    switches, keyed by chassis ID.
+
+    ``nodes`` holds the polled switches (chassis ID to host and system name) and
+    ``links`` the Link(chassis_id, port, remote_chassis_id, remote_port) of every
+    LLDP neighbor they report, including neighbors which are not polled (servers,
+    phones, ...). update() replaces the links of one switch and returns the links
+    added and removed, so a graph can be kept up to date one switch at a time.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.links = set()
+        self._neighbors = {}
+
+    def update(self, chassis_id, host, system_name, neighbors):
+        """
+        Set the node of a switch and its links from its get_lldp_neighbors_detail()
+        result. Returns the sets of added and removed Links.
+        """
+        chassis_id = chassis_key(chassis_id)
+        self.nodes[chassis_id] = {"host": host, "system_name": system_name}
+        links = set()
+        for port, entries in neighbors.items():
+            for entry in entries:
+                links.add(
+                    Link(
+                        chassis_id,
+                        port,
+                        chassis_key(entry["remote_chassis_id"]),
+                        entry["remote_port"],
+                    )
+                )
+        old = self._neighbors.get(chassis_id, set())
+        self._neighbors[chassis_id] = links
+        added = links - old
+        removed = old - links
+        self.links -= removed
+        self.links |= added
+        return added, removed
+
+    def remove(self, chassis_id):
+        """Remove a switch and the links it reported."""
+        chassis_id = chassis_key(chassis_id)
+        self.nodes.pop(chassis_id, None)
+        self.links -= self._neighbors.pop(chassis_id, set())
+
+    def neighbors(self, chassis_id):
+        """Return the chassis IDs of the neighbors a switch reports."""
+        return set(
+            link.remote_chassis_id
+            for link in self._neighbors.get(chassis_key(chassis_id), ())
+        )
+
+    def adjacency(self):
+        """Return a dict of chassis ID to the set of chassis IDs linked to it."""
+        adjacency = {}
+        for link in self.links:
+            adjacency.setdefault(link.chassis_id, set()).add(link.remote_chassis_id)
+            adjacency.setdefault(link.remote_chassis_id, set()).add(link.chassis_id)
+        return adjacency
+
+    def to_dict(self):
+        """Return the nodes and the sorted links, for JSON output."""
+        return {
+            "nodes": self.nodes,
+            "links": [list(link) for link in sorted(self.links)],
+        }
+
+
+class TopologyCrawler(object):
+    """
+    Breadth-first LLDP crawl from seed switches, polling up to ``max_workers``
+    switches at a time.
+
+    ``connect(host)`` returns an open DellOS6Driver (e.g. ``lambda host:
+    open_driver(host, username, password)``); the crawler closes it after the poll.
+    Each poll sends "show system", for the chassis ID and system name of the switch,
+    and "show lldp remote-device all"; the per-neighbor detail commands are only
+    sent if that summary differs from the previous poll of the switch. Neighbors
+    are followed if ``follow(neighbor)`` (given a get_lldp_neighbors_detail() entry)
+    returns a host to connect to, by default their system name for switches and
+    routers (see follow_switches()), and at most once per chassis ID.
+
+    crawl(seeds) walks from the seeds; recrawl() polls the known switches again,
+    updates only those whose LLDP table changed and walks from them to any new
+    neighbor. Both return the TopologyGraph, kept in ``graph``. Polls which fail
+    are recorded by host in ``errors`` and retried by the next recrawl().
+    """
+
+    def __init__(self, connect, max_workers=None, follow=None):
+        if max_workers is None:
+            max_workers = D6C.DELLOS6_CRAWL_WORKERS
+        self.connect = connect
+        self.max_workers = max_workers
+        self.follow = follow or follow_switches
+        self.graph = TopologyGraph()
+        self.errors = {}
+        self.polls = 0
+        self.detail_polls = 0
+        self._summaries = {}
+
+    def _poll(self, host, summary=None):
+        """
+        Poll a switch: returns its LLDP local info, LLDP summary and
+        get_lldp_neighbors_detail(), None if the summary is unchanged.
+        """
+        driver = self.connect(host)
+        try:
+            outputs = driver.cli(["show system", "show lldp remote-device all"])
+            local = driver.parser.lldp_local(outputs)
+            entries = driver.parser.parse(
+                "show_lldp_remote-device_all", outputs["show lldp remote-device all"]
+            )
+            if entries == summary:
+                return local, entries, None
+            outputs = driver._collect_outputs("get_lldp_neighbors_detail", outputs)
+            return local, entries, driver.parser.get_lldp_neighbors_detail(outputs)
+        finally:
+            driver.close()
+
+    def crawl(self, seeds):
+        """Walk the topology from the seed hosts and return the graph."""
+        return self._walk([(host, None) for host in seeds])
+
+    def recrawl(self, chassis_ids=None):
+        """
+        Poll the known switches (or only the given chassis IDs) and the hosts which
+        failed before again, and return the updated graph.
+        """
+        if chassis_ids is None:
+            chassis_ids = list(self.graph.nodes)
+        queue = [
+            (self.graph.nodes[chassis_id]["host"], chassis_id)
+            for chassis_id in map(chassis_key, chassis_ids)
+        ]
+        queue.extend((host, None) for host in list(self.errors))
+        return self._walk(queue)
+
+    def _walk(self, queue):
+        queue = deque(queue)
+        scheduled = set(chassis_id for _, chassis_id in queue if chassis_id)
+        scheduled_hosts = set(host for host, _ in queue)
+        polled = set()
+        pending = {}
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            while queue or pending:
+                while queue and len(pending) < self.max_workers:
+                    host, chassis_id = queue.popleft()
+                    future = executor.submit(
+                        self._poll, host, self._summaries.get(chassis_id)
+                    )
+                    pending[future] = host
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host = pending.pop(future)
+                    self.polls += 1
+                    try:
+                        local, summary, neighbors = future.result()
+                    except Exception as exp:
+                        self.errors[host] = exp
+                        continue
+                    self.errors.pop(host, None)
+                    chassis_id = local["chassis_id"]
+                    # The same switch reached under two names
+                    if chassis_id in polled:
+                        continue
+                    polled.add(chassis_id)
+                    if neighbors is None:
+                        continue
+                    self.detail_polls += 1
+                    self._summaries[chassis_id] = summary
+                    self.graph.update(chassis_id, host, local["system_name"], neighbors)
+                    for entries in neighbors.values():
+                        for entry in entries:
+                            remote = chassis_key(entry["remote_chassis_id"])
+                            if remote in self.graph.nodes or remote in scheduled:
+                                continue
+                            target = self.follow(entry)
+                            if target is None or target in scheduled_hosts:
+                                continue
+                            scheduled.add(remote)
+                            scheduled_hosts.add(target)
+                            queue.append((target, remote))
+        return self.graph
@@ -0,0 +1,254 @@
+"""VLAN membership index of a Dell OS6 switch."""
+import re
+from bisect import bisect_left, bisect_right
+
+from napalm.base.helpers import canonical_interface_name
+
+from napalm_dellos6.dellos6_canonical_map import dellos6_interfaces
+
+# A range of ports in "show vlan", e.g. "Te1/0/3-20" or "Po1-49"
+PORT_RANGE_REGEX = re.compile(r"(\S\S|.+/)((\d+)-(\d+))")
+# The prefix and number of a port, e.g. "Te1/0/" and "3"
+PORT_NUMBER_REGEX = re.compile(r"(.*\D)(\d+)$")
+VLAN_RANGE_REGEX = re.compile(r"^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$")
+MAX_VLAN_ID = 4094
+
+
+def vlan_ids_list(vlan_ids):
+    """
+    Return the sorted VLAN IDs of vlan_ids: an int, a string of IDs and ranges (e.g.
+    "10,20-30"), a range, or an iterable of any of these. Raises ValueError for an
+    invalid or empty list.
+    """
+    if isinstance(vlan_ids, (int, str)):
+        vlan_ids = [vlan_ids]
+    result = set()
+    for item in vlan_ids:
+        if isinstance(item, str):
+            for part in item.split(","):
+                m = VLAN_RANGE_REGEX.match(part)
+                if m is None:
+                    raise ValueError("Invalid VLAN range: {!r}".format(part))
+                first = int(m.group(1))
+                result.update(range(first, int(m.group(2) or first) + 1))
+        elif isinstance(item, range):
+            result.update(item)
+        else:
+            result.add(int(item))
+    if not result:
+        raise ValueError("No VLAN IDs given")
+    if min(result) < 1 or max(result) > MAX_VLAN_ID:
+        raise ValueError("VLAN IDs must be between 1 and {}".format(MAX_VLAN_ID))
+    return sorted(result)
+
+
+def vlan_list(vlan_ids):
+    """Return vlan_ids (see vlan_ids_list()) as an OS6 VLAN list, e.g. "10,20-30"."""
+    ranges = []
+    for vlan_id in vlan_ids_list(vlan_ids):
+        if ranges and ranges[-1][1] == vlan_id - 1:
+            ranges[-1][1] = vlan_id
+        else:
+            ranges.append([vlan_id, vlan_id])
+    return ",".join(
+        str(first) if first == last else "{}-{}".format(first, last)
+        for first, last in ranges
+    )
+
+
+def member_ports(members):
+    """
+    Return the ports named by "show vlan" member lists (see VlanIndex.add()), with
+    the ranges expanded: grouped by prefix in order of appearance, then by number.
+    """
+    prefixes = {}
+    for member in members:
+        for port in member.split(","):
+            if not port:
+                continue
+            m = PORT_RANGE_REGEX.match(port)
+            if m is not None:
+                numbers = range(int(m.group(3)), int(m.group(4)) + 1)
+                prefixes.setdefault(m.group(1), set()).update(numbers)
+                continue
+            m = PORT_NUMBER_REGEX.match(port)
+            if m is not None:
+                prefixes.setdefault(m.group(1), set()).add(int(m.group(2)))
+            else:
+                prefixes.setdefault(port, None)
+    ports = []
+    for prefix, numbers in prefixes.items():
+        if numbers is None:
+            ports.append(prefix)
+        else:
+            ports.extend("%s%d" % (prefix, number) for number in sorted(numbers))
+    return ports
+
+
+def _runs(bitmap):
+    """Yield the (start, end) bit positions of the runs of set bits of bitmap."""
+    bits = bin(bitmap)[:1:-1]
+    start = bits.find("1")
+    while start != -1:
+        end = bits.find("0", start)
+        if end == -1:
+            end = len(bits)
+        yield start, end
+        start = bits.find("1", end)
+
+
+def _positions(bitmap):
+    """Return the positions of the bits set in bitmap, lowest first."""
+    positions = []
+    for start, end in _runs(bitmap):
+        positions.extend(range(start, end))
+    return positions
+
+
+def _bitmap(positions):
+    """Return the bitmap with the given bit positions set."""
+    if not positions:
+        return 0
+    bits = bytearray(b"0") * (max(positions) + 1)
+    for position in positions:
+        bits[position] = 0x31
+    return int(bits[::-1], 2)
+
+
+class VlanIndex(object):
+    """
+    VLAN membership of the ports of a switch, as two sets of bitmaps (Python ints).
+
+    Each port gets a bit position in the order given to the constructor, and each
+    VLAN a bitmap of its member ports, so membership tests and unions are single
+    integer operations whatever the number of ports. Port ranges of "show vlan" map to
+    runs of consecutive bits, as the ports of a unit are usually listed in order. The
+    transposed index, one bitmap of VLAN IDs per port, is built on the first lookup
+    by port, once per distinct port bitmap (trunks usually carry many VLANs alike).
+
+    Ports are known by their short name as the CLI lists them (e.g. "Te1/0/1"), and
+    reported by their canonical name, which is computed once per port. Members of a
+    VLAN which are not ports of the index, such as the port-channels of a range
+    which are not configured, are ignored.
+    """
+
+    def __init__(self, ports):
+        self._ports = list(dict.fromkeys(ports))
+        self._positions = {port: n for n, port in enumerate(self._ports)}
+        self._names = [
+            canonical_interface_name(port, addl_name_map=dellos6_interfaces)
+            for port in self._ports
+        ]
+        self._canonical = {name: n for n, name in enumerate(self._names)}
+        numbered = {}
+        for n, port in enumerate(self._ports):
+            m = PORT_NUMBER_REGEX.match(port)
+            if m is not None:
+                numbered.setdefault(m.group(1), []).append((int(m.group(2)), n))
+        # Port numbers and bit positions by prefix, ordered by port number
+        self._prefixes = {
+            prefix: ([number for number, _ in ports], [n for _, n in ports])
+            for prefix, ports in ((k, sorted(v)) for k, v in numbered.items())
+        }
+        self._vlans = {}
+        self._port_vlans = None
+
+    def add(self, vlan_id, name, members):
+        """
+        Add a VLAN with the member ports listed by "show vlan", e.g. ["Po1,Po50",
+        "Te1/0/12-13"]: comma-separated ports and port ranges.
+        """
+        found = []
+        bitmap = 0
+        for member in members:
+            for port in member.split(","):
+                if not port:
+                    continue
+                m = PORT_RANGE_REGEX.match(port)
+                if m is None:
+                    found.append(self._positions.get(port))
+                    continue
+                if m.group(1) not in self._prefixes:
+                    continue
+                numbers, positions = self._prefixes[m.group(1)]
+                first = bisect_left(numbers, int(m.group(3)))
+                last = bisect_right(numbers, int(m.group(4)))
+                positions = positions[first:last]
+                if not positions:
+                    continue
+                # A range of ports listed in order is a run of bits
+                start = min(positions)
+                if max(positions) - start == len(positions) - 1:
+                    bitmap |= ((1 << len(positions)) - 1) << start
+                else:
+                    found.extend(positions)
+        bitmap |= _bitmap([position for position in found if position is not None])
+        self._vlans[int(vlan_id)] = (name, bitmap)
+        self._port_vlans = None
+
+    def __len__(self):
+        return len(self._vlans)
+
+    def __iter__(self):
+        return iter(self._vlans)
+
+    def __contains__(self, vlan_id):
+        return vlan_id in self._vlans
+
+    def _position(self, interface):
+        position = self._positions.get(interface, self._canonical.get(interface))
+        if position is None:
+            position = self._canonical.get(
+                canonical_interface_name(interface, addl_name_map=dellos6_interfaces)
+            )
+        if position is None:
+            raise KeyError(interface)
+        return position
+
+    def name(self, vlan_id):
+        """Return the name of a VLAN."""
+        return self._vlans[vlan_id][0]
+
+    def port_bitmap(self, vlan_id):
+        """Return the bitmap of the member ports of a VLAN."""
+        return self._vlans[vlan_id][1]
+
+    def ports(self, vlan_id):
+        """Return the canonical names of the member ports of a VLAN."""
+        names = []
+        for start, end in _runs(self._vlans[vlan_id][1]):
+            names.extend(self._names[start:end])
+        return names
+
+    def vlan_bitmap(self, interface):
+        """Return the bitmap of the VLAN IDs a port, short or canonical name, is in."""
+        position = self._position(interface)
+        if self._port_vlans is None:
+            groups = {}
+            for vlan_id, (_, bitmap) in self._vlans.items():
+                groups.setdefault(bitmap, []).append(vlan_id)
+            port_vlans = [0] * len(self._ports)
+            for bitmap, vlan_ids in groups.items():
+                vlan_bitmap = _bitmap(vlan_ids)
+                for n in _positions(bitmap):
+                    port_vlans[n] |= vlan_bitmap
+            self._port_vlans = port_vlans
+        return self._port_vlans[position]
+
+    def vlans(self, interface):
+        """Return the IDs of the VLANs a port is in, in ascending order."""
+        return _positions(self.vlan_bitmap(interface))
+
+    def is_member(self, vlan_id, interface):
+        """True if the port is a member of the VLAN."""
+        return bool(self._vlans[vlan_id][1] >> self._position(interface) & 1)
+
+    def to_dict(self):
+        """Return the VLANs in the structure of DellOS6Driver.get_vlans()."""
+        ports = {}
+        vlans = {}
+        for vlan_id, (name, bitmap) in self._vlans.items():
+            if bitmap not in ports:
+                ports[bitmap] = self.ports(vlan_id)
+            vlans[vlan_id] = {"name": name, "interfaces": list(ports[bitmap])}
+        return vlans
@@ -0,0 +1,8 @@
+Value Required CURRENT (\d+)
+Value STATIC_CONFIGURED (\d+)
+Value STATIC_ACTIVE (\d+)
+
+Start
+  ^Total Entry Count Current / Peak\s*\.*\s*${CURRENT}\s*/\s*\d+
+  ^Static Entry Count Configured / Active / Max\s*\.*\s*${STATIC_CONFIGURED}\s*/\s*${STATIC_ACTIVE}\s*/\s*\d+ -> Record End
+
@@ -1,5 +1,5 @@
 Value Required INTERFACE (\S+)
-Value DESC ((\S.*\S)*)
+Value DESC (\S(?:.*\S)?|)
 Value DUPLEX (Full|Half|N\/A)
 Value SPEED (Unknown|\d+)
 Value NEG (\S+)
@@ -1,5 +1,5 @@
 Value Required INTERFACE (\S+)
-Value DESC ((\S.*\S)*)
+Value DESC (\S(?:.*\S)?|)
 
 Start
   ^Port\s+Description -> Port
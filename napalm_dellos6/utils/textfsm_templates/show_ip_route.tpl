@@ -0,0 +1,20 @@
+Value Filldown PROTOCOL ([A-Z])
+Value Filldown TYPE (IA|E1|E2|N1|N2|E|I|U|L|K|P)
+Value Filldown BEST (\*)
+Value Filldown,Required NETWORK (\d+\.\d+\.\d+\.\d+/\d+)
+Value Filldown PREFERENCE (\d+)
+Value Filldown METRIC (\d+)
+Value NEXT_HOP (\d+\.\d+\.\d+\.\d+)
+Value AGE (\d\S*)
+Value INTERFACE (\S+)
+
+Start
+  ^[A-Z]\s+\S*\s*\S*\s*\d+\.\d+\.\d+\.\d+/\d+\s+\[ -> Continue.Clearall
+  ^${PROTOCOL}\s+(${TYPE}\s+)?(${BEST}\s+)?${NETWORK}\s+\[${PREFERENCE}/${METRIC}\]\s+directly connected,\s+${INTERFACE} -> Record
+  ^${PROTOCOL}\s+(${TYPE}\s+)?(${BEST}\s+)?${NETWORK}\s+\[${PREFERENCE}/${METRIC}\]\s+via\s+${NEXT_HOP},\s+${AGE},\s+${INTERFACE} -> Record
+  ^${PROTOCOL}\s+(${TYPE}\s+)?(${BEST}\s+)?${NETWORK}\s+\[${PREFERENCE}/${METRIC}\]\s+via\s+${NEXT_HOP},\s+${INTERFACE} -> Record
+  ^${PROTOCOL}\s+(${TYPE}\s+)?(${BEST}\s+)?${NETWORK}\s+\[${PREFERENCE}/${METRIC}\]\s+via\s+${NEXT_HOP}\s*$$ -> Record
+  ^\s+via\s+${NEXT_HOP},\s+${AGE},\s+${INTERFACE} -> Record
+  ^\s+via\s+${NEXT_HOP},\s+${INTERFACE} -> Record
+
+EOF
@@ -0,0 +1,14 @@
+Value LAST_UPDATE (\S.*\S)
+Value Required INSERTS (\d+)
+Value Required DELETES (\d+)
+Value Required DROPS (\d+)
+Value Required AGEOUTS (\d+)
+
+Start
+  ^LLDP Device Statistics
+  ^Last Update\.*\s*${LAST_UPDATE}
+  ^Total Inserts\.*\s*${INSERTS}
+  ^Total Deletes\.*\s*${DELETES}
+  ^Total Drops\.*\s*${DROPS}
+  ^Total Ageouts\.*\s*${AGEOUTS} -> Record End
+
@@ -0,0 +1,9 @@
+Value Required DYNAMIC (\d+)
+Value Required STATIC (\d+)
+Value Required TOTAL (\d+)
+
+Start
+  ^Dynamic Address count\.*\s*${DYNAMIC}
+  ^Static Address \(User-defined\) count\.*\s*${STATIC}
+  ^Total MAC Addresses in use\.*\s*${TOTAL} -> Record End
+
@@ -0,0 +1,10 @@
+Value UNIT (\d+)
+
+Start
+  ^System Thermal Conditions\: -> Thermal
+
+Thermal
+  ^Unit\s+Temperature\s+State
+  ^${UNIT}\s+\S+\s+\S+ -> Record
+  ^Temperature Sensors\: -> End
+
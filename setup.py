@@ -27,4 +27,6 @@ setup(
     url="https://github.com/ggiesen/napalm-dellos6",
     include_package_data=True,
     install_requires=reqs,
+    # The SNMP backend uses the synchronous hlapi, removed in pysnmp 7
+    extras_require={"snmp": ["pysnmp>=4.4,<7"]},
 )
@@ -1,4 +1,6 @@
 """Test fixtures."""
+import os
+import time
 from builtins import super
 
 import pytest
@@ -24,6 +26,42 @@ def set_device_parameters(request):
     parent_conftest.set_device_parameters(request)
 
 
+@pytest.fixture
+def mocked_device():
+    """
+    Return a factory of FakeDellOS6Device serving the mocked data of a test, e.g.
+    ``mocked_device("test_get_vlans")``. The data missing from the test directory is
+    looked up in the fallback test directories, in order.
+    """
+
+    def factory(test, *fallback_tests, **kwargs):
+        device = FakeDellOS6Device()
+        device.current_test = test
+        device.current_test_case = kwargs.get("test_case", "normal")
+        device.fallback_tests = list(fallback_tests)
+        return device
+
+    return factory
+
+
+@pytest.fixture
+def mocked_driver(mocked_device):
+    """
+    Return a factory of PatchedDellOS6Driver serving the mocked data of a test, e.g.
+    ``mocked_driver("test_get_vlans", parse_cache=True)``. The sessions opened for
+    concurrent commands are clones of the device, kept in ``driver.sessions``.
+    """
+
+    def factory(test, *fallback_tests, **optional_args):
+        driver = PatchedDellOS6Driver(
+            "switch1", "vagrant", "vagrant", optional_args=optional_args
+        )
+        driver.device = mocked_device(test, *fallback_tests)
+        return driver
+
+    return factory
+
+
 def pytest_generate_tests(metafunc):
     """Generate test cases dynamically."""
     parent_conftest.pytest_generate_tests(metafunc, __file__)
@@ -38,6 +76,7 @@ class PatchedDellOS6Driver(dellos6.DellOS6Driver):
 
         self.patched_attrs = ["device"]
         self.device = FakeDellOS6Device()
+        self.sessions = []
 
     def disconnect(self):
         pass
@@ -48,29 +87,122 @@ class PatchedDellOS6Driver(dellos6.DellOS6Driver):
     def open(self):
         pass
 
+    def _open_session(self):
+        """Sessions of the pool are clones of the device."""
+        self.sessions.append(self.device.clone())
+        return self.sessions[-1]
+
+
+class FakeChannel(object):
+    """paramiko channel stand-in returning the queued data in small chunks."""
+
+    def __init__(self, chunk_size=64):
+        self.chunk_size = chunk_size
+        self.data = b""
+
+    def recv_ready(self):
+        return bool(self.data)
+
+    def recv(self, size):
+        size = min(size, self.chunk_size)
+        chunk, self.data = self.data[:size], self.data[size:]
+        return chunk
+
 
 class FakeDellOS6Device(BaseTestDouble):
     """DellOS6 device test double."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fallback_tests = []
+        self.commands = []
+        self.written = []
+        # Outputs served instead of the mocked data, by command
+        self.outputs = {}
+        # (old, new) replacements applied to every output
+        self.edits = []
+        # Called with the commands not in outputs, returns None for the mocked data
+        self.handler = None
+        # Returned by set_base_prompt(), the channel tests set a hostname
+        self.prompt = "#"
+        self.latency = 0.0
+        # Output written to remote_conn if set, else returned by read_channel()
+        self.remote_conn = None
+        self.chunk_size = 64
+        self.chunks = []
+
+    def clone(self):
+        """Return a device serving the same data, like another session would."""
+        device = type(self)()
+        for attr in ("current_test", "current_test_case", "fallback_tests", "outputs"):
+            setattr(device, attr, getattr(self, attr))
+        for attr in ("edits", "handler", "prompt", "latency", "chunk_size"):
+            setattr(device, attr, getattr(self, attr))
+        return device
+
+    def find_file(self, filename):
+        try:
+            return super().find_file(filename)
+        except IOError:
+            module_dir = os.path.dirname(__file__)
+            for test in self.fallback_tests:
+                full_path = os.path.join(
+                    module_dir, "mocked_data", test, self.current_test_case, filename
+                )
+                if os.path.exists(full_path):
+                    return full_path
+            raise
+
+    def open_channel(self):
+        """Serve the output of the commands written from a paramiko-like channel."""
+        self.remote_conn = FakeChannel(self.chunk_size)
+
+    def read_output(self, command):
+        """Return the output of a command, without recording it."""
+        output = self.outputs.get(command)
+        if output is None and self.handler:
+            output = self.handler(command)
+        if output is None:
+            filename = "{}.txt".format(self.sanitize_text(command))
+            output = self.read_txt_file(self.find_file(filename))
+        for old, new in self.edits:
+            output = output.replace(old, new)
+        return str(output)
+
     def send_command(self, command, **kwargs):
-        # cmd = re.sub(r'[\[\]\*\^\+\s\|/]', '_', command)
-        filename = "{}.txt".format(self.sanitize_text(command))
-        full_path = self.find_file(filename)
-        result = self.read_txt_file(full_path)
-        return str(result)
+        self.commands.append(command)
+        if self.latency:
+            time.sleep(self.latency)
+        return self.read_output(command)
+
+    def write_channel(self, data):
+        self.written.append(data)
+        command = data.strip()
+        if not command or command == "\x03":
+            return
+        self.commands.append(command)
+        output = "{}\r\n{}{}#".format(
+            command, self.read_output(command).replace("\n", "\r\n"), self.prompt
+        )
+        if self.remote_conn is not None:
+            self.remote_conn.data += output.encode()
+            return
+        size = self.chunk_size
+        self.chunks = [output[i : i + size] for i in range(0, len(output), size)]
+
+    def read_channel(self):
+        if self.chunks:
+            return self.chunks.pop(0)
+        return ""
 
     def send_command_expect(self, command):
-        # cmd = re.sub(r'[\[\]\*\^\+\s\|/]', '_', command)
-        filename = "{}.txt".format(self.sanitize_text(command))
-        full_path = self.find_file(filename)
-        result = self.read_txt_file(full_path)
-        return str(result)
+        return self.send_command(command)
 
     def disconnect(self):
         pass
 
     def set_base_prompt(self):
-        return "#"
+        return self.prompt
 
     def run_commands(self, command_list, encoding="json"):
         """Fake run_commands."""
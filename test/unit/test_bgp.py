@@ -0,0 +1,94 @@
+"""Tests for the streaming BGP table parser."""
+from napalm_dellos6.dellos6_bgp import BGPRouteParser
+
+SHOW_IP_BGP = """BGP table version is 6, local router ID is 0.0.0.100
+Status codes: s suppressed, * valid, > best, i - internal, r - RIB failure
+Origin codes: i - IGP, e - EGP, ? - incomplete
+
+     Network            Next Hop            Metric     LocPref    Path              Origin
+     ------------------ ------------------- ---------- ---------- ----------------- ------
+*>   10.1.1.0/24        172.20.1.100        0                     100               i
+*    10.1.2.0/24        172.20.1.100                   100        100 200 300       e
+*>i  10.1.3.0/24        10.10.10.10         20         150                          ?
+*>   2001:db8:1234:5678::/64
+                        fe80::2             0                     100 65010         i
+"""
+
+
+def test_parse_columns():
+    routes = list(BGPRouteParser().parse(SHOW_IP_BGP.splitlines()))
+
+    assert [route["prefix"] for route in routes] == [
+        "10.1.1.0/24",
+        "10.1.2.0/24",
+        "10.1.3.0/24",
+        "2001:db8:1234:5678::/64",
+    ]
+    assert routes[0]["metric"] == 0 and routes[0]["local_pref"] == -1
+    assert routes[1]["metric"] == -1 and routes[1]["local_pref"] == 100
+    assert routes[1]["as_path"] == "100 200 300"
+    assert not routes[1]["best"] and routes[1]["origin"] == "e"
+    assert routes[2]["internal"] and routes[2]["as_path"] == ""
+
+
+def test_parse_wrapped_prefix():
+    route = list(BGPRouteParser().parse(SHOW_IP_BGP.splitlines()))[-1]
+
+    assert route == {
+        "prefix": "2001:db8:1234:5678::/64",
+        "next_hop": "fe80::2",
+        "metric": 0,
+        "local_pref": -1,
+        "as_path": "100 65010",
+        "origin": "i",
+        "valid": True,
+        "best": True,
+        "internal": False,
+    }
+
+
+SHOW_IP_BGP_MULTIPATH = """\
+     Network            Next Hop            Metric     LocPref    Path              Origin
+     ------------------ ------------------- ---------- ---------- ----------------- ------
+*>   10.1.1.0/24        172.20.1.100        0                     100               i
+*                       172.20.1.101        10                    200 100           i
+*                       172.20.1.102                   50         300 100           e
+*>   10.1.2.0/24        172.20.1.100                              100               i
+"""
+
+
+def test_parse_multipath():
+    routes = list(BGPRouteParser().parse(SHOW_IP_BGP_MULTIPATH.splitlines()))
+
+    assert [(route["prefix"], route["next_hop"]) for route in routes] == [
+        ("10.1.1.0/24", "172.20.1.100"),
+        ("10.1.1.0/24", "172.20.1.101"),
+        ("10.1.1.0/24", "172.20.1.102"),
+        ("10.1.2.0/24", "172.20.1.100"),
+    ]
+    assert routes[1]["metric"] == 10 and routes[1]["as_path"] == "200 100"
+    assert routes[2]["local_pref"] == 50 and routes[2]["origin"] == "e"
+    assert routes[1]["valid"] and not routes[1]["best"]
+
+
+def test_parse_is_lazy():
+    def lines():
+        yield SHOW_IP_BGP.splitlines()[4]
+        yield SHOW_IP_BGP.splitlines()[6]
+        raise AssertionError("read past the first route")
+
+    assert next(BGPRouteParser().parse(lines()))["prefix"] == "10.1.1.0/24"
+
+
+def test_iter_bgp_routes(mocked_driver):
+    command = "show ip bgp neighbors 172.20.1.100 received-routes"
+    driver = mocked_driver("test_get_bgp_neighbors")
+    driver.device.outputs[command] = SHOW_IP_BGP
+    driver.device.chunk_size = 11
+    driver.device.prompt = "switch1"
+
+    routes = list(driver._iter_bgp_routes("172.20.1.100"))
+
+    assert driver.device.written == [command + "\n"]
+    assert len(routes) == 4
+    assert routes[2]["metric"] == 20
@@ -0,0 +1,38 @@
+"""Tests for the buffered command reader."""
+import pytest
+from napalm.base.exceptions import CommandErrorException
+
+from napalm_dellos6.dellos6_buffer import OutputBuffer
+
+
+def test_output_buffer():
+    buffer = OutputBuffer("console")
+    assert not buffer.feed(b"show vlan\r\nline 1\r\n% Inv")
+    assert not buffer.feed(b"alid input\r\nconsole")
+    assert buffer.error
+    assert buffer.feed(b"# ")
+    assert buffer.text() == "line 1\n% Invalid input"
+
+
+def test_output_buffer_prompt_in_output():
+    buffer = OutputBuffer("console")
+    assert not buffer.feed(b"show hosts\nconsole#x\n")
+    assert buffer.feed(b"console#")
+    assert buffer.text() == "console#x"
+    assert not buffer.error
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_buffered_read(mocked_driver, chunk_size):
+    driver = mocked_driver("test_get_mac_address_table", buffered_read=True)
+    device = driver.device
+    device.outputs["show foo"] = "% Invalid input\n"
+    device.chunk_size = chunk_size
+    device.prompt = "switch1"
+    device.open_channel()
+    output = device.read_output("show mac address-table")
+
+    assert driver._send_command("show mac address-table") == output.rstrip("\n")
+    assert driver.get_mac_address_table() == device.expected_result
+    with pytest.raises(CommandErrorException):
+        driver._send_command("show foo")
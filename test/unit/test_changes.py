@@ -0,0 +1,76 @@
+"""Tests for the change-event mode."""
+from napalm_dellos6.dellos6_changes import (
+    ChangeEvent,
+    ChangeTracker,
+    decode_events,
+    encode_events,
+)
+
+
+def test_tracker_events():
+    tracker = ChangeTracker()
+    assert tracker.update({"a": 1, "b": 2}) == [
+        ChangeEvent("+", "a", 1),
+        ChangeEvent("+", "b", 2),
+    ]
+    assert tracker.update({"a": 1, "b": 3, "c": 4}) == [
+        ChangeEvent("~", "b", 3),
+        ChangeEvent("+", "c", 4),
+    ]
+    assert tracker.update({"c": 4}) == [
+        ChangeEvent("-", "a", None),
+        ChangeEvent("-", "b", None),
+    ]
+    assert tracker.update({"c": 4}) == []
+
+
+def test_tracker_list_ignore():
+    tracker = ChangeTracker(("interface", "ip"), ignore=("age",))
+    entry = {"interface": "Vl1", "ip": "192.0.2.1", "mac": "AA", "age": 1.0}
+    tracker.update([entry])
+    assert tracker.update([dict(entry, age=20.0)]) == []
+    assert tracker.update([dict(entry, mac="BB")]) == [
+        ChangeEvent("~", ("Vl1", "192.0.2.1"), dict(entry, mac="BB"))
+    ]
+
+
+def test_encode_decode():
+    events = [
+        ChangeEvent("+", ("00:0E:1E:B0:4F:03", 1), {"interface": "Te2/0/3"}),
+        ChangeEvent("-", "Te1/0/1", None),
+    ]
+    data = encode_events("get_mac_address_table", events)
+
+    assert data.splitlines()[1] == '["get_mac_address_table","-","Te1/0/1"]'
+    assert list(decode_events(data)) == [
+        ("get_mac_address_table", event) for event in events
+    ]
+
+
+def test_driver_get_changes(mocked_driver):
+    driver = mocked_driver("test_get_mac_address_table")
+
+    table = driver.get_mac_address_table()
+    assert len(driver._get_changes("get_mac_address_table")) == len(table)
+    assert driver._get_changes("get_mac_address_table") == []
+
+    # One MAC address moved to another port, another one aged out
+    driver.device.edits = [
+        ("000E.1EB0.4F03        Dynamic     Te2/0/3", "000E.1EB0.4F03 Dynamic Te2/0/9"),
+        ("1        0050.5664.BFA9        Dynamic     Te2/0/11\n", ""),
+    ]
+    events = driver._get_changes("get_mac_address_table")
+    assert [(event.op, event.key) for event in events] == [
+        ("~", ("00:0E:1E:B0:4F:03", 1)),
+        ("-", ("00:50:56:64:BF:A9", 1)),
+    ]
+    assert events[0].value["interface"].endswith("2/0/9")
+
+
+def test_driver_get_changes_list_argument(mocked_driver):
+    driver = mocked_driver("test_get_interfaces")
+
+    events = driver._get_changes("_get_interfaces", fields=["is_up"])
+    assert events[0].value == {"is_up": events[0].value["is_up"]}
+    assert driver._get_changes("_get_interfaces", fields=["is_up"]) == []
+    assert len(driver._get_changes("_get_interfaces", fields=["mtu"])) == len(events)
@@ -0,0 +1,74 @@
+"""Tests for the running-config tree."""
+import pytest
+
+from napalm_dellos6.dellos6_config import DellOS6Config
+
+
+@pytest.fixture
+def config(mocked_device):
+    device = mocked_device("test_get_config")
+    return DellOS6Config(device.read_output("show running-config"))
+
+
+def test_interface_lookup(config):
+    interface = config.interface("Tengigabitethernet1/0/8")
+    assert interface.line == "interface Te1/0/8"
+    assert interface.lines() == [
+        "shutdown",
+        'description "  blah "',
+        "spanning-tree portfast",
+    ]
+    assert config.interface("vlan 3840").value("ipv6 address").endswith("/64")
+    assert config.interface("port-channel50").value("description") == "Port-channel50"
+
+
+def test_sections(config):
+    assert config.section("vpc domain 1").lines() == [
+        "peer-keepalive enable",
+        "peer detection enable",
+    ]
+    assert len(config.sections("line")) == 3
+    # Nested "ip vrf forwarding" must not be treated as a new section
+    assert config.interface("vlan 666").lines("ip ") == [
+        "ip vrf forwarding TEST",
+        "ip address 192.0.2.129 255.255.255.252",
+    ]
+    assert config.lines("hostname") == ['hostname "switch1"']
+
+
+def test_derived_getters(config):
+    assert config.users()["test"]["password"] == "da1809c347677d690402d93be40ceaa1"
+    assert config.ntp_servers() == {"192.0.2.133": {}, "198.51.100.133": {}}
+    assert config.snmp_information() == {
+        "chassis_id": "switch1",
+        "community": {"public": {"acl": "N/A", "mode": "ro"}},
+        "contact": "",
+        "location": "LOC",
+    }
+    descriptions = config.interface_descriptions()
+    assert descriptions["Tengigabitethernet1/0/8"] == "blah"
+    assert descriptions["port-channel50"] == "Port-channel50"
+
+
+def test_users_default_privilege(mocked_device):
+    device = mocked_device("test_get_users")
+    config = DellOS6Config(device.read_output("show running-config | section username"))
+    users = config.users()
+    # "test" has admin profiles but no privilege keyword
+    assert "privilege" not in config.lines('username "test" ')[0]
+    assert users["test"]["level"] == 1
+    assert users == device.expected_result
+
+
+def test_config_cache_getters(mocked_driver):
+    driver = mocked_driver("test_get_users", config_cache=True)
+    device = driver.device
+    config = device.read_output("show running-config | section username")
+    device.outputs["show running-config"] = config
+    assert driver.get_users() == device.expected_result
+    assert device.commands == ["show running-config"]
+
+    interfaces = mocked_driver("test_get_interfaces").get_interfaces()
+    driver = mocked_driver("test_get_interfaces", "test_get_config", config_cache=True)
+    assert driver.get_interfaces() == interfaces
+    assert "show interfaces description" not in driver.device.commands
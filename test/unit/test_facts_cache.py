@@ -0,0 +1,56 @@
+"""Tests for the on-disk get_facts cache."""
+import pytest
+
+
+@pytest.fixture
+def make_driver(tmp_path, mocked_driver):
+    def make_driver(**optional_args):
+        optional_args.setdefault("facts_cache", str(tmp_path))
+        return mocked_driver("test_get_facts", **optional_args)
+
+    return make_driver
+
+
+def test_cached_facts(make_driver):
+    facts = make_driver().get_facts()
+    driver = make_driver()
+
+    assert driver.get_facts() == facts
+    assert driver.device.commands == ["show system"]
+
+
+def test_reload_invalidates(make_driver):
+    make_driver().get_facts()
+    driver = make_driver()
+    driver.device.edits = [("1190 days", "0 days")]
+
+    assert driver.get_facts()["uptime"] < 86400
+    assert "show version" in driver.device.commands
+
+
+def test_stack_change_invalidates(make_driver):
+    make_driver().get_facts()
+    driver = make_driver()
+    driver.device.edits = [("2    45          Medium", "")]
+
+    driver.get_facts()
+    assert "show switch" in driver.device.commands
+
+
+def test_tier_ttl(make_driver):
+    make_driver().get_facts()
+    driver = make_driver(facts_cache_ttls={"interfaces": -1})
+
+    driver.get_facts()
+    assert "show version" not in driver.device.commands
+    assert "show interfaces status" in driver.device.commands
+
+
+def test_invalidate(make_driver):
+    driver = make_driver()
+    driver.get_facts()
+    driver._invalidate_facts_cache()
+    driver.device.commands = []
+
+    driver.get_facts()
+    assert "show version" in driver.device.commands
@@ -0,0 +1,10 @@
+"""Tests for the imports of the package."""
+from napalm.base import get_network_driver
+
+import napalm_dellos6
+from napalm_dellos6.dellos6 import DellOS6Driver
+
+
+def test_get_network_driver():
+    assert get_network_driver("dellos6") is DellOS6Driver
+    assert napalm_dellos6.DellOS6Driver is DellOS6Driver
@@ -0,0 +1,121 @@
+"""Tests for the field and interface selective interface getters."""
+import pytest
+
+
+@pytest.fixture
+def driver(mocked_driver):
+    return mocked_driver("test_get_interfaces")
+
+
+def test_fields_only_send_needed_commands(driver):
+    interfaces = driver._get_interfaces(fields=["is_up", "description"])
+
+    assert driver.device.commands == [
+        "show interfaces status",
+        "show ip interface",
+        "show switch stack-ports",
+        "show interfaces description",
+    ]
+    assert all(
+        sorted(interface) == ["description", "is_up"]
+        for interface in interfaces.values()
+    )
+
+
+def test_fields_match_full_result(driver):
+    full = driver.get_interfaces()
+    partial = driver._get_interfaces(fields=["mac_address", "mtu"])
+
+    assert "show interfaces" in driver.device.commands
+    assert partial == {
+        name: {"mac_address": values["mac_address"], "mtu": values["mtu"]}
+        for name, values in full.items()
+    }
+
+
+def test_unknown_field(driver):
+    with pytest.raises(ValueError):
+        driver._get_interfaces(fields=["speed", "bogus"])
+
+
+def test_interfaces_pushdown(driver):
+    interfaces = driver._get_interfaces(interfaces=["Te1/0/4"])
+
+    assert driver.device.commands == [
+        "show interfaces status Te1/0/4",
+        "show switch stack-ports",
+        "show interfaces configuration Te1/0/4",
+        "show interfaces Te1/0/4",
+        "show interfaces description Te1/0/4",
+    ]
+    assert list(interfaces) == ["Tengigabitethernet1/0/4"]
+
+
+def test_interfaces_pushdown_bulk(driver):
+    full = driver.get_interfaces()
+    driver.pushdown_threshold = 0
+    names = ["Tengigabitethernet1/0/4", "vlan 3840"]
+
+    assert driver._get_interfaces(interfaces=names) == {
+        name: full[name] for name in names
+    }
+
+
+def test_counters_pushdown(mocked_driver):
+    driver = mocked_driver("test_get_interfaces_counters")
+    full = driver.get_interfaces_counters()
+    driver.device.commands = []
+
+    counters = driver._get_interfaces_counters(interfaces=["Te1/0/4", "Po10"])
+
+    assert driver.device.commands == [
+        "show interfaces counters Po10",
+        "show interfaces counters Te1/0/4",
+        "show interfaces counters errors Po10",
+        "show interfaces counters errors Te1/0/4",
+    ]
+    assert counters == {
+        name: full[name] for name in ("Tengigabitethernet1/0/4", "port-channel10")
+    }
+
+
+def test_optics_pushdown(mocked_driver):
+    driver = mocked_driver("test_get_optics")
+
+    optics = driver._get_optics(interfaces=["Tengigabitethernet2/0/23"])
+
+    assert driver.device.commands == ["show fiber-ports optical transceiver Te2/0/23"]
+    assert list(optics) == ["Tengigabitethernet2/0/23"]
+
+
+@pytest.mark.parametrize("threshold", [10, 0])
+def test_interfaces_unknown_port(driver, threshold):
+    full = driver.get_interfaces()
+    driver.pushdown_threshold = threshold
+    driver.device.handler = lambda command: (
+        "                   ^\n% Invalid input detected at '^' marker.\n"
+        if command.endswith(" Te9/0/1")
+        else None
+    )
+
+    interfaces = driver._get_interfaces(interfaces=["Te1/0/4", "Te9/0/1"])
+
+    assert interfaces == {"Tengigabitethernet1/0/4": full["Tengigabitethernet1/0/4"]}
+
+
+def test_counters_unknown_port(mocked_driver):
+    results = []
+    for threshold in (10, 0):
+        driver = mocked_driver("test_get_interfaces_counters")
+        driver.pushdown_threshold = threshold
+        driver.device.handler = lambda command: (
+            "% Invalid input detected at '^' marker.\n"
+            if command.endswith(" Te9/0/1")
+            else None
+        )
+        results.append(
+            driver._get_interfaces_counters(interfaces=["Te1/0/4", "Te9/0/1"])
+        )
+
+    assert results[0] == results[1]
+    assert set(results[0]["Tengigabitethernet9/0/1"].values()) == {-1}
@@ -0,0 +1,81 @@
+"""Tests for the streaming ARP and IPv6 neighbor table parsers."""
+import pytest
+
+from napalm_dellos6.dellos6_neighbors import (
+    ARPTableParser,
+    IPv6NeighborsParser,
+    fast_mac,
+)
+from napalm_dellos6.dellos6_parser import parse_arp_age
+
+
+@pytest.mark.parametrize(
+    "age,seconds",
+    [("n/a", 0), ("0h 13m 33s", 813), ("0h  9m 45s", 585), ("2h 0m 1s", 7201)],
+)
+def test_parse_arp_age(age, seconds):
+    assert parse_arp_age(age) == seconds
+
+
+def test_fast_mac():
+    assert fast_mac("f8b1.5695.CFF1") == "F8:B1:56:95:CF:F1"
+    assert fast_mac("f8:b1:56:95:cf:f1") == "F8:B1:56:95:CF:F1"
+
+
+def test_parsers_match_getters(mocked_device):
+    device = mocked_device("test_get_arp_table")
+    lines = device.read_output("show arp").splitlines()
+    assert list(ARPTableParser().parse(lines)) == device.expected_result[:-2]
+
+    device = mocked_device("test_get_ipv6_neighbors_table")
+    lines = device.read_output("show ipv6 neighbors").splitlines()
+    assert list(IPv6NeighborsParser().parse(lines)) == device.expected_result
+
+
+def test_parser_interface_filter(mocked_device):
+    lines = mocked_device("test_get_arp_table").read_output("show arp").splitlines()
+    entries = list(ARPTableParser("out-of-band").parse(lines))
+    assert [entry["ip"] for entry in entries] == ["10.238.12.1"]
+    assert list(ARPTableParser("Vl1").parse(lines)) == []
+
+
+def test_iter_arp_table_all_vrfs(mocked_driver):
+    driver = mocked_driver("test_get_arp_table")
+    driver.device.prompt = "switch1"
+    assert list(driver._iter_arp_table()) == driver.device.expected_result
+    assert driver.device.commands == ["show ip vrf", "show arp", "show arp vrf TEST"]
+
+
+def test_iter_arp_table_vlan(mocked_driver, mocked_device):
+    driver = mocked_driver("test_get_arp_table")
+    device = driver.device
+    device.prompt = "switch1"
+    device.outputs["show arp vrf TEST | include Vl666"] = device.read_output(
+        "show arp vrf TEST"
+    )
+    entries = list(driver._iter_arp_table(vrf="TEST", vlan=666))
+    assert entries == mocked_device("test_get_arp_table_with_vrf").expected_result
+    assert device.commands == ["show arp vrf TEST | include Vl666"]
+
+    with pytest.raises(ValueError):
+        list(driver._iter_arp_table(interface="Vl666", vlan=666))
+
+
+def test_iter_ipv6_neighbors_table(mocked_driver):
+    driver = mocked_driver("test_get_ipv6_neighbors_table")
+    device = driver.device
+    device.prompt = "switch1"
+    device.outputs["show ipv6 neighbors | include Vl3840"] = device.read_output(
+        "show ipv6 neighbors"
+    )
+    entries = list(driver._iter_ipv6_neighbors_table(interface="vlan 3840"))
+    assert entries == device.expected_result
+    assert device.commands == ["show ipv6 neighbors | include Vl3840"]
+
+
+def test_get_arp_table_all_vrfs_concurrent(mocked_driver):
+    driver = mocked_driver("test_get_arp_table")
+    assert driver.get_arp_table() == driver.device.expected_result
+    assert driver.device.commands == ["show ip vrf"]
+    commands = sorted(c for session in driver.sessions for c in session.commands)
+    assert commands == ["show arp", "show arp vrf TEST"]
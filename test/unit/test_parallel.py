@@ -0,0 +1,71 @@
+"""Tests for the parallel commands mode and _get_multi()."""
+import pytest
+from napalm.base.exceptions import CommandErrorException
+
+GETTERS = {
+    "get_interfaces": "test_get_interfaces",
+    "get_interfaces_counters": "test_get_interfaces_counters",
+    "get_interfaces_ip": "test_get_interfaces_ip",
+    "get_environment": "test_get_environment",
+    "get_lldp_neighbors_detail": "test_get_lldp_neighbors_detail",
+    "get_snmp_information": "test_get_snmp_information",
+    "get_network_instances": "test_get_network_instances",
+}
+
+
+@pytest.mark.parametrize("getter", sorted(GETTERS))
+def test_parallel_matches_serial(mocked_driver, getter):
+    serial = mocked_driver(GETTERS[getter])
+    parallel = mocked_driver(GETTERS[getter], parallel_commands=True)
+
+    assert getattr(parallel, getter)() == getattr(serial, getter)()
+    # Every command was sent once, most of them over the extra sessions
+    sent = parallel.device.commands + [
+        command for session in parallel.sessions for command in session.commands
+    ]
+    assert sorted(sent) == sorted(serial.device.commands)
+    assert len(parallel.device.commands) < len(serial.device.commands)
+
+
+def test_parallel_command_errors(mocked_driver):
+    serial = mocked_driver("test_get_interfaces_ip")
+    parallel = mocked_driver("test_get_interfaces_ip", parallel_commands=True)
+    for driver in (serial, parallel):
+        driver.device.outputs["show ip interface"] = "% Invalid input detected"
+
+    with pytest.raises(CommandErrorException):
+        serial.get_interfaces_ip()
+    with pytest.raises(CommandErrorException):
+        parallel.get_interfaces_ip()
+
+
+def test_get_multi(mocked_driver):
+    tests = sorted(set(GETTERS.values()))
+    serial = mocked_driver(*tests)
+    driver = mocked_driver(*tests, max_sessions=3)
+
+    results = driver._get_multi(
+        {"get_interfaces_ip": {}, "get_environment": {}, "get_interfaces": {}}
+    )
+
+    assert results == {
+        "get_interfaces_ip": serial.get_interfaces_ip(),
+        "get_environment": serial.get_environment(),
+        "get_interfaces": serial.get_interfaces(),
+    }
+    assert driver.device.commands == []
+    assert 1 <= len(driver.sessions) <= 3
+
+
+def test_get_multi_filtered(mocked_driver):
+    driver = mocked_driver("test_get_interfaces", max_sessions=2)
+
+    results = driver._get_multi(
+        {"_get_interfaces": {"fields": ["is_up"]}, "get_interfaces": {}}
+    )
+
+    full = results["get_interfaces"]
+    assert results["_get_interfaces"] == {
+        name: {"is_up": values["is_up"]} for name, values in full.items()
+    }
+    assert "mtu" in next(iter(full.values()))
@@ -0,0 +1,53 @@
+"""Tests for the parse cache."""
+from napalm_dellos6.dellos6_parse_cache import ParseCache
+
+
+def test_hits_and_copies():
+    calls = []
+
+    def parser(raw_output):
+        calls.append(raw_output)
+        return [{"line": line} for line in raw_output.splitlines()]
+
+    cache = ParseCache()
+    first = cache.parse("tpl", "a\nb", parser)
+    first[0]["line"] = "changed"
+    second = cache.parse("tpl", "a\nb", parser)
+
+    assert calls == ["a\nb"]
+    assert second == [{"line": "a"}, {"line": "b"}]
+    cache.parse("other", "a\nb", parser)
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 2, "hit_rate": 1 / 3.0}
+
+
+def test_copies_list_values():
+    def parser(raw_output):
+        return [{"ports": raw_output.split(",")}]
+
+    cache = ParseCache()
+    cache.parse("tpl", "Te1/0/1,Te1/0/2", parser)[0]["ports"].append("Po1")
+    entries = cache.parse("tpl", "Te1/0/1,Te1/0/2", parser)
+    entries[0]["ports"].append("Po2")
+
+    assert cache.parse("tpl", "Te1/0/1,Te1/0/2", parser) == [
+        {"ports": ["Te1/0/1", "Te1/0/2"]}
+    ]
+
+
+def test_bounded():
+    cache = ParseCache(size=2)
+    for output in ("a", "b", "a", "c"):
+        cache.parse("tpl", output, lambda raw: [{"raw": raw}])
+
+    assert len(cache) == 2
+    # "b" was the least recently used output
+    cache.parse("tpl", "b", lambda raw: [{"raw": raw}])
+    assert cache.stats()["hits"] == 1
+
+
+def test_driver_parse_cache(mocked_driver):
+    driver = mocked_driver("test_get_vlans", parse_cache=True)
+
+    vlans = driver.get_vlans()
+    assert driver.get_vlans() == vlans
+    assert driver.parse_cache.stats()["hit_rate"] == 0.5
@@ -0,0 +1,73 @@
+"""Tests for the connection-free DellOS6Parser."""
+import json
+
+import pytest
+
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+
+GETTERS = [
+    "get_arp_table",
+    "get_bgp_neighbors",
+    "get_bgp_neighbors_detail",
+    "get_environment",
+    "get_interfaces_counters",
+    "get_interfaces_ip",
+    "get_ipv6_neighbors_table",
+    "get_lldp_neighbors",
+    "get_lldp_neighbors_detail",
+    "get_mac_address_table",
+    "get_network_instances",
+    "get_ntp_peers",
+    "get_ntp_servers",
+    "get_ntp_stats",
+    "get_optics",
+    "get_snmp_information",
+    "get_users",
+    "get_vlans",
+]
+
+
+def _collect(device, parser, getter, **kwargs):
+    outputs = {}
+    commands = parser.commands(getter, **kwargs)
+    while commands:
+        for command in commands:
+            outputs[command] = device.read_output(command)
+        commands = parser.commands(getter, outputs, **kwargs)
+    return outputs
+
+
+@pytest.mark.parametrize("getter", GETTERS)
+def test_getters_offline(mocked_device, getter):
+    device = mocked_device("test_" + getter)
+    parser = DellOS6Parser()
+    result = getattr(parser, getter)(_collect(device, parser, getter))
+    assert json.loads(json.dumps(result)) == device.expected_result
+
+
+def test_dependent_commands(mocked_device):
+    device = mocked_device("test_get_lldp_neighbors_detail")
+    parser = DellOS6Parser()
+    commands = parser.commands("get_lldp_neighbors_detail")
+    assert commands == ["show lldp remote-device all"]
+    outputs = {commands[0]: device.read_output(commands[0])}
+    commands = parser.commands("get_lldp_neighbors_detail", outputs)
+    assert len(commands) == 15
+    assert all(c.startswith("show lldp remote-device detail ") for c in commands)
+
+
+def test_parsed_entries(mocked_device):
+    parser = DellOS6Parser()
+    device = mocked_device("test_get_mac_address_table")
+    raw = device.read_output("show mac address-table")
+    entries = parser.parse("show_mac_address_table", raw)
+    outputs = {"show mac address-table": entries[:2]}
+    assert len(parser.get_mac_address_table(outputs)) == 2
+
+
+def test_missing_output():
+    parser = DellOS6Parser()
+    with pytest.raises(ValueError):
+        parser.get_vlans({"show vlan": ""})
+    with pytest.raises(ValueError):
+        parser.commands("get_unknown")
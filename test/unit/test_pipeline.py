@@ -0,0 +1,54 @@
+"""Tests for the process-pool parsing pipeline."""
+import json
+import threading
+
+import pytest
+
+from napalm_dellos6.dellos6_pipeline import ParsePipeline, parse_all
+
+
+@pytest.fixture
+def outputs(mocked_driver):
+    """Return the outputs collected for a getter from its mocked data."""
+    return lambda getter: mocked_driver("test_" + getter)._collect_outputs(getter)
+
+
+@pytest.fixture
+def expected(mocked_device):
+    return lambda getter: mocked_device("test_" + getter).expected_result
+
+
+def test_pipeline_from_threads(outputs, expected):
+    getters = ["get_vlans", "get_environment", "get_lldp_neighbors_detail"]
+    with ParsePipeline(max_workers=2, chunk_size=4) as pipeline:
+
+        def collect(device):
+            for getter in getters:
+                pipeline.submit(device, getter, outputs(getter))
+
+        threads = [threading.Thread(target=collect, args=(n,)) for n in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pipeline.close()
+        results = list(pipeline.results())
+
+    assert len(results) == 15
+    assert set(result.device for result in results) == set(range(5))
+    for result in results:
+        assert result.error is None
+        assert json.loads(json.dumps(result.result)) == expected(result.getter)
+
+
+def test_parse_all_errors(outputs, expected):
+    jobs = [
+        ("sw1", "get_vlans", outputs("get_vlans")),
+        ("sw2", "get_vlans", {}),
+        ("sw3", "get_arp_table", outputs("get_arp_table"), {"vrf": ""}),
+    ]
+    results = parse_all(jobs, chunk_size=2, parse_cache=16)
+    results = {result.device: result for result in results}
+    assert json.loads(json.dumps(results["sw1"].result)) == expected("get_vlans")
+    assert isinstance(results["sw2"].error, ValueError)
+    assert results["sw3"].result == expected("get_arp_table")
@@ -0,0 +1,131 @@
+"""Tests for the probe-then-fetch getters."""
+
+
+def test_lldp_probe(mocked_driver):
+    driver = mocked_driver("test_get_lldp_neighbors_detail", lldp_probe=True)
+    device = driver.device
+    expected = device.expected_result
+
+    assert driver.get_lldp_neighbors_detail() == expected
+    assert len(device.commands) == 2 + len(expected)
+
+    # Unchanged statistics: only the probe is sent
+    del device.commands[:]
+    result = driver.get_lldp_neighbors_detail()
+    assert result == expected
+    assert device.commands == ["show lldp statistics"]
+    result["Tengigabitethernet1/0/4"][0]["remote_port"] = "modified"
+    assert driver.get_lldp_neighbors_detail() == expected
+
+    # Te1/0/4 was learned again: only its detail is fetched
+    stats = device.read_output("show lldp statistics")
+    device.outputs["show lldp statistics"] = stats.replace("17", "18")
+    summary = device.read_output("show lldp remote-device all")
+    device.outputs["show lldp remote-device all"] = summary.replace(
+        "Te1/0/4   186", "Te1/0/4   286"
+    )
+    del device.commands[:]
+    assert driver.get_lldp_neighbors_detail() == expected
+    assert device.commands == [
+        "show lldp statistics",
+        "show lldp remote-device all",
+        "show lldp remote-device detail Te1/0/4",
+    ]
+
+    assert driver.probe_cache.stats() == {
+        "probes": 4,
+        "unchanged": 2,
+        "partial": 1,
+        "full": 1,
+        "hit_rate": 0.5,
+        "avoided_rate": 0.75,
+    }
+
+
+def test_lldp_probe_max_age(mocked_driver):
+    driver = mocked_driver(
+        "test_get_lldp_neighbors",
+        "test_get_lldp_neighbors_detail",
+        lldp_probe=True,
+        probe_max_age=0,
+    )
+    expected = driver.device.expected_result
+    assert driver.get_lldp_neighbors() == expected
+    del driver.device.commands[:]
+    assert driver.get_lldp_neighbors() == expected
+    assert driver.device.commands[:2] == [
+        "show lldp statistics",
+        "show lldp remote-device all",
+    ]
+    assert not [c for c in driver.device.commands if "detail" in c]
+
+
+def test_lldp_probe_unreadable(mocked_driver):
+    driver = mocked_driver("test_get_lldp_neighbors_detail", lldp_probe=True)
+    driver.device.outputs["show lldp statistics"] = "% Invalid input detected"
+    driver.get_lldp_neighbors_detail()
+    del driver.device.commands[:]
+    driver.get_lldp_neighbors_detail()
+    assert "show lldp remote-device all" in driver.device.commands
+
+
+def test_table_probes(mocked_driver):
+    driver = mocked_driver("test_get_mac_address_table", table_probes=True)
+    device = driver.device
+    expected = device.expected_result
+
+    assert driver.get_mac_address_table() == expected
+    del device.commands[:]
+    assert driver.get_mac_address_table() == expected
+    assert device.commands == ["show mac address-table count"]
+
+    # A MAC address was learned
+    count = device.read_output("show mac address-table count")
+    device.outputs["show mac address-table count"] = count.replace("80", "81")
+    del device.commands[:]
+    assert driver.get_mac_address_table() == expected
+    assert device.commands == [
+        "show mac address-table count",
+        "show mac address-table",
+    ]
+    assert driver.probe_cache.stats()["unchanged"] == 1
+
+
+def test_table_probes_arp_vrf(mocked_driver, mocked_device):
+    driver = mocked_driver("test_get_arp_table", table_probes=["get_arp_table"])
+    device = driver.device
+    device.outputs["show arp brief vrf blue"] = device.read_output("show arp brief")
+    device.outputs["show arp vrf blue"] = device.read_output("show arp vrf TEST")
+    expected = device.expected_result
+    expected_vrf = mocked_device("test_get_arp_table_with_vrf").expected_result
+
+    assert driver.get_arp_table() == expected
+    assert driver.get_arp_table(vrf="blue") == expected_vrf
+    del device.commands[:]
+    assert driver.get_arp_table(vrf="blue") == expected_vrf
+    assert device.commands == ["show arp brief vrf blue"]
+
+    # All VRFs: the summaries of every VRF are probed
+    del device.commands[:]
+    assert driver.get_arp_table() == expected
+    assert device.commands == [
+        "show ip vrf",
+        "show arp brief",
+        "show arp brief vrf TEST",
+    ]
+    assert driver.table_probes == {"get_arp_table"}
+
+
+def test_table_probes_without_summary(mocked_driver):
+    driver = mocked_driver("test_get_ipv6_neighbors_table", table_probes=True)
+    expected = driver.device.expected_result
+    assert driver.get_ipv6_neighbors_table() == expected
+    assert driver.get_ipv6_neighbors_table() == expected
+    assert driver.device.commands == ["show ipv6 neighbors"] * 2
+
+    driver = mocked_driver(
+        "test_get_ipv6_neighbors_table", table_probes=True, probe_max_age=60
+    )
+    assert driver.get_ipv6_neighbors_table() == expected
+    assert driver.get_ipv6_neighbors_table() == expected
+    assert driver.device.commands == ["show ipv6 neighbors"]
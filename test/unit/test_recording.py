@@ -0,0 +1,81 @@
+"""Tests for session recording and replay."""
+import gzip
+import time
+
+from napalm_dellos6.dellos6 import DellOS6Driver
+from napalm_dellos6.dellos6_recording import ReplayDevice, load_recording
+
+
+def _record(path, device, getters, **optional_args):
+    optional_args["record_session"] = str(path)
+    driver = DellOS6Driver("switch", "vagrant", "vagrant", optional_args=optional_args)
+    driver._open_session = lambda: device
+    driver.open()
+    results = {getter: getattr(driver, getter)() for getter in getters}
+    driver.close()
+    return results
+
+
+def _replay(path, getters, time_scale=0, **optional_args):
+    driver = DellOS6Driver("switch", "vagrant", "vagrant", optional_args=optional_args)
+    driver.device = ReplayDevice(str(path), time_scale=time_scale)
+    return {getter: getattr(driver, getter)() for getter in getters}
+
+
+def test_record_and_replay(tmp_path, mocked_device):
+    path = tmp_path / "session.jsonl.gz"
+    device = mocked_device("test_get_vlans")
+    device.latency = 0.02
+    results = _record(path, device, ["get_vlans", "get_vlans"])
+
+    header, exchanges = load_recording(str(path))
+    assert header["hostname"] == "switch"
+    commands = [exchange["w"] for exchange in exchanges]
+    assert commands[:2] == ["", "show vlan"]
+    assert commands.count("show vlan") == 2
+    assert exchanges[1]["k"][0][0] >= 0.02
+
+    assert _replay(path, ["get_vlans"]) == {"get_vlans": results["get_vlans"]}
+    start = time.time()
+    _replay(path, ["get_vlans"], time_scale=1.0)
+    assert time.time() - start >= 0.02
+
+
+def test_record_and_replay_chunks(tmp_path, mocked_device):
+    path = tmp_path / "session.jsonl.gz"
+    device = mocked_device("test_get_vlans")
+    device.chunk_size = 100
+    device.prompt = "switch1"
+    device.open_channel()
+    results = _record(path, device, ["get_vlans"], buffered_read=True)
+
+    exchanges = load_recording(str(path))[1]
+    assert exchanges[1]["m"] == "write"
+    assert len(exchanges[1]["k"]) > 1
+    assert _replay(path, ["get_vlans"], buffered_read=True) == results
+
+
+def test_record_sanitized(tmp_path, mocked_device):
+    device = mocked_device("test_get_config")
+    device.prompt = "switch1"
+    for buffered_read, chunk_size in ((False, 64), (True, 7)):
+        path = tmp_path / "session{}.jsonl.gz".format(chunk_size)
+        device.chunk_size = chunk_size
+        device.open_channel()
+        driver = DellOS6Driver(
+            "switch",
+            "vagrant",
+            "vagrant",
+            optional_args={"buffered_read": buffered_read},
+        )
+        driver._open_session = lambda: device
+        driver.open()
+        expected = driver.get_config(retrieve="running", sanitized=True)["running"]
+        _record(path, device, ["get_config"], buffered_read=buffered_read)
+
+        with gzip.open(str(path), "rt") as f:
+            recording = f.read()
+        assert "Eeng7sa9Cohhook2" not in recording
+        assert "38d0fe97e68c78d01484299c1eba409f" not in recording
+        result = _replay(path, ["get_config"], buffered_read=buffered_read)
+        assert result["get_config"]["running"] == expected
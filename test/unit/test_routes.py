@@ -0,0 +1,90 @@
+"""Tests for the routing table index."""
+import pytest
+
+from napalm_dellos6.dellos6_parser import match_routes
+from napalm_dellos6.dellos6_routes import RouteTable
+
+
+def make_table(*prefixes):
+    table = RouteTable()
+    for prefix in prefixes:
+        table.add(prefix, {"next_hop": prefix})
+    return table
+
+
+def test_lookup_longest_match():
+    table = make_table("0.0.0.0/0", "10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24")
+
+    assert table.lookup("10.1.2.3")[0] == "10.1.2.0/24"
+    assert table.lookup("10.1.3.3")[0] == "10.1.0.0/16"
+    assert table.lookup("10.2.0.1")[0] == "10.0.0.0/8"
+    assert table.lookup("192.0.2.1") == ("0.0.0.0/0", [{"next_hop": "0.0.0.0/0"}])
+    assert make_table("10.0.0.0/8").lookup("192.0.2.1") == (None, [])
+    assert make_table("2001:db8::/32").lookup("2001:db8::1")[0] == "2001:db8::/32"
+
+
+def test_longer_and_exact():
+    table = make_table("10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.2.0.0/16")
+    table.add("10.1.2.0/24", {"next_hop": "ecmp"})
+
+    assert sorted(table.longer("10.1.0.0/16")) == ["10.1.0.0/16", "10.1.2.0/24"]
+    assert len(table.longer("10.0.0.0/8")) == 4
+    assert len(table.routes("10.1.2.0/24")) == 2
+    assert "10.2.0.0/16" in table
+    assert table.routes("10.3.0.0/16") == []
+
+
+def test_match_routes():
+    table = RouteTable()
+    table.add("10.0.0.0/8", {"protocol": "static"})
+    table.add("10.1.2.0/24", {"protocol": "ospf"})
+
+    assert match_routes([table], "10.1.2.3/24") == {
+        "10.1.2.0/24": [{"protocol": "ospf"}]
+    }
+    assert list(match_routes([table], "10.1.2.3")) == ["10.1.2.0/24"]
+    assert sorted(match_routes([table], "")) == ["10.0.0.0/8", "10.1.2.0/24"]
+    assert list(match_routes([table], "", protocol="static")) == ["10.0.0.0/8"]
+    assert len(match_routes([table], "10.0.0.0/8", longer=True)) == 2
+    with pytest.raises(ValueError):
+        match_routes([table], "10.1.2")
+
+
+def test_match_routes_tables():
+    default = RouteTable()
+    default.add("10.0.0.0/8", {"protocol": "static"})
+    default.add("10.1.0.0/16", {"protocol": "static"})
+    vrf = RouteTable()
+    vrf.add("10.1.2.0/24", {"protocol": "ospf"})
+    vrf.add("192.0.2.0/24", {"protocol": "connected"})
+    tables = [default, vrf]
+
+    assert sorted(match_routes(tables, "")) == [
+        "10.0.0.0/8",
+        "10.1.0.0/16",
+        "10.1.2.0/24",
+        "192.0.2.0/24",
+    ]
+    assert sorted(match_routes(tables, "10.0.0.0/8", longer=True)) == [
+        "10.0.0.0/8",
+        "10.1.0.0/16",
+        "10.1.2.0/24",
+    ]
+    assert sorted(match_routes(tables, "10.1.2.3")) == ["10.1.0.0/16", "10.1.2.0/24"]
+    assert list(match_routes(tables, "192.0.2.1")) == ["192.0.2.0/24"]
+
+
+def test_get_route_to_all_vrfs(mocked_driver):
+    driver = mocked_driver("test_get_route_to")
+
+    def tables(routes):
+        return [route["routing_table"] for route in routes]
+
+    routes = driver.get_route_to()
+    assert len(routes) == 10
+    assert tables(routes["1.0.4.0/24"]) == ["default", "default", "TEST"]
+    assert tables(routes["192.0.2.128/30"]) == ["default", "TEST"]
+
+    routes = driver.get_route_to("1.0.4.0/22", longer=True)
+    assert sorted(routes) == ["1.0.4.0/22", "1.0.4.0/24", "1.0.5.0/24"]
+    assert tables(routes["1.0.4.0/24"]) == ["default", "default", "TEST"]
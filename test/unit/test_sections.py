@@ -0,0 +1,78 @@
+"""Tests for the single-pass parsing of multi-section outputs."""
+import pytest
+import textfsm
+
+from napalm_dellos6.dellos6_parse_cache import ParseCache
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+from napalm_dellos6.dellos6_sections import COMMAND_SECTIONS, SHOW_SYSTEM
+
+OUTPUTS = [
+    ("test_get_environment", "show system"),
+    ("test_get_facts", "show system"),
+    ("test_get_snmp_information", "show system"),
+    ("test_get_snmp_information", "show snmp"),
+]
+
+
+@pytest.mark.parametrize("test,command", OUTPUTS)
+def test_sections_match_templates(mocked_device, test, command):
+    parser = DellOS6Parser()
+    raw = mocked_device(test).read_output(command)
+    sections = COMMAND_SECTIONS[command].parse(raw)
+    assert sections
+    for template, entries in sections.items():
+        assert entries == parser.parse(template, raw)
+
+
+def test_requested_sections(mocked_device):
+    raw = mocked_device("test_get_environment").read_output("show system")
+    sections = COMMAND_SECTIONS["show system"].parse(raw, ["show_system-basic"])
+    assert list(sections) == ["show_system-basic"]
+    assert sections["show_system-basic"][0]["sys_name"] == "switch1"
+
+
+def test_sections_parse_cache(mocked_device):
+    device = mocked_device("test_get_environment")
+    parser = DellOS6Parser(ParseCache())
+    outputs = {
+        command: device.read_output(command)
+        for command in ("show system", "show process cpu")
+    }
+    first = parser.get_environment(outputs)
+    assert parser.parse_cache.stats()["misses"] == 4
+    assert parser.get_environment(outputs) == first
+    assert parser.parse_cache.stats()["hits"] == 4
+
+
+def test_sections_from_templates():
+    fans = SHOW_SYSTEM.sections["show_system-fans"]
+    assert fans.fields == ["unit", "description", "status"]
+    assert fans.start.pattern == r"^Fans\:"
+    assert SHOW_SYSTEM.sections["show_system-power_supplies"].required == [
+        "unit",
+        "description",
+        "status",
+        "pwr_avg",
+        "pwr_cur",
+    ]
+
+
+def test_sections_unmatched_line(mocked_device):
+    raw = mocked_device("test_get_environment").read_output("show system")
+    raw = raw.replace("1    Fan-2         OK", "1    Fan-2")
+    with pytest.raises(textfsm.TextFSMError):
+        DellOS6Parser().parse("show_system-fans", raw)
+    with pytest.raises(textfsm.TextFSMError):
+        COMMAND_SECTIONS["show system"].parse(raw)
+    # Sections over before the line are not affected
+    sections = COMMAND_SECTIONS["show system"].parse(raw, ["show_system-temps"])
+    assert sections["show_system-temps"]
+
+
+def test_sections_record_at_eof(mocked_device):
+    raw = mocked_device("test_get_environment").read_output("show system")
+    truncated = raw[: raw.index("Temperature Sensors:")]
+    sections = COMMAND_SECTIONS["show system"].parse(truncated, ["show_system-units"])
+    assert sections["show_system-units"] == DellOS6Parser().parse(
+        "show_system-units", truncated
+    )
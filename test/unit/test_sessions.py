@@ -0,0 +1,100 @@
+"""Tests for concurrent sessions."""
+import threading
+import time
+
+import pytest
+from napalm.base.exceptions import ConnectionClosedException
+
+from napalm_dellos6.dellos6_sessions import DellOS6SessionPool
+
+
+def test_ping_many(mocked_driver):
+    driver = mocked_driver("test_ping", max_sessions=3)
+    ping = driver.device.read_output("ping 8.8.8.8 timeout 2 size 100 repeat 5")
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def answer(command):
+        """Answers every ping with the mocked output after a short delay."""
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return ping.replace("8.8.8.8", command.split()[1])
+
+    driver.device.handler = answer
+    destinations = ["192.0.2.{}".format(i) for i in range(1, 10)]
+
+    results = dict(driver._ping_many(destinations, timeout=2, size=100, count=5))
+
+    assert sorted(results) == sorted(destinations)
+    for destination, result in results.items():
+        assert result["success"]["probes_sent"] == 5
+        assert result["success"]["results"][0]["ip_address"] == destination
+    assert peak[0] == 3
+    assert len(driver._session_pool._sessions) == 3
+    driver._session_pool.close()
+
+
+def test_ping_many_errors(mocked_driver):
+    driver = mocked_driver("test_ping", max_sessions=2)
+    ping = driver.device.read_output("ping 8.8.8.8 timeout 2 size 100 repeat 5")
+    driver.device.handler = lambda command: ping.replace("8.8.8.8", command.split()[1])
+    driver.device.outputs[
+        "ping 192.0.2.2 timeout 2 size 100 repeat 5"
+    ] = "% Invalid input detected at '^' marker."
+    destinations = ["192.0.2.1", "192.0.2.2", "192.0.2.3"]
+
+    results = dict(driver._ping_many(destinations, timeout=2, size=100, count=5))
+
+    assert "Invalid input" in results["192.0.2.2"]["error"]
+    assert results["192.0.2.3"]["success"]["probes_sent"] == 5
+    driver._session_pool.close()
+
+
+def test_ping_many_unrecognized_output(mocked_driver):
+    driver = mocked_driver("test_ping", max_sessions=2)
+    ping = driver.device.read_output("ping 8.8.8.8 timeout 2 size 100 repeat 5")
+    driver.device.handler = lambda command: ping.replace("8.8.8.8", command.split()[1])
+    driver.device.outputs[
+        "ping 192.0.2.2 source 192.0.2.254 repeat 5"
+    ] = "Request timed"
+    destinations = ["192.0.2.1", "192.0.2.2", "192.0.2.3"]
+
+    results = dict(
+        driver._ping_many(destinations, source="192.0.2.254", timeout=0, size=0)
+    )
+
+    assert results["192.0.2.2"] == {"error": "Request timed"}
+    assert results["192.0.2.1"]["success"]["probes_sent"] == 5
+    assert results["192.0.2.3"]["success"]["probes_sent"] == 5
+    driver._session_pool.close()
+
+
+def test_pool_closed():
+    class Session(object):
+        def disconnect(self):
+            self.closed = True
+
+    pool = DellOS6SessionPool(Session, 2)
+    first, second = pool.acquire(), pool.acquire()
+    pool.close()
+    assert first.closed and second.closed
+
+    # Sessions acquired before close() are not put back
+    pool.release(first)
+    pool.discard(second)
+    assert pool._idle == [] and pool._sessions == []
+    assert pool.acquire() not in (first, second)
+
+    def connect():
+        pool.close()
+        return Session()
+
+    pool = DellOS6SessionPool(connect, 2)
+    with pytest.raises(ConnectionClosedException):
+        pool.acquire()
+    assert pool._sessions == []
@@ -0,0 +1,69 @@
+"""Tests for the SNMP interface counters backend."""
+import os
+
+from napalm_dellos6.dellos6_snmp import (
+    IF_COUNTER_OIDS,
+    RecordedWalker,
+    interface_counters,
+)
+
+RECORDING = os.path.join(
+    os.path.dirname(__file__), "mocked_data", "snmp", "dellos6.snmprec"
+)
+
+
+def test_recorded_walk():
+    walker = RecordedWalker("1.3.6.1.2|4|a\n1.3.6.1.10|4|b\n1.3.6.1.1|4x|6869\n")
+
+    assert list(walker.walk("1.3.6.1")) == [
+        ("1.3.6.1.1", "hi"),
+        ("1.3.6.1.2", "a"),
+        ("1.3.6.1.10", "b"),
+    ]
+    assert list(walker.walk("1.3.6.1.1")) == []
+
+
+def test_interface_counters():
+    walker = RecordedWalker.from_file(RECORDING)
+    counters = interface_counters(walker)
+
+    assert sorted(counters) == [
+        "CPU",
+        "Tengigabitethernet1/0/1",
+        "Tengigabitethernet1/0/2",
+        "Tengigabitethernet1/0/4",
+        "port-channel10",
+        "vlan 1",
+        "vlan 4001",
+    ]
+    assert counters["Tengigabitethernet1/0/4"]["rx_octets"] == 4000012
+    assert counters["port-channel10"]["rx_errors"] == 4
+    for interface_counters_ in counters.values():
+        assert sorted(interface_counters_) == sorted(IF_COUNTER_OIDS)
+    assert all(value >= 0 for value in counters["port-channel10"].values())
+    assert len(walker.walks) == len(IF_COUNTER_OIDS) + 1
+
+
+def test_driver_snmp_counters(mocked_driver):
+    walker = RecordedWalker.from_file(RECORDING)
+    driver = mocked_driver("test_get_interfaces_counters", snmp_counters=walker)
+
+    counters = driver._get_interfaces_counters(interfaces=["Te1/0/4", "Po10"])
+    assert sorted(counters) == ["Tengigabitethernet1/0/4", "port-channel10"]
+    assert counters == {
+        name: value
+        for name, value in interface_counters(walker).items()
+        if name in counters
+    }
+    assert driver.device.commands == []
+
+    # Only the interfaces of the CLI backend are returned, not the CPU or VLAN 4001
+    counters = driver.get_interfaces_counters()
+    assert sorted(counters) == [
+        "Tengigabitethernet1/0/1",
+        "Tengigabitethernet1/0/2",
+        "Tengigabitethernet1/0/4",
+        "port-channel10",
+        "vlan 1",
+    ]
+    assert driver.device.commands == ["show interfaces status", "show ip interface"]
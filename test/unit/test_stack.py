@@ -0,0 +1,118 @@
+"""Tests for the per-unit collection of stack-wide outputs."""
+import re
+
+import pytest
+
+from napalm_dellos6.dellos6_stack import in_range, interface_ranges
+
+ROW_REGEX = re.compile(r"^(Te|Po)[\d/]+\s")
+RANGE_REGEX = re.compile(r"^(Te|Po)[\d/,-]+$|^oob$")
+
+
+@pytest.fixture
+def stack_driver(mocked_driver):
+    """
+    Driver in stack mode whose sessions answer the per-unit range commands by
+    filtering the whole-stack outputs.
+    """
+    driver = mocked_driver(
+        "test_get_interfaces_counters", "test_get_facts", stack_mode=True
+    )
+    device = driver.device
+
+    def filter_range(command):
+        command, interface_range = command.rsplit(" ", 1)
+        if not RANGE_REGEX.match(interface_range):
+            return None
+        lines = []
+        keep = True
+        for line in device.read_output(command).splitlines(True):
+            if ROW_REGEX.match(line):
+                keep = in_range(line.split()[0], interface_range)
+            elif not line[:1].isspace() or not line.strip():
+                keep = True
+            if keep:
+                lines.append(line)
+        return "".join(lines)
+
+    device.handler = filter_range
+    yield driver
+    if driver._session_pool is not None:
+        driver._session_pool.close()
+
+
+def sent(driver):
+    """Return the commands sent over all the sessions of the driver, and reset them."""
+    commands = []
+    for device in [driver.device] + driver.sessions:
+        commands.extend(device.commands)
+        del device.commands[:]
+    return commands
+
+
+def test_interface_ranges():
+    names = ["Te1/0/1", "Te1/0/2", "Te1/0/3", "Te1/0/5", "Te2/1/1", "Po1", "Po2", "oob"]
+
+    assert interface_ranges(names) == {
+        1: ["Te1/0/1-3", "Te1/0/5"],
+        2: ["Te2/1/1"],
+        None: ["Po1-2", "oob"],
+    }
+    assert in_range("Te1/0/2", "Te1/0/1-3")
+    assert not in_range("Te1/0/2", "Te1/1/1-3")
+    assert not in_range("Te1/0/12", "Te1/0/1-3")
+    assert in_range("Po2", "Po1-2") and in_range("oob", "oob")
+
+
+def test_stack_mode_counters(stack_driver, mocked_driver):
+    bulk = mocked_driver(
+        "test_get_interfaces_counters", "test_get_facts"
+    ).get_interfaces_counters()
+
+    # The unit ranges are built from the port inventory, then used right away
+    assert stack_driver.get_interfaces_counters() == bulk
+    commands = sent(stack_driver)
+    assert commands.count("show switch") == 1
+    assert commands.count("show interfaces status") == 1
+    assert "show interfaces counters" not in commands
+    assert "show interfaces counters Te2/0/1-24" in commands
+    assert "show interfaces counters errors Po10-11" in commands
+
+    assert stack_driver.get_interfaces_counters() == bulk
+    commands = sent(stack_driver)
+    assert commands.count("show switch") == 1
+    assert "show interfaces status" not in commands
+    assert "show interfaces status Te1/0/1-24" in commands
+
+
+def test_stack_mode_membership(stack_driver):
+    stack_driver.get_interfaces_counters()
+    sent(stack_driver)
+
+    # Unit 2 left the stack: the ranges are built again, and with a single unit
+    # the bulk commands are sent
+    stack_driver.device.edits = [("2   Mgmt Sw", "")]
+    stack_driver.get_interfaces_counters()
+    commands = sent(stack_driver)
+    assert "show interfaces counters" in commands
+    assert not [command for command in commands if "Te" in command]
+
+
+def test_stack_mode_unit_command_refused(stack_driver):
+    filter_range = stack_driver.device.handler
+
+    def refuse_range(command):
+        if filter_range(command) is not None:
+            return "% Invalid input detected"
+
+    stack_driver.device.handler = refuse_range
+    stack_driver.get_interfaces_counters()
+    commands = sent(stack_driver)
+    assert "show interfaces counters" in commands
+    assert "show interfaces counters errors" in commands
+
+    stack_driver.get_interfaces_counters()
+    commands = sent(stack_driver)
+    assert "show interfaces counters" in commands
+    assert "show interfaces counters Te1/0/1-24" not in commands
+    assert "show interfaces status Te1/0/1-24" in commands
@@ -0,0 +1,202 @@
+"""Tests for the LLDP topology crawler."""
+import threading
+
+import pytest
+
+from napalm_dellos6.dellos6 import DellOS6Driver
+from napalm_dellos6.dellos6_topology import Link, TopologyCrawler, chassis_key
+
+SYSTEM = """
+System Description: Dell Networking Switch
+System Up Time: 10 days, 08h:42m:44s
+System Contact:
+System Name: {name}
+System Location: LOC
+Burned In MAC Address: {mac}
+System Object ID: 1.3.6.1.4.1.674.10895.3042
+System Model ID: N4032
+Machine Type: Dell Networking N4032
+
+System Thermal Conditions:
+"""
+
+SUMMARY = """
+LLDP Remote Device Summary
+
+Local
+Interface RemID   Chassis ID          Port ID           System Name
+--------- ------- ------------------- ----------------- -----------------
+"""
+
+DETAIL = """
+LLDP Remote Device Detail
+
+Local Interface: {port}
+
+Remote Identifier: {rem_id}
+Chassis ID Subtype: MAC Address
+Chassis ID: {chassis_id}
+Port ID Subtype: Interface Name
+Port ID: {remote_port}
+System Name: {name}
+System Description:
+Port Description:
+System Capabilities Supported: {capab}
+System Capabilities Enabled: {capab}
+Time to Live: 106 seconds
+"""
+
+
+class Network(object):
+    """A set of switches wired by LLDP links, served as Dell OS6 outputs."""
+
+    def __init__(self):
+        self.macs = {}
+        self.links = {}
+        self.commands = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def add(self, name, number):
+        self.macs[name] = "F8B1.5695.{:04X}".format(number)
+        self.links[name] = {}
+
+    def connect(self, name, port, remote, remote_port):
+        self.links[name][port] = (remote, remote_port)
+        if remote in self.links:
+            self.links[remote][remote_port] = (name, port)
+
+    def chassis_id(self, name):
+        mac = self.macs.get(name, "0000.0000.{:04X}".format(len(name)))
+        return chassis_key(mac)
+
+    def output(self, name, command):
+        if command == "show system":
+            return SYSTEM.format(name=name, mac=self.macs[name])
+        if command == "show lldp remote-device all":
+            rows = [SUMMARY]
+            for port, (remote, remote_port) in sorted(self.links[name].items()):
+                rows.append(
+                    "{:<10}{:<8}{:<20}{:<18}{}\n".format(
+                        port,
+                        len(remote),
+                        self.chassis_id(remote),
+                        remote_port,
+                        remote if remote in self.macs else "",
+                    )
+                )
+            return "".join(rows)
+        port = command.split()[-1]
+        remote, remote_port = self.links[name][port]
+        switch = remote in self.macs
+        return DETAIL.format(
+            port=port,
+            rem_id=len(remote),
+            chassis_id=self.chassis_id(remote),
+            remote_port=remote_port,
+            name=remote if switch else "",
+            capab="bridge, router" if switch else "",
+        )
+
+
+class Switch(object):
+    def __init__(self, network, name):
+        self.network = network
+        self.name = name
+        with network.lock:
+            network.active += 1
+            network.max_active = max(network.max_active, network.active)
+
+    def set_base_prompt(self):
+        return "#"
+
+    def send_command(self, command, **kwargs):
+        with self.network.lock:
+            self.network.commands.append((self.name, command))
+        return self.network.output(self.name, command)
+
+    def disconnect(self):
+        with self.network.lock:
+            self.network.active -= 1
+
+
+def _crawler(network, max_workers=2):
+    def connect(host):
+        if host not in network.macs:
+            raise ValueError("Cannot connect to {}".format(host))
+        driver = DellOS6Driver(host, "vagrant", "vagrant")
+        driver.device = Switch(network, host)
+        return driver
+
+    return TopologyCrawler(connect, max_workers=max_workers)
+
+
+@pytest.fixture
+def network():
+    network = Network()
+    for number, name in enumerate(["core1", "core2", "acc1", "acc2", "acc3"]):
+        network.add(name, number)
+    network.connect("core1", "Te1/0/1", "core2", "Te1/0/1")
+    network.connect("core1", "Te1/0/2", "core2", "Te1/0/2")
+    for n, access in enumerate(["acc1", "acc2", "acc3"]):
+        port = "Te1/0/{}".format(10 + n)
+        network.connect("core1", port, access, "Gi1/0/49")
+        network.connect("core2", port, access, "Gi1/0/50")
+    network.connect("acc1", "Gi1/0/1", "server1", "eth0")
+    return network
+
+
+def test_crawl(network):
+    crawler = _crawler(network)
+    graph = crawler.crawl(["core1"])
+
+    assert sorted(node["host"] for node in graph.nodes.values()) == sorted(network.macs)
+    # Each switch is polled once although it is reported by two neighbors
+    polled = [name for name, command in network.commands if command == "show system"]
+    assert sorted(polled) == sorted(network.macs)
+    assert network.max_active <= 2
+    assert crawler.errors == {}
+
+    core1 = network.chassis_id("core1")
+    core2 = network.chassis_id("core2")
+    assert Link(core1, "Tengigabitethernet1/0/2", core2, "Te1/0/2") in graph.links
+    assert graph.neighbors(core1) == set(
+        network.chassis_id(name) for name in ["core2", "acc1", "acc2", "acc3"]
+    )
+    adjacency = graph.adjacency()
+    assert adjacency[network.chassis_id("server1")] == {network.chassis_id("acc1")}
+    assert len(graph.to_dict()["links"]) == len(graph.links) == 17
+
+
+def test_recrawl_changed(network):
+    crawler = _crawler(network)
+    crawler.crawl(["core1", "acc3"])
+    assert crawler.detail_polls == 5
+
+    del network.commands[:]
+    crawler.recrawl()
+    assert crawler.detail_polls == 5
+    assert not [c for _, c in network.commands if "detail" in c]
+
+    # acc4 is cabled to acc3: only acc3 is revisited in detail, and acc4 crawled
+    network.add("acc4", 10)
+    network.connect("acc3", "Gi1/0/1", "acc4", "Gi1/0/1")
+    del network.commands[:]
+    graph = crawler.recrawl()
+    assert crawler.detail_polls == 7
+    detailed = set(name for name, c in network.commands if "detail" in c)
+    assert detailed == {"acc3", "acc4"}
+    assert network.chassis_id("acc4") in graph.nodes
+
+    del network.links["acc3"]["Gi1/0/1"]
+    crawler.recrawl([network.chassis_id("acc3")])
+    assert network.chassis_id("acc4") not in graph.neighbors(network.chassis_id("acc3"))
+
+
+def test_crawl_errors(network):
+    crawler = _crawler(network)
+    network.connect("acc2", "Gi1/0/2", "ghost", "Gi1/0/2")
+    network.macs["ghost"] = "0000.0000.0042"
+    crawler.crawl(["core1"])
+    assert list(crawler.errors) == ["ghost"]
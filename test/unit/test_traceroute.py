@@ -0,0 +1,32 @@
+"""Tests for the streaming traceroute."""
+import pytest
+
+
+@pytest.fixture
+def driver(mocked_driver):
+    """Streams the mocked traceroute output in small chunks, like a slow device."""
+    driver = mocked_driver("test_traceroute")
+    driver.device.chunk_size = 7
+    driver.device.prompt = "switch1"
+    return driver
+
+
+def test_traceroute_stream(driver):
+    hops = list(driver._traceroute_stream("8.8.8.8"))
+
+    assert driver.device.written == ["traceroute 8.8.8.8 maxTtl 255\n"]
+    assert [hop_id for hop_id, _ in hops] == [1, 2, 3, 4, 5]
+    assert hops[3][1]["probes"][2]["ip_address"] == "*"
+    assert hops[4][1]["probes"][1] == {
+        "rtt": 12.0,
+        "ip_address": "8.8.8.8",
+        "host_name": "8.8.8.8",
+    }
+
+
+def test_traceroute_stream_cancel(driver):
+    stream = driver._traceroute_stream("8.8.8.8")
+    assert next(stream)[0] == 1
+    stream.close()
+
+    assert driver.device.written[-1] == "\x03"
@@ -0,0 +1,126 @@
+"""Tests for the VLAN membership index."""
+import json
+
+import pytest
+
+from napalm_dellos6.dellos6_parser import DellOS6Parser
+from napalm_dellos6.dellos6_vlans import VlanIndex, vlan_ids_list, vlan_list
+
+
+@pytest.fixture
+def vlans_driver(mocked_driver):
+    """
+    Return a factory of drivers serving "show vlan id <list>" from the rows of the
+    mocked "show vlan".
+    """
+
+    def vlans_driver():
+        driver = mocked_driver("test_get_vlans")
+        show_vlan = driver.device.read_output("show vlan")
+
+        def show_vlan_id(command):
+            if not command.startswith("show vlan id "):
+                return None
+            wanted = set(vlan_ids_list(command.split()[-1]))
+            lines = []
+            keep = True
+            for line in show_vlan.splitlines():
+                if line[:1].isdigit():
+                    keep = int(line.split()[0]) in wanted
+                if keep:
+                    lines.append(line)
+            return "\n".join(lines)
+
+        driver.device.handler = show_vlan_id
+        return driver
+
+    return vlans_driver
+
+
+def test_vlan_index(mocked_device):
+    device = mocked_device("test_get_vlans")
+    outputs = {
+        command: device.read_output(command)
+        for command in ("show vlan", "show interfaces status")
+    }
+    index = DellOS6Parser().vlan_index(outputs)
+    assert json.loads(json.dumps(index.to_dict())) == device.expected_result
+
+    assert index.name(666) == "TEST"
+    assert index.ports(666) == ["port-channel50"]
+    assert index.is_member(699, "Te1/0/12")
+    assert index.is_member(699, "Tengigabitethernet1/0/12")
+    assert not index.is_member(699, "Te1/0/14")
+    # Po50 is not in the Po1-49 and Po51-128 ranges of VLAN 1
+    assert index.vlans("port-channel50") == index.vlans("Po50")
+    assert index.vlans("Po50") == [666, 699, 707, 710, 3840, 4002]
+    assert index.vlan_bitmap("Te1/0/3") == 1 << 1
+    with pytest.raises(KeyError):
+        index.vlans("Te9/0/1")
+
+
+def test_unknown_ports():
+    index = VlanIndex(["Po2", "Te1/0/1", "Te1/0/2"])
+    index.add("10", "ten", ["Po1-4,", "Te1/0/2-9"])
+    index.add(20, "twenty", [])
+    assert index.ports(10) == ["port-channel2", "Tengigabitethernet1/0/2"]
+    assert index.port_bitmap(10) == 0b101
+    assert index.ports(20) == []
+    assert index.vlans("Te1/0/1") == []
+    assert list(index) == [10, 20]
+
+
+def test_unordered_ports():
+    index = VlanIndex(["Te1/0/2", "Po1", "Te1/0/1", "Te1/0/3", "Te1/0/4"])
+    index.add(10, "ten", ["Te1/0/1-3"])
+    index.add(20, "twenty", ["Po1,Te1/0/2"])
+    index.add(30, "thirty", ["Te1/0/1-2"])
+    index.add(40, "forty", ["Te1/0/2-4"])
+    assert index.port_bitmap(10) == 0b01101
+    assert index.port_bitmap(30) == 0b00101
+    assert index.port_bitmap(40) == 0b11001
+    assert index.vlans("Te1/0/2") == [10, 20, 30, 40]
+    assert index.vlans("Te1/0/3") == [10, 40]
+
+
+def test_vlan_list():
+    assert vlan_list([30, 10, 11, "12-14", range(20, 22)]) == "10-14,20-21,30"
+    assert vlan_list("5, 7-8") == "5,7-8"
+    assert vlan_ids_list(4094) == [4094]
+    for vlan_ids in ([], "10-", [0], [4095]):
+        with pytest.raises(ValueError):
+            vlan_list(vlan_ids)
+
+
+def test_get_vlans_ids(vlans_driver):
+    driver = vlans_driver()
+    vlans = driver._get_vlans(vlan_ids=[666, "699"])
+    assert driver.device.commands == ["show vlan id 666,699", "show interfaces status"]
+    assert vlans == {
+        666: {"name": "TEST", "interfaces": ["port-channel50"]},
+        699: {
+            "name": "Management1",
+            "interfaces": [
+                "port-channel50",
+                "Tengigabitethernet1/0/12",
+                "Tengigabitethernet1/0/13",
+                "Tengigabitethernet2/0/12",
+                "Tengigabitethernet2/0/13",
+            ],
+        },
+    }
+
+
+def test_get_vlans_unvalidated(vlans_driver):
+    driver = vlans_driver()
+    vlans = driver._get_vlans(vlan_ids=range(1, 700), validate_interfaces=False)
+    assert driver.device.commands == ["show vlan id 1-699"]
+    assert sorted(vlans) == [1, 666, 699]
+    # Without "show interfaces status", all the port-channels of the ranges are kept
+    assert vlans[1]["interfaces"][:2] == ["port-channel1", "port-channel2"]
+    assert len(vlans[1]["interfaces"]) == 127 + 38
+    assert vlans[666]["interfaces"] == ["port-channel1", "port-channel50"]
+
+    driver = vlans_driver()
+    assert driver._get_vlans(validate_interfaces=False)[666] == vlans[666]
+    assert driver.device.commands == ["show vlan"]